@@ -1,9 +1,42 @@
+from itertools import repeat
+from math import fma
+from operator import add, mul
 from Vector import Vector
 
+def _all_int(values):
+    return all(type(x) is int for x in values)
+
 def linear_combination(vectors, scalars):
-    result = Vector([0] * vectors[0].size())
+    """
+    Compute the linear combination of Vectors with given scalars in a single sweep.
+
+    Every term is accumulated with fma straight into one output buffer, so no scaled
+    or partial Vector is built per term. Both arguments may be any iterables
+    (e.g. generators); they are consumed once, pairwise. While every input is an int
+    the sum is accumulated exactly instead, so integer inputs give integer results.
+
+    Args:
+        vectors (iterable): Vector instances of the same size.
+        scalars (iterable): Scalars corresponding to each vector.
+    Returns:
+        Vector: A new Vector holding the sum of scalar * vector.
+    Raises:
+        ValueError: If no vector is given or if sizes differ.
+    """
+    pairs = zip(vectors, scalars)
+    first = next(pairs, None)
+    if first is None:
+        raise ValueError("At least one vector and scalar are required.")
+    vec, scalar = first
+    result = [scalar * x for x in vec.data]
+    exact = type(scalar) is int and _all_int(vec.data)
 
-    for vec, scalar in zip(vectors, scalars):
-        scaled = vec.scl(scalar)
-        result = result + scaled
-    return result
\ No newline at end of file
+    for vec, scalar in pairs:
+        if len(vec.data) != len(result):
+            raise ValueError("All vectors must have the same size.")
+        exact = exact and type(scalar) is int and _all_int(vec.data)
+        if exact:
+            result[:] = map(add, map(mul, vec.data, repeat(scalar)), result)
+        else:
+            result[:] = map(fma, vec.data, repeat(scalar), result)
+    return Vector(result)
@@ -1,29 +1,72 @@
+from itertools import repeat
+from math import fma
+from operator import add, mul
 from Vector import Vector
 from Matrix import Matrix
 
+def _all_int(values):
+    return all(type(x) is int for x in values)
+
+def _accumulate(acc, values, scalar, exact):
+    """
+    acc += scalar * values in place: exactly while everything is int, with fma otherwise.
+    """
+    if exact:
+        acc[:] = map(add, map(mul, values, repeat(scalar)), acc)
+    else:
+        acc[:] = map(fma, values, repeat(scalar), acc)
+
 def linear_combination(objects, scalars):
     """
-    Compute the linear combination of a list of Vectors or Matrices with given scalars.
+    Compute the linear combination of Vectors or Matrices with given scalars.
+
+    Vectors and Matrices are combined in a single sweep: every term is accumulated
+    with fma straight into one output buffer, so no scaled or partial object is built
+    per term. Both arguments may be any iterables (e.g. generators); they are consumed
+    once, pairwise. While every input is an int the sum is accumulated exactly instead,
+    so integer inputs give integer results.
 
     Args:
-        objects (list): A list of Vector or Matrix instances.
-        scalars (list): A list of scalars corresponding to each object.
+        objects (iterable): Vector or Matrix instances of the same shape.
+        scalars (iterable): Scalars corresponding to each object.
     Returns:
         Vector or Matrix: A new instance representing the linear combination.
+    Raises:
+        ValueError: If no object is given or if shapes differ.
     """
-    first = objects[0]
+    pairs = zip(objects, scalars)
+    head = next(pairs, None)
+    if head is None:
+        raise ValueError("At least one object and scalar are required.")
+    first, scalar = head
+
     if isinstance(first, Vector):
-        result = Vector([0] * first.size())
-    elif isinstance(first, Matrix):
-        rows, cols = first.shape()
-        row_major = [[0 for _ in range(cols)] for _ in range(rows)]
-        result = Matrix(row_major)
-    else:
-        result = first.scl(0)
-    
-    for obj, scalar in zip(objects, scalars):
-        scaled = obj.scl(scalar)
-        result = result + scaled
+        result = [scalar * x for x in first.data]
+        exact = type(scalar) is int and _all_int(first.data)
+        for obj, scalar in pairs:
+            if len(obj.data) != len(result):
+                raise ValueError("All vectors must have the same size.")
+            exact = exact and type(scalar) is int and _all_int(obj.data)
+            _accumulate(result, obj.data, scalar, exact)
+        return Vector(result)
+
+    if isinstance(first, Matrix):
+        # Relies on ex02's Matrix layout: .data is a plain list of column lists
+        # (column-major), read directly here and rebuilt with from_columns.
+        assert isinstance(first.data, list), "expected ex02's list-of-columns Matrix.data"
+        result = [[scalar * x for x in col] for col in first.data]
+        exact = type(scalar) is int and all(_all_int(col) for col in first.data)
+        for obj, scalar in pairs:
+            if obj.shape() != first.shape():
+                raise ValueError("All matrices must have the same shape.")
+            exact = exact and type(scalar) is int and all(_all_int(col) for col in obj.data)
+            for acc, col in zip(result, obj.data):
+                _accumulate(acc, col, scalar, exact)
+        return Matrix.from_columns(result)
+
+    result = first.scl(scalar)
+    for obj, scalar in pairs:
+        result = result + obj.scl(scalar)
     return result
 
 def lerp(u, v, t):
@@ -44,4 +87,42 @@ def lerp(u, v, t):
     if hasattr(u, 'scl') and hasattr(u, '__add__'):
         return linear_combination([u, v], [1-t, t])
     else:
-        return (1-t) * u + t * v
\ No newline at end of file
+        return (1-t) * u + t * v
+
+def lerp_many(u, v, ts):
+    """
+    Lazily interpolate between two Vectors, Matrices or scalars for many factors.
+
+    The difference v - u is computed once; each step is then a single fma sweep
+    u + t * (v - u) into a fresh buffer, with t == 1 yielding v exactly.
+
+    Args:
+        u (Vector, Matrix or float): The starting object.
+        v (Vector, Matrix or float): The ending object, of the same shape as u.
+        ts (iterable): Interpolation factors (0 <= t <= 1); may be a generator.
+    Yields:
+        Vector, Matrix or float: The interpolated object for each t, in order.
+    Raises:
+        ValueError: If u and v have different shapes or a t is not in the range [0, 1].
+    """
+    if isinstance(u, Vector):
+        if not isinstance(v, Vector) or u.size() != v.size():
+            raise ValueError("Vectors must have the same size.")
+        start = u.data
+        delta = [b - a for a, b in zip(u.data, v.data)]
+        build = lambda t: Vector(list(map(fma, delta, repeat(t), start)))
+    elif isinstance(u, Matrix):
+        if not isinstance(v, Matrix) or u.shape() != v.shape():
+            raise ValueError("Matrices must have the same shape.")
+        start = u.data
+        delta = [[b - a for a, b in zip(cu, cv)] for cu, cv in zip(u.data, v.data)]
+        build = lambda t: Matrix.from_columns(
+            [list(map(fma, d, repeat(t), s)) for d, s in zip(delta, start)])
+    else:
+        delta = v - u
+        build = lambda t: fma(t, delta, u)
+
+    for t in ts:
+        if not (0 <= t <= 1):
+            raise ValueError("Interpolation factor t must be in the range [0, 1].")
+        yield build(t) if t != 1 else (v.scl(1) if hasattr(v, 'scl') else v)
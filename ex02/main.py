@@ -1,4 +1,4 @@
-from linear_operations import lerp
+from linear_operations import lerp, lerp_many
 from Vector import Vector
 from Matrix import Matrix
 
@@ -70,4 +70,28 @@ def test_lerp():
     else:
         print(f"Result: {Colors.RED}{result} (Incorrect){Colors.END}\n")
 
-test_lerp()
\ No newline at end of file
+def test_lerp_many():
+    print(f"\n{Colors.HEADER}--- LERP MANY TESTS ---{Colors.END}\n")
+    ts = [0, 0.25, 0.5, 1]
+    cases = [
+        ("Scalars", 21, 42),
+        ("Vectors", Vector([2, 1]), Vector([4, 2])),
+        ("Matrices", Matrix([[2, 1], [3, 4]]), Matrix([[20, 10], [30, 40]])),
+    ]
+    for label, u, v in cases:
+        print(f"{Colors.TEST}Testing lerp_many with {label} against lerp for t in {ts}{Colors.END}", end="\n---\n")
+        expected = [lerp(u, v, t) for t in ts]
+        result = list(lerp_many(u, v, iter(ts)))
+        if label == "Scalars":
+            correct = all(abs(a - b) < 1e-9 for a, b in zip(result, expected))
+        else:
+            correct = result == expected
+        shown = lambda items: " | ".join(str(x).replace("\n", " ") for x in items)
+        print(f"lerp_many expected: {Colors.EXPECTED}{shown(expected)}{Colors.END}")
+        if correct and len(result) == len(expected):
+            print(f"Result: {Colors.CORRECT}{shown(result)} (Correct){Colors.END}\n")
+        else:
+            print(f"Result: {Colors.RED}{shown(result)} (Incorrect){Colors.END}\n")
+
+test_lerp()
+test_lerp_many()
@@ -1,3 +1,8 @@
+import heapq
+from array import array
+from itertools import chain, islice, repeat
+from math import fma, sqrt, sumprod
+from operator import mul, truediv
 from Vector import Vector
 
 def angle_cos(u, v) -> float:
@@ -14,4 +19,206 @@ def angle_cos(u, v) -> float:
     """
     if not isinstance(u, Vector) or not isinstance(v, Vector):
         raise ValueError("Both arguments must be Vector instances.")
-    return u.dot(v) / (u.norm() * v.norm())
\ No newline at end of file
+    return u.dot(v) / (u.norm() * v.norm())
+
+def _packed_dots(us, vs, dim):
+    """
+    Dot products of matching vectors in two packed buffers, one fma sweep per component.
+    """
+    acc = list(map(mul, us[0::dim], vs[0::dim]))
+    for k in range(1, dim):
+        acc = list(map(fma, us[k::dim], vs[k::dim], acc))
+    return acc
+
+def _check_packed(buf, dim, count=None):
+    """
+    Validate a packed buffer of vectors of size dim and return the vector count.
+    """
+    if dim <= 0 or len(buf) % dim:
+        raise ValueError(f"Buffer length {len(buf)} is not a multiple of the vector size {dim}")
+    if count is not None and len(buf) // dim != count:
+        raise ValueError("Buffers must hold the same number of vectors.")
+    return len(buf) // dim
+
+def packed_norms(buf, dim=3):
+    """
+    Euclidean norms of every vector in a packed buffer.
+
+    The result can be passed back to angle_cos_many so vectors shared by many angle
+    computations (e.g. mesh edges) have their norms computed only once.
+
+    Args:
+        buf (sequence): Flat array('d'), list or memoryview of N vectors of size dim, back to back.
+        dim (int): Size of each vector.
+    Returns:
+        array: array('d') of the N norms.
+    Raises:
+        ValueError: If the buffer length is not a multiple of dim.
+    """
+    _check_packed(buf, dim)
+    return array('d', map(sqrt, _packed_dots(buf, buf, dim)))
+
+def angle_cos_many(us, vs, dim=3, u_norms=None, v_norms=None, out=None):
+    """
+    Compute the cosine of the angle between every matching pair of vectors in two packed buffers.
+
+    Args:
+        us (sequence): Flat array('d'), list or memoryview of N vectors of size dim, back to back.
+        vs (sequence): Same layout as us.
+        dim (int): Size of each vector.
+        u_norms (sequence): Optional precomputed norms of us (see packed_norms).
+        v_norms (sequence): Optional precomputed norms of vs.
+        out (array): Optional array('d') of N values to write the results into.
+    Returns:
+        array: array('d') of the N cosines (out itself when given).
+    Raises:
+        ValueError: If the buffer sizes do not match or a vector is zero-length.
+    """
+    count = _check_packed(us, dim)
+    _check_packed(vs, dim, count)
+    if u_norms is None:
+        u_norms = packed_norms(us, dim)
+    if v_norms is None:
+        v_norms = packed_norms(vs, dim)
+    if len(u_norms) != count or len(v_norms) != count:
+        raise ValueError("Norm buffers must hold one value per vector.")
+    if out is None:
+        out = array('d', bytes(8 * count))
+    elif len(out) != count:
+        raise ValueError(f"Output buffer must hold {count} values, got {len(out)}")
+
+    denominators = list(map(mul, u_norms, v_norms))
+    if not all(denominators):
+        raise ValueError("Cannot compute the angle with a zero-length vector.")
+    out[:] = array('d', map(truediv, _packed_dots(us, vs, dim), denominators))
+    return out
+
+
+BLOCK_SIZE = 256 # query rows per block of the cosine matrix
+
+class SimilarityIndex:
+    """
+    Cosine-similarity search over a fixed set of vectors.
+
+    Every vector is normalized once when the index is built, so each cosine is a
+    single dot product of unit vectors (math.sumprod) with no per-pair norms.
+    Results are produced per query or per block of queries, so memory stays bounded
+    by the block size rather than by the n x n matrix.
+    """
+
+    def __init__(self, vectors):
+        """
+        Build the index.
+
+        Args:
+            vectors (iterable): Vectors (or number sequences) of the same size.
+        Raises:
+            ValueError: If there are no vectors, sizes differ or a vector is zero-length.
+        """
+        self.units = [self._unit(v) for v in vectors]
+        if not self.units:
+            raise ValueError("At least one vector is required.")
+        self.dim = len(self.units[0])
+        if any(len(u) != self.dim for u in self.units):
+            raise ValueError("All vectors must have the same size.")
+
+    @staticmethod
+    def _unit(v):
+        """
+        Return v scaled to unit length as a list.
+        """
+        data = list(map(float, v.data if isinstance(v, Vector) else v))
+        n = sqrt(sumprod(data, data))
+        if not n:
+            raise ValueError("Cannot compute the angle with a zero-length vector.")
+        return [x / n for x in data]
+
+    def __len__(self):
+        return len(self.units)
+
+    def similarities(self, query):
+        """
+        Cosines between a query and every indexed vector.
+
+        Args:
+            query (Vector or sequence): The query vector.
+        Returns:
+            list: One cosine per indexed vector, in index order.
+        Raises:
+            ValueError: If the query has the wrong size or is zero-length.
+        """
+        q = self._unit(query)
+        if len(q) != self.dim:
+            raise ValueError(f"Query has size {len(q)}, expected {self.dim}")
+        return list(map(sumprod, self.units, repeat(q)))
+
+    def blocks(self, queries=None, block_size=BLOCK_SIZE):
+        """
+        Lazily compute the cosine matrix between queries and the index, a block of rows at a time.
+
+        Args:
+            queries (iterable): Query vectors; defaults to the indexed vectors themselves.
+            block_size (int): Number of query rows per block.
+        Yields:
+            tuple: (start, rows) where rows[i][j] is the cosine of query start + i with vector j.
+        """
+        if queries is None:
+            queries = self.units
+        queries = iter(queries)
+        start = 0
+        while True:
+            rows = [self.similarities(q) for q in islice(queries, block_size)]
+            if not rows:
+                return
+            yield start, rows
+            start += len(rows)
+
+    def matrix(self):
+        """
+        Full n x n cosine matrix of the indexed vectors (for small indexes).
+
+        Returns:
+            list: n rows of n cosines.
+        """
+        return [row for _, rows in self.blocks() for row in rows]
+
+    def top_k(self, query, k):
+        """
+        The k indexed vectors most similar to a query.
+
+        Args:
+            query (Vector or sequence): The query vector.
+            k (int): Number of results.
+        Returns:
+            list: Up to k (cosine, index) pairs, most similar first.
+        """
+        return self._best(self.similarities(query), range(len(self.units)), k)
+
+    @staticmethod
+    def _best(scores, candidates, k):
+        """
+        The k highest (score, index) pairs among the candidate indices.
+        """
+        best = heapq.nlargest(k, candidates, key=scores.__getitem__)
+        return [(scores[j], j) for j in best]
+
+    def top_k_many(self, queries=None, k=1, exclude_self=None):
+        """
+        Lazily run top_k for many queries, keeping only k results per query in memory.
+
+        Args:
+            queries (iterable): Query vectors; defaults to the indexed vectors themselves.
+            k (int): Number of results per query.
+            exclude_self (bool): Skip index i for query i (default: True when querying the
+                index against itself).
+        Yields:
+            list: Up to k (cosine, index) pairs per query, most similar first.
+        """
+        if exclude_self is None:
+            exclude_self = queries is None
+        if queries is None:
+            queries = self.units
+        n = len(self.units)
+        for i, q in enumerate(queries):
+            candidates = chain(range(i), range(i + 1, n)) if exclude_self else range(n)
+            yield self._best(self.similarities(q), candidates, k)
@@ -1,5 +1,5 @@
 from Vector import Vector
-from angles import angle_cos
+from angles import SimilarityIndex, angle_cos, angle_cos_many, packed_norms
 
 class Colors:
     RED = '\033[91m'
@@ -61,4 +61,48 @@ def test_cos():
     result = angle_cos(v1, v2)
     print_comparison("Cosine", expected, result)
 
-test_cos()
\ No newline at end of file
+def test_cos_many():
+    print(f"\n{Colors.HEADER}--- BATCHED COSINE ANGLE TEST ---{Colors.END}\n")
+
+    pairs = [([1, 0, 0], [1, 0, 0]), ([1, 0, 0], [0, 1, 0]), ([-1, 1, 0], [1, -1, 0]),
+             ([2, 1, 0], [4, 2, 0]), ([1, 2, 3], [4, 5, 6])]
+    us = [x for u, _ in pairs for x in u]
+    vs = [x for _, v in pairs for x in v]
+    expected = [angle_cos(Vector(u), Vector(v)) for u, v in pairs]
+
+    print(f"{Colors.TEST}Testing angle_cos_many against angle_cos for {len(pairs)} packed 3D pairs {Colors.END}", end="\n---\n")
+    result = angle_cos_many(us, vs)
+    print_comparison("Max difference", 0.0, max(abs(a - b) for a, b in zip(result, expected)))
+
+    print(f"{Colors.TEST}Testing angle_cos_many with precomputed norms {Colors.END}", end="\n---\n")
+    result = angle_cos_many(us, vs, u_norms=packed_norms(us), v_norms=packed_norms(vs))
+    print_comparison("Max difference", 0.0, max(abs(a - b) for a, b in zip(result, expected)))
+
+def test_top_k():
+    print(f"\n{Colors.HEADER}--- SIMILARITY INDEX TEST ---{Colors.END}\n")
+
+    vectors = [[1, 0, 0], [1, 2, 0], [3, 1, 1], [-1, 2, 5], [2, 3, 4], [0, 1, -2], [4, -1, 2]]
+    index = SimilarityIndex([Vector(v) for v in vectors])
+
+    def ranking(query, candidates):
+        scores = [(angle_cos(Vector(query), Vector(vectors[j])), j) for j in candidates]
+        return sorted(scores, reverse=True)
+
+    query = [2, 1, 0]
+    expected = ranking(query, range(len(vectors)))[:3]
+    result = index.top_k(Vector(query), 3)
+    print(f"{Colors.TEST}Testing top_k(3) for {query} against sorting every angle_cos {Colors.END}", end="\n---\n")
+    print_comparison("Mismatched indices", 0, sum(e[1] != r[1] for e, r in zip(expected, result)) + abs(len(expected) - len(result)))
+    print_comparison("Max difference", 0.0, max(abs(e[0] - r[0]) for e, r in zip(expected, result)))
+
+    print(f"{Colors.TEST}Testing top_k_many(2) of the index against itself, skipping each vector's own entry {Colors.END}", end="\n---\n")
+    mismatches = 0
+    for i, result in enumerate(index.top_k_many(k=2)):
+        expected = ranking(vectors[i], [j for j in range(len(vectors)) if j != i])[:2]
+        mismatches += sum(e[1] != r[1] or abs(e[0] - r[0]) >= 1e-9 for e, r in zip(expected, result))
+        mismatches += abs(len(expected) - len(result))
+    print_comparison("Mismatched results", 0, mismatches)
+
+test_cos()
+test_cos_many()
+test_top_k()
@@ -1,5 +1,7 @@
-from Vector import Vector
+from array import array
 from math import fma
+from operator import mul, neg
+from Vector import Vector
 
 def cross_product(u, v):
     """
@@ -18,4 +20,34 @@ def cross_product(u, v):
     x = fma(u.data[1], v.data[2], -u.data[2] * v.data[1])
     y = fma(u.data[2], v.data[0], -u.data[0] * v.data[2])
     z = fma(u.data[0], v.data[1], -u.data[1] * v.data[0])
-    return Vector([x, y, z])
\ No newline at end of file
+    return Vector([x, y, z])
+
+def cross_product_many(us, vs, out=None):
+    """
+    Compute the cross products of every matching pair of 3D vectors in two packed buffers.
+
+    Each output component is one fma sweep over strided component slices
+    (e.g. all face normals of a mesh from its packed edge vectors).
+
+    Args:
+        us (sequence): Flat array('d'), list or memoryview of N 3D vectors (x, y, z back to back).
+        vs (sequence): Same layout as us.
+        out (array): Optional array('d') of 3N values to write the results into.
+    Returns:
+        array: array('d') of the N cross products, packed the same way (out itself when given).
+    Raises:
+        ValueError: If the buffer lengths differ or are not multiples of 3.
+    """
+    if len(us) % 3 or len(us) != len(vs):
+        raise ValueError("Both buffers must hold the same number of 3D vectors.")
+    if out is None:
+        out = array('d', bytes(8 * len(us)))
+    elif len(out) != len(us):
+        raise ValueError(f"Output buffer must hold {len(us)} values, got {len(out)}")
+
+    ux, uy, uz = us[0::3], us[1::3], us[2::3]
+    vx, vy, vz = vs[0::3], vs[1::3], vs[2::3]
+    out[0::3] = array('d', map(fma, uy, vz, map(neg, map(mul, uz, vy))))
+    out[1::3] = array('d', map(fma, uz, vx, map(neg, map(mul, ux, vz))))
+    out[2::3] = array('d', map(fma, ux, vy, map(neg, map(mul, uy, vx))))
+    return out
@@ -1,5 +1,5 @@
 from Vector import Vector
-from cross_product import cross_product
+from cross_product import cross_product, cross_product_many
 
 class Colors:
     RED = '\033[91m'
@@ -50,4 +50,17 @@ def test_cross_product():
     result = cross_product(v1, v2)
     print_comparison("Cross Product", expected, result)
 
-test_cross_product()
\ No newline at end of file
+def test_cross_product_many():
+    print(f"\n{Colors.HEADER}--- BATCHED CROSS PRODUCT TEST ---{Colors.END}\n")
+
+    pairs = [([0, 0, 1], [1, 0, 0]), ([1, 2, 3], [4, 5, 6]), ([4, 2, -3], [-2, -5, 16])]
+    us = [x for u, _ in pairs for x in u]
+    vs = [x for _, v in pairs for x in v]
+    result = cross_product_many(us, vs)
+    for k, (u, v) in enumerate(pairs):
+        print(f"{Colors.TEST}Testing cross_product_many pair {k} against cross_product for {u} and {v} {Colors.END}", end="\n---\n")
+        expected = cross_product(Vector(u), Vector(v))
+        print_comparison("Cross Product", expected, Vector(list(result[3 * k:3 * k + 3])))
+
+test_cross_product()
+test_cross_product_many()
@@ -0,0 +1,144 @@
+from array import array
+from math import inf, log, sumprod
+from Matrix import Matrix
+from Vector import Vector
+
+class LU:
+	"""
+	Reusable LU factorization P·A = L·U of a square Matrix (partial pivoting).
+
+	Factorizing costs O(n^3) once; every solve afterwards is an O(n^2) pair of
+	triangular substitutions, so one factorization can serve many right-hand sides.
+	Usually obtained through Matrix.lu().
+	"""
+
+	def __init__(self, matrix):
+		"""
+		Factorize a square matrix.
+
+		Args:
+			matrix (Matrix): The system matrix A.
+		Raises:
+			ValueError: If the argument is not a square Matrix.
+		"""
+		if not isinstance(matrix, Matrix):
+			raise ValueError("Argument must be a Matrix.")
+		if not matrix.is_square():
+			raise ValueError("LU factorization is only defined for square matrices.")
+
+		LU_rows, self.perm, self.parity = matrix._lu_factor()
+		self.n = len(LU_rows)
+		# Split once so solves only slice the right-hand side
+		self._lower = [row[:i] for i, row in enumerate(LU_rows)]
+		self._upper = [row[i + 1:] for i, row in enumerate(LU_rows)]
+		self._diag = [row[i] for i, row in enumerate(LU_rows)]
+
+	def is_singular(self):
+		"""
+		Check whether the factorized matrix is singular: a zero on U's diagonal.
+
+		Matrix._lu_factor zeroes a column whose pivot candidates are only rounding residue
+		relative to the matrix scale, so the test is scale-invariant: 1e-10 * I is regular.
+
+		Returns:
+			bool: True if A is singular, False otherwise.
+		"""
+		return any(d == 0 for d in self._diag)
+
+	def _solve_list(self, b):
+		"""
+		Solve A·x = b for a right-hand side given as a list; returns x as a list.
+		"""
+		if self.is_singular():
+			raise ValueError("Matrix is singular; the system has no unique solution.")
+		n = self.n
+		# forward substitution L·y = P·b (L has a unit diagonal)
+		y = [b[p] for p in self.perm]
+		for i in range(1, n):
+			y[i] -= sumprod(self._lower[i], y[:i])
+		# back substitution U·x = y
+		x = [0.0] * n
+		for i in range(n - 1, -1, -1):
+			x[i] = (y[i] - sumprod(self._upper[i], x[i + 1:])) / self._diag[i]
+		return x
+
+	def solve(self, vector):
+		"""
+		Solve A·x = b.
+
+		Args:
+			vector (Vector): The right-hand side b (size n).
+		Returns:
+			Vector: The solution x.
+		Raises:
+			ValueError: If b is not a Vector of size n or if A is singular.
+		"""
+		if not isinstance(vector, Vector):
+			raise ValueError("The operand must be a Vector.")
+		if vector.size() != self.n:
+			raise ValueError(f"Incompatible dimensions: matrix is {self.n}x{self.n}, vector has size {vector.size()}")
+		return Vector._wrap(self._solve_list(vector.data))
+
+	def solve_many(self, mat):
+		"""
+		Solve A·X = B for every column of B at once.
+
+		Args:
+			mat (Matrix): The right-hand sides B (n×p), one per column.
+		Returns:
+			Matrix: The solutions X (n×p).
+		Raises:
+			ValueError: If B is not a Matrix with n rows or if A is singular.
+		"""
+		if not isinstance(mat, Matrix):
+			raise ValueError("Argument must be a Matrix.")
+		rows, cols = mat.shape()
+		if rows != self.n:
+			raise ValueError(f"Incompatible dimensions: matrix is {self.n}x{self.n}, right-hand side is {rows}x{cols}")
+		buf = array('d')
+		for j in range(cols):
+			buf.extend(self._solve_list(mat._col(j).tolist()))
+		return Matrix._wrap(buf, rows, cols)
+
+	def determinant(self):
+		"""
+		Determinant of A from the factorization (product of U's diagonal, signed by the permutation).
+
+		Returns:
+			float: The determinant of A (0.0 if A is singular).
+		"""
+		if self.is_singular():
+			return 0.0
+		det = self.parity
+		for d in self._diag:
+			det *= d
+		return det
+
+	def slogdet(self):
+		"""
+		Sign and natural log of the absolute determinant of A.
+
+		Returns:
+			tuple: (sign, logabsdet); (0.0, -inf) if A is singular.
+		"""
+		sign, logabsdet = self.parity, 0.0
+		if self.is_singular():
+			return 0.0, -inf
+		for d in self._diag:
+			if d < 0:
+				sign = -sign
+			logabsdet += log(-d if d < 0 else d)
+		return sign, logabsdet
+
+	def inverse(self):
+		"""
+		Inverse of A, obtained by solving against the identity.
+
+		Returns:
+			Matrix: A^(-1).
+		Raises:
+			ValueError: If A is singular.
+		"""
+		if self.is_singular():
+			raise ValueError("Matrix is singular and cannot be inverted.")
+		return self.solve_many(Matrix.identity(self.n))
@@ -1,14 +1,224 @@
-from math import fma
+from array import array
+from itertools import repeat
+from math import fma, inf, isfinite, log, sumprod
+from sys import float_info
+from operator import add, mul, sub
+import backend
+import lazy
+import parallel
+from Vector import Vector
 
 def my_abs(x):
 	return x if x >= 0 else -x
 
+def _blk_add(X, Y):
+	return [list(map(add, x, y)) for x, y in zip(X, Y)]
+
+def _blk_sub(X, Y):
+	return [list(map(sub, x, y)) for x, y in zip(X, Y)]
+
+def _strassen(A, B, leaf):
+	"""
+	Strassen-Winograd product of two n x n matrices given as lists of row lists.
+
+	Algorithm:
+	- At or below `leaf`, multiply classically (row · column dot products).
+	- Odd sizes are padded with a zero row and column, then trimmed.
+	- Otherwise split into quadrants and combine 7 half-size products with 15 block
+	  additions (Winograd's variant of Strassen).
+	Returns:
+		list: C = A·B as a list of row lists.
+	"""
+	n = len(A)
+	if n <= leaf:
+		b_cols = [list(col) for col in zip(*B)]
+		return [[sumprod(a_row, b_col) for b_col in b_cols] for a_row in A]
+	if n % 2:
+		A = [row + [0.0] for row in A] + [[0.0] * (n + 1)]
+		B = [row + [0.0] for row in B] + [[0.0] * (n + 1)]
+		return [row[:n] for row in _strassen(A, B, leaf)[:n]]
+
+	h = n // 2
+	A11 = [row[:h] for row in A[:h]]
+	A12 = [row[h:] for row in A[:h]]
+	A21 = [row[:h] for row in A[h:]]
+	A22 = [row[h:] for row in A[h:]]
+	B11 = [row[:h] for row in B[:h]]
+	B12 = [row[h:] for row in B[:h]]
+	B21 = [row[:h] for row in B[h:]]
+	B22 = [row[h:] for row in B[h:]]
+
+	S1 = _blk_add(A21, A22)
+	S2 = _blk_sub(S1, A11)
+	S3 = _blk_sub(A11, A21)
+	S4 = _blk_sub(A12, S2)
+	T1 = _blk_sub(B12, B11)
+	T2 = _blk_sub(B22, T1)
+	T3 = _blk_sub(B22, B12)
+	T4 = _blk_sub(T2, B21)
+
+	M1 = _strassen(A11, B11, leaf)
+	M2 = _strassen(A12, B21, leaf)
+	M3 = _strassen(S4, B22, leaf)
+	M4 = _strassen(A22, T4, leaf)
+	M5 = _strassen(S1, T1, leaf)
+	M6 = _strassen(S2, T2, leaf)
+	M7 = _strassen(S3, T3, leaf)
+
+	U2 = _blk_add(M1, M6)
+	U3 = _blk_add(U2, M7)
+	C11 = _blk_add(M1, M2)
+	C12 = _blk_add(_blk_add(U2, M5), M3)
+	C21 = _blk_sub(U3, M4)
+	C22 = _blk_add(U3, M5)
+	return [l + r for l, r in zip(C11, C12)] + [l + r for l, r in zip(C21, C22)]
+
+def _gauss_jordan(R, pivot_cols, tol):
+	"""
+	Gauss-Jordan elimination in place on a row-major working buffer (list of row lists).
+
+	Every step is a whole-row operation on one contiguous list: swap two list references,
+	scale the pivot row, then subtract a multiple of it from each other row with fma.
+	Only the first `pivot_cols` columns are searched for pivots; the rest of each row
+	(e.g. an augmented identity block) is carried along.
+	Args:
+		R (list): The rows; modified in place.
+		pivot_cols (int): Number of leading columns that may hold pivots.
+		tol (float): Magnitude at or under which entries are treated as zero.
+	Returns:
+		int: The number of pivots found.
+	"""
+	rows = len(R)
+	pivot_row = 0
+	for col in range(pivot_cols):
+		if pivot_row == rows:
+			break
+		pivot, max_val = None, tol
+		for r in range(pivot_row, rows):
+			val = my_abs(R[r][col])
+			if val > max_val:
+				pivot, max_val = r, val
+		if pivot is None:
+			continue # no pivot in this column
+		R[pivot_row], R[pivot] = R[pivot], R[pivot_row]
+		prow = R[pivot_row]
+		scale = 1.0 / prow[col]
+		prow[:] = [x * scale for x in prow]
+		for r in range(rows):
+			if r == pivot_row:
+				continue
+			row = R[r]
+			factor = row[col]
+			if my_abs(factor) > tol:
+				row[:] = map(fma, prow, repeat(-factor), row)
+		pivot_row += 1
+	return pivot_row
+
+class _Column:
+	"""
+	Live view of one matrix column: reads and writes go to the matrix storage.
+	"""
+	__slots__ = ('_matrix', '_j')
+
+	def __init__(self, matrix, j):
+		self._matrix = matrix
+		self._j = j
+
+	def __len__(self):
+		return self._matrix._rows
+
+	def _index(self, i):
+		n = self._matrix._rows
+		if i < 0:
+			i += n
+		if not (0 <= i < n):
+			raise IndexError("Column index out of range")
+		return i
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			return [self._matrix[k, self._j] for k in range(*i.indices(len(self)))]
+		return self._matrix[self._index(i), self._j]
+
+	def __setitem__(self, i, value):
+		if isinstance(i, slice):
+			indices = range(*i.indices(len(self)))
+			values = list(value)
+			if len(values) != len(indices):
+				raise ValueError("Column slice assignment cannot change the column length.")
+			for k, v in zip(indices, values):
+				self._matrix[k, self._j] = v
+			return
+		self._matrix[self._index(i), self._j] = value
+
+	def __iter__(self):
+		return iter(self._matrix._col(self._j))
+
+	def __eq__(self, other):
+		if isinstance(other, (_Column, list, tuple)):
+			return list(self) == list(other)
+		return NotImplemented
+
+	def __repr__(self):
+		return repr(list(self))
+
+class _Columns:
+	"""
+	Live column-major view of a matrix (outer sequence = columns), returned by Matrix.data.
+	"""
+	__slots__ = ('_matrix',)
+
+	def __init__(self, matrix):
+		self._matrix = matrix
+
+	def __len__(self):
+		return self._matrix._cols
+
+	def __getitem__(self, j):
+		n = self._matrix._cols
+		if isinstance(j, slice):
+			return [_Column(self._matrix, k) for k in range(*j.indices(n))]
+		if j < 0:
+			j += n
+		if not (0 <= j < n):
+			raise IndexError("Column index out of range")
+		return _Column(self._matrix, j)
+
+	def __iter__(self):
+		return (_Column(self._matrix, j) for j in range(self._matrix._cols))
+
+	def __eq__(self, other):
+		if isinstance(other, (_Columns, list, tuple)):
+			return [list(col) for col in self] == [list(col) for col in other]
+		return NotImplemented
+
+	def __repr__(self):
+		return repr([list(col) for col in self])
+
 class Matrix:
+	"""
+	Dense real matrix backed by a single contiguous array('d') buffer.
+
+	Storage layout:
+	- All elements live in `_buf`, one unboxed double per element.
+	- Element (i, j) is stored at `_off + i * _rs + j * _cs`
+	  (`_rs` = row stride, `_cs` = column stride).
+	- Matrices built by this class are packed column-major: `_rs = 1`, `_cs = rows`.
+	- Views share the buffer with different offset/shape/strides: transpose() swaps
+	  rows/cols and the two strides; submatrix(), row(), column(), diagonal() and
+	  slicing (m[1:3, :]) select a strided window.
+	"""
+
+	# mul_mat kernel selection
+	TILED_THRESHOLD = 64	# smallest dimension from which the tiled kernel is used
+	TILE_SIZE = None		# tile edge for the tiled kernel (None = auto-select)
+	STRASSEN_THRESHOLD = 256	# square size from which Strassen-Winograd is used
+	STRASSEN_CROSSOVER = 128	# block size below which Strassen recursion multiplies classically
 
 	def __init__(self, data):
 		"""
 		Initialize the Matrix in column-major order.
-		
+
 		Args:
 			data (list of lists): Row-major matrix (outer list = rows, inner list = row values).
 		Raises:
@@ -23,43 +233,450 @@ class Matrix:
 				raise ValueError(f"All rows must have the same length. Row {i} has {len(row)}, expected {expected_cols}")
 
 		# Transpose rows -> columns for column-major storage
-		self.data = [[row[j] for row in data] for j in range(expected_cols)]
+		flat = array('d')
+		for row in data:
+			flat.extend(row)
+		self._init_storage(Matrix._transpose_packed(flat, len(data), expected_cols), len(data), expected_cols)
+
+	@staticmethod
+	def _transpose_packed(flat, rows, cols):
+		"""
+		Turn a packed row-major array('d') into a new packed column-major one
+		(one strided slice copy per column).
+		"""
+		buf = array('d', bytes(8 * rows * cols))
+		for j in range(cols):
+			buf[j * rows:(j + 1) * rows] = flat[j::cols]
+		return buf
+
+	def _init_storage(self, buf, rows, cols, off=0, rs=1, cs=None):
+		"""
+		Attach a storage buffer and its shape/stride metadata to this matrix.
+
+		Args:
+			buf (array): array('d') holding the elements.
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			off (int): Index of element (0, 0) in buf.
+			rs (int): Distance in buf between two consecutive rows.
+			cs (int): Distance in buf between two consecutive columns (defaults to rows).
+		"""
+		self._buf = buf
+		if not cols:
+			rows = 0 # no columns means no elements: shape (0, 0), as for Matrix([[]])
+		self._rows = rows
+		self._cols = cols
+		self._off = off
+		self._rs = rs
+		self._cs = rows if cs is None else cs
+
+	@classmethod
+	def _wrap(cls, buf, rows, cols):
+		"""
+		Create a Matrix around a packed column-major array('d') buffer without copying it.
+		"""
+		m = cls.__new__(cls)       # bypass __init__
+		m._init_storage(buf, rows, cols)
+		return m
 
 	@classmethod
 	def from_columns(cls, columns):
 		"""
 		Create a Matrix directly from column-major data.
-		
+
 		Args:
 			columns (list of lists): Column-major representation
 									(outer list = columns, inner list = values in that column).
+		Raises:
+			ValueError: If columns are of inconsistent lengths.
 		"""
-		m = cls.__new__(cls)       # bypass __init__
-		m.data = [list(col) for col in columns]
-		return m
+		rows = len(columns[0]) if columns else 0
+		buf = array('d')
+		for j, col in enumerate(columns):
+			if len(col) != rows:
+				raise ValueError(f"All columns must have the same length. Column {j} has {len(col)}, expected {rows}")
+			buf.extend(col)
+		return cls._wrap(buf, rows, len(columns))
+
+	@classmethod
+	def _from_flat(cls, flat, rows, cols, row_major):
+		"""
+		Create a Matrix owning a flat array('d') of rows * cols elements in the given order.
+		"""
+		if rows <= 0 or cols <= 0:
+			raise ValueError("Matrix dimensions must be positive.")
+		if len(flat) != rows * cols:
+			raise ValueError(f"Expected {rows * cols} elements for a {rows}x{cols} matrix, got {len(flat)}")
+		if row_major and rows > 1 and cols > 1:
+			flat = cls._transpose_packed(flat, rows, cols)
+		return cls._wrap(flat, rows, cols)
+
+	@classmethod
+	def from_buffer(cls, buf, rows, cols, row_major=False):
+		"""
+		Create a Matrix from a flat buffer of numbers with a single bulk copy.
+
+		Args:
+			buf (sequence): array('d'), memoryview or other buffer of doubles (buffers of other
+				item types such as array('f') or array('i') are converted), or any flat
+				sequence of numbers.
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			row_major (bool): Whether buf is row-major (default: column-major, like the storage).
+		Returns:
+			Matrix: A new matrix; it does not share memory with buf.
+		Raises:
+			ValueError: If the dimensions are not positive or do not match the buffer length.
+		"""
+		flat = array('d')
+		try:
+			view = memoryview(buf)
+		except TypeError:
+			view = None
+		if view is not None and view.format == 'd':
+			# strided views cannot be cast; tobytes() gathers them in logical order
+			flat.frombytes(view.cast('B') if view.c_contiguous else view.tobytes())
+		elif view is not None:
+			# other item types (float32, ints, ...) are converted element by element;
+			# array('d').extend() only accepts other array('d')s directly
+			if view.ndim != 1:
+				view = memoryview(view.tobytes()).cast(view.format)
+			flat.extend(iter(view))
+		else:
+			flat.extend(buf)
+		return cls._from_flat(flat, rows, cols, row_major)
+
+	@classmethod
+	def from_iter(cls, iterable, rows, cols, row_major=False):
+		"""
+		Create a Matrix by consuming an iterable (e.g. a generator) of numbers.
+
+		Args:
+			iterable (iterable): The rows * cols elements.
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			row_major (bool): Whether the elements come row by row (default: column by column).
+		Returns:
+			Matrix: A new matrix.
+		Raises:
+			ValueError: If the dimensions are not positive or the element count does not match.
+		"""
+		return cls._from_flat(array('d', iterable), rows, cols, row_major)
+
+	@classmethod
+	def from_rows(cls, rows, validate=True):
+		"""
+		Create a Matrix from row-major data (any iterable of rows) without per-element Python work.
+
+		Args:
+			rows (iterable): Rows, each a sequence of numbers.
+			validate (bool): Check that every row has the same length. With False only the
+				total element count is checked, so ragged rows may go unnoticed.
+		Returns:
+			Matrix: A new matrix.
+		Raises:
+			ValueError: If there are no rows or (when validating) row lengths differ.
+		"""
+		flat = array('d')
+		count = 0
+		cols = None
+		for row in rows:
+			if cols is None:
+				cols = len(row)
+			elif validate and len(row) != cols:
+				raise ValueError(f"All rows must have the same length. Row {count} has {len(row)}, expected {cols}")
+			flat.extend(row)
+			count += 1
+		if not count:
+			raise ValueError("Data must contain at least one row.")
+		return cls._from_flat(flat, count, cols, True)
+
+	@classmethod
+	def zeros(cls, rows, cols):
+		"""
+		Create a rows x cols matrix of zeros.
+		"""
+		return cls._from_flat(array('d', bytes(8 * rows * cols)), rows, cols, False)
+
+	@classmethod
+	def full(cls, rows, cols, value):
+		"""
+		Create a rows x cols matrix with every element set to value.
+		"""
+		return cls._from_flat(array('d', [value]) * (rows * cols), rows, cols, False)
+
+	@property
+	def data(self):
+		"""
+		Live column-major view of the matrix (outer sequence = columns).
+
+		m.data[j][i] reads and writes element (i, j) in O(1), like the nested lists
+		this attribute used to hold; nothing is copied when it is accessed.
+		"""
+		return _Columns(self)
+
+	def _index(self, i, j):
+		"""
+		Position of element (i, j) in the storage buffer.
+		"""
+		return self._off + i * self._rs + j * self._cs
+
+	def _col(self, j):
+		"""
+		Return column j as a new array('d') (a single strided slice of the buffer).
+		"""
+		if not self._rows:
+			return array('d')
+		start = self._off + j * self._cs
+		return self._buf[start:start + (self._rows - 1) * self._rs + 1:self._rs]
+
+	def _row(self, i):
+		"""
+		Return row i as a new array('d') (a single strided slice of the buffer).
+		"""
+		if not self._cols:
+			return array('d')
+		start = self._off + i * self._rs
+		return self._buf[start:start + (self._cols - 1) * self._cs + 1:self._cs]
+
+	def _packed(self):
+		"""
+		Return the elements as a new packed column-major array('d').
+		"""
+		n = self._rows * self._cols
+		if self._rs == 1 and self._cs == self._rows:
+			return self._buf[self._off:self._off + n]
+		buf = array('d')
+		for j in range(self._cols):
+			buf.extend(self._col(j))
+		return buf
+
+	def _to_numpy(self, np):
+		"""
+		View the storage as a (rows, cols) float64 ndarray, without copying.
+		"""
+		base = np.frombuffer(self._buf, dtype=np.float64)[self._off:]
+		step = base.itemsize
+		return np.lib.stride_tricks.as_strided(base, shape=(self._rows, self._cols),
+			strides=(self._rs * step, self._cs * step))
+
+	@classmethod
+	def _from_numpy(cls, nd):
+		"""
+		Create a packed column-major Matrix from a 2-D ndarray result.
+		"""
+		rows, cols = nd.shape
+		buf = array('d')
+		buf.frombytes(nd.astype('float64', copy=False).tobytes(order='F'))
+		return cls._wrap(buf, rows, cols)
+
+	def _view(self, off, rows, cols, rs, cs):
+		"""
+		Create a Matrix sharing this matrix's buffer with the given offset, shape and strides.
+		"""
+		view = Matrix.__new__(Matrix)       # bypass __init__
+		view._init_storage(self._buf, rows, cols, off, rs, cs)
+		return view
+
+	@staticmethod
+	def _axis(key, size):
+		"""
+		Resolve an index or slice along one axis to (start, count, step).
+		"""
+		if isinstance(key, slice):
+			start, stop, step = key.indices(size)
+			if step <= 0:
+				raise ValueError("Matrix slices only support positive steps.")
+			count = len(range(start, stop, step))
+			if not count:
+				raise ValueError("Matrix views must have at least one row and one column.")
+			return start, count, step
+		if not (0 <= key < size):
+			raise IndexError("Matrix index out of range")
+		return key, 1, 1
+
+	def _slice_view(self, i, j):
+		"""
+		View selected by a (row, column) key where either part may be a slice.
+		"""
+		r0, rows, r_step = Matrix._axis(i, self._rows)
+		c0, cols, c_step = Matrix._axis(j, self._cols)
+		return self._view(self._index(r0, c0), rows, cols, self._rs * r_step, self._cs * c_step)
+
+	def submatrix(self, row_start, row_stop, col_start, col_stop):
+		"""
+		View of the block of rows [row_start, row_stop) and columns [col_start, col_stop).
+
+		The view shares storage with this matrix: reads and writes go to the same
+		elements, and it can be passed to any Matrix operation.
+
+		Args:
+			row_start (int): First row of the block.
+			row_stop (int): One past the last row.
+			col_start (int): First column of the block.
+			col_stop (int): One past the last column.
+		Returns:
+			Matrix: The block as a view.
+		Raises:
+			ValueError: If the bounds are out of range or the block is empty.
+		"""
+		if not (0 <= row_start < row_stop <= self._rows and 0 <= col_start < col_stop <= self._cols):
+			raise ValueError("Submatrix bounds out of range or empty.")
+		return self._view(self._index(row_start, col_start), row_stop - row_start,
+			col_stop - col_start, self._rs, self._cs)
+
+	def row(self, i):
+		"""
+		View of row i as a 1 x cols matrix sharing storage with this one.
+		"""
+		return self._slice_view(i, slice(None))
+
+	def column(self, j):
+		"""
+		View of column j as a rows x 1 matrix sharing storage with this one.
+		"""
+		return self._slice_view(slice(None), j)
+
+	def diagonal(self):
+		"""
+		View of the main diagonal as a min(rows, cols) x 1 matrix sharing storage with this one.
+		"""
+		n = min(self._rows, self._cols)
+		if not n:
+			raise ValueError("Matrix is empty.")
+		return self._view(self._off, n, 1, self._rs + self._cs, self._cs)
+
+	def __getitem__(self, key):
+		"""
+		Read element (i, j), or get a view when either index is a slice.
+
+		Args:
+			key (tuple): (row, column) indices or slices (positive steps), e.g. m[0:2, :].
+		Returns:
+			float or Matrix: The element, or a view sharing storage (an index keeps its axis,
+				so m[i, :] is 1 x cols).
+		Raises:
+			IndexError: If an index is out of range.
+			ValueError: If a slice is empty or has a non-positive step.
+		"""
+		i, j = key
+		if isinstance(i, slice) or isinstance(j, slice):
+			return self._slice_view(i, j)
+		if not (0 <= i < self._rows and 0 <= j < self._cols):
+			raise IndexError("Matrix index out of range")
+		return self._buf[self._off + i * self._rs + j * self._cs]
+
+	def __setitem__(self, key, value):
+		"""
+		Write element (i, j) in place, or assign a block when either index is a slice.
+
+		Args:
+			key (tuple): (row, column) indices or slices.
+			value (float or Matrix): The new value; for a block, a Matrix of the block's shape
+				or a scalar to fill it with.
+		Raises:
+			IndexError: If an index is out of range.
+			ValueError: If the assigned Matrix does not match the block's shape.
+		"""
+		i, j = key
+		if isinstance(i, slice) or isinstance(j, slice):
+			target = self._slice_view(i, j)
+			if isinstance(value, Matrix):
+				if value.shape() != target.shape():
+					raise ValueError("Assigned matrix must have the same shape as the block.")
+				values = value._packed() # copied first, so overlapping blocks are safe
+			else:
+				values = array('d', [value]) * (target._rows * target._cols)
+			pos = 0
+			for span, count in target._spans():
+				self._buf[span] = values[pos:pos + count]
+				pos += count
+			return
+		if not (0 <= i < self._rows and 0 <= j < self._cols):
+			raise IndexError("Matrix index out of range")
+		self._buf[self._off + i * self._rs + j * self._cs] = value
 
 	def rank(self):
 		"""
-		Calculate the rank of the matrix using its row echelon form.
+		Calculate the rank of the matrix: the number of pivots above 1e-9 in modulus found by
+		forward elimination (see _count_pivots), or by backend.rank under the NumPy backend.
 
 		Returns:
 			int: The rank of the matrix.
 		"""
-		A = self.row_echelon()
-		rows, cols = A.shape()
-		rank = 0
-		for i in range(rows):
-			# if any nonzero entry in row i
-			if any(abs(A.data[j][i]) > 1e-9 for j in range(cols)):
-				rank += 1
-		return rank
+		np = backend.active_numpy()
+		if np is not None:
+			if not self._rows or not self._cols:
+				return 0
+			return backend.rank(self._to_numpy(np), 1e-9)
+		return self._count_pivots()
+
+	def _count_pivots(self, target=None):
+		"""
+		Count pivots with forward elimination only (no back elimination, no normalized rows).
+
+		Works on a row-major scratch copy with partial pivoting; entries at or below 1e-9
+		in modulus count as zero, as in row_echelon.
+		Args:
+			target (int): Optional pivot count of interest; elimination stops as soon as it is
+				reached or can no longer be reached with the remaining columns.
+		Returns:
+			int: The number of pivots found (the rank when target is None).
+		"""
+		rows, cols = self._rows, self._cols
+		R = [self._row(i).tolist() for i in range(rows)]
+		pivots = 0
+		for col in range(cols):
+			if pivots == rows or pivots == target:
+				break
+			if target is not None and pivots + cols - col < target:
+				break # not enough columns left
+			pivot, max_val = None, 1e-9
+			for r in range(pivots, rows):
+				val = my_abs(R[r][col])
+				if val > max_val:
+					pivot, max_val = r, val
+			if pivot is None:
+				continue # no pivot in this column
+			R[pivots], R[pivot] = R[pivot], R[pivots]
+			pivot_row = R[pivots]
+			tail = pivot_row[col + 1:]
+			for r in range(pivots + 1, rows):
+				row = R[r]
+				if row[col]:
+					factor = row[col] / pivot_row[col]
+					row[col + 1:] = map(fma, tail, repeat(-factor), row[col + 1:])
+			pivots += 1
+		return pivots
+
+	def is_full_rank(self):
+		"""
+		Check whether the rank equals min(rows, cols), stopping at the first column that
+		makes it unreachable.
+
+		Returns:
+			bool: True if the matrix has full rank.
+		"""
+		target = min(self._rows, self._cols)
+		if backend.active_numpy() is not None:
+			return self.rank() == target
+		return self._count_pivots(target) == target
+
+	def is_invertible(self):
+		"""
+		Check whether the matrix is square and non-singular, without computing the inverse.
+
+		Returns:
+			bool: True if the matrix is invertible.
+		"""
+		return self.is_square() and self.is_full_rank()
 
 	def inverse(self):
 		"""
 		Calculate the inverse of the matrix using Gauss-Jordan elimination.
 
 		Algorithm:
-		- Augment the matrix A with the identity matrix I to form [A | I].
+		- Augment the matrix A with the identity matrix I to form [A | I], one row list per row.
 		- Use row operations to convert A into the identity matrix.
 		- The transformed I will become A^(-1).
 		Returns:
@@ -71,103 +688,146 @@ class Matrix:
 			raise ValueError("Inverse is only defined for square matrices.")
 		n, _ = self.shape()
 
-		A = self.copy()
-		I = Matrix.identity(n)
+		np = backend.active_numpy()
+		if np is not None:
+			a = self._to_numpy(np)
+			if backend.rank(a, 1e-9) < n:
+				raise ValueError("Matrix is singular and cannot be inverted.")
+			return Matrix._from_numpy(np.linalg.inv(a))
+
+		R = [self._row(i).tolist() + [0.0] * n for i in range(n)]
+		for i in range(n):
+			R[i][n + i] = 1.0
+		if _gauss_jordan(R, n, 1e-9) < n:
+			raise ValueError("Matrix is singular and cannot be inverted.")
+		return Matrix.from_rows([row[n:] for row in R], validate=False)
+
+	def _lu_factor(self):
+		"""
+		LU-factorize a square matrix with partial pivoting: P·A = L·U.
 
-		for col in range(n):
-			# find pivot in current column
-			pivot = None
-			max_val = 0
-			for r in range(col, n):
-				if my_abs(A.data[col][r]) > max_val + 1e-9:
-					max_val = my_abs(A.data[col][r])
+		Works on a row-major scratch copy (list of row lists). L (unit lower, multipliers
+		below the diagonal) and U (upper, including the diagonal) share that storage.
+		A column whose pivot candidates are all within rounding error of zero (at most
+		n * epsilon * the largest entry in modulus, so the test follows the matrix scale)
+		is zeroed and skipped, leaving an exact zero on U's diagonal.
+		Returns:
+			tuple: (LU rows, perm, parity) where perm[i] is the original index of row i
+				and parity is +1.0 or -1.0 for an even or odd number of row swaps.
+		"""
+		n = self._rows
+		LU = [self._row(i).tolist() for i in range(n)]
+		tol = n * float_info.epsilon * max((my_abs(x) for row in LU for x in row), default=0.0)
+		perm = list(range(n))
+		parity = 1.0
+
+		for k in range(n):
+			# pick the largest-magnitude pivot in column k
+			pivot = k
+			max_val = my_abs(LU[k][k])
+			for r in range(k + 1, n):
+				val = my_abs(LU[r][k])
+				if val > max_val:
+					max_val = val
 					pivot = r
-			if pivot is None or my_abs(max_val) < 1e-9:
-				raise ValueError("Matrix is singular and cannot be inverted.")
-			
-			# Swap pivot row with current row
-			if pivot != col:
-				A.swap_rows(col, pivot)
-				I.swap_rows(col, pivot)
-
-			# Scale pivot row to make pivot = 1
-			pivot_val = A.data[col][col]
-			if my_abs(pivot_val) < 1e-9:
-				raise ValueError("Matrix is singular and cannot be inverted.")
-			scale = 1.0 / pivot_val
-			A.scale_row(col, scale)
-			I.scale_row(col, scale)
-
-			# Eliminate all other rows
-			for r in range(n):
-				if r == col:
-					continue
-				factor = A.data[col][r]
-				if my_abs(factor) > 1e-9:
-					A.add_multiple_of_row(r, col, -factor)
-					I.add_multiple_of_row(r, col, -factor)
-		return I
+			if max_val <= tol:
+				for r in range(k, n):
+					LU[r][k] = 0.0 # rounding residue only: singular
+				continue
+			if pivot != k:
+				LU[k], LU[pivot] = LU[pivot], LU[k]
+				perm[k], perm[pivot] = perm[pivot], perm[k]
+				parity = -parity
+
+			pivot_val = LU[k][k]
+			tail = LU[k][k + 1:]
+			for r in range(k + 1, n):
+				row = LU[r]
+				factor = row[k] / pivot_val
+				row[k] = factor
+				if factor:
+					row[k + 1:] = [a - factor * b for a, b in zip(row[k + 1:], tail)]
+		return LU, perm, parity
+
+	def lu(self):
+		"""
+		Factorize the matrix once for repeated solves (P·A = L·U, partial pivoting).
+
+		Returns:
+			LU: Factorization object offering solve(), solve_many(), determinant() and inverse().
+		Raises:
+			ValueError: If the matrix is not square.
+		"""
+		from LU import LU
+		return LU(self)
 
 	def determinant(self):
 		"""
-		Calculate the determinant of the matrix using cofactor expansion.
+		Calculate the determinant of the matrix.
 
 		Algorithm:
 		- For 1x1 matrix, return the single element.
 		- For 2x2 matrix, use ad - bc.
-		- For 3x3 and 4x4, use cofactor expansion along the first row.
+		- For larger matrices, LU-factorize with partial pivoting (O(n^3)) and
+		  multiply the diagonal of U, negated once per row swap.
 		Returns:
 			float: The determinant of the matrix.
 		Raises:
 			ValueError: If the matrix is not square.
-			NotImplementedError: If the matrix is larger than 4x4.
 		"""
 		if not self.is_square():
 			raise ValueError("Determinant is only defined for square matrices.")
-		
+
 		n, _ = self.shape()
-		if n == 0:
-			raise ValueError("Determinant is not defined for empty matrices.")
-		if n > 4:
-			raise NotImplementedError("Determinant calculation is only implemented for matrices up to 4x4.")
-		
 		if n == 1:
-			return self.data[0][0]
+			return self[0, 0]
 		elif n == 2:
-			a, b = self.data[0][0], self.data[1][0]
-			c, d = self.data[0][1], self.data[1][1]
+			a, b = self[0, 0], self[0, 1]
+			c, d = self[1, 0], self[1, 1]
 			return a * d - b * c
-		# For n >= 3
-		det = 0.0
-		for col in range(n):
-			elem = self.data[col][0]
-			if my_abs(elem) < 1e-9:
-				continue
-			
-			# build minor matrix (remove row 0 and column col)
-			minor_cols = []
-			for j in range(n):
-				if j == col:
-					continue
-				minor_col = self.data[j][1:]
-				minor_cols.append(minor_col)
-			minor = Matrix.from_columns(minor_cols)
-			cofactor = ((-1) ** col) * elem * minor.determinant()
-			det += cofactor
-		return det
 
+		np = backend.active_numpy()
+		if np is not None:
+			return float(np.linalg.det(self._to_numpy(np)))
 
-	def swap_rows(self, i, j):
+		LU, _, det = self._lu_factor()
+		for k in range(n):
+			d = LU[k][k]
+			if d == 0:
+				return 0.0 # skipped column: singular
+			det *= d
+		return det
+
+	def slogdet(self):
 		"""
-		Swap row i and row j in the matrix (in-place).
+		Calculate the sign and the natural log of the absolute value of the determinant.
+
+		Unlike determinant(), the result does not overflow or underflow for large matrices:
+		det = sign * exp(logabsdet).
+		Returns:
+			tuple: (sign, logabsdet) with sign in {-1.0, 0.0, 1.0};
+				(0.0, -inf) for a singular matrix.
+		Raises:
+			ValueError: If the matrix is not square.
 		"""
-		rows, cols = self.shape()
-		if not (0 <= i < rows and 0 <= j < rows):
-			raise IndexError("Row index out of range")
-		if i == j:
-			return
-		for col in self.data:
-			col[i], col[j] = col[j], col[i]
+		if not self.is_square():
+			raise ValueError("Determinant is only defined for square matrices.")
+
+		np = backend.active_numpy()
+		if np is not None:
+			sign, logabsdet = np.linalg.slogdet(self._to_numpy(np))
+			return float(sign), float(logabsdet)
+
+		LU, _, sign = self._lu_factor()
+		logabsdet = 0.0
+		for k in range(self._rows):
+			d = LU[k][k]
+			if d == 0:
+				return 0.0, -inf
+			if d < 0:
+				sign = -sign
+			logabsdet += log(-d if d < 0 else d)
+		return sign, logabsdet
 
 	def row_echelon(self):
 		"""
@@ -175,8 +835,8 @@ class Matrix:
 		Even though subject asks for Row Echelon Form, In the examples provided, the results are in Reduced Row Echelon Form.
 		So we implement Gauss-Jordan elimination to achieve RREF.
 
-		Algorithm:
-		- For each column, find the pivot (first non-zero entry from the current row down
+		Algorithm (on a row-major working copy, see _gauss_jordan):
+		- For each column, find the pivot (largest entry from the current row down)
 		- Swap the pivot row with the current row
 		- Scale the pivot row to make the pivot equal to 1
 		- Eliminate all entries below the pivot by adding suitable multiples of the pivot row
@@ -184,45 +844,13 @@ class Matrix:
 		Returns:
 			Matrix: A new Matrix instance in Row Echelon Form.
 		"""
-		A = self.copy()
-		rows, cols = A.shape()
-		pivot_row = 0
+		np = backend.active_numpy()
+		if np is not None and self._rows and self._cols:
+			return Matrix._from_numpy(backend.rref(self._to_numpy(np).copy(), 1e-9))
 
-		for col in range(cols):
-			# find pivot in current column
-			pivot = None
-			max_val = 0
-			for r in range(pivot_row, rows):
-				if abs(A.data[col][r]) > max_val + 1e-9:
-					max_val = abs(A.data[col][r])
-					pivot = r
-			if pivot is None:
-				continue # no pivot in this column                                             
-			# Swap pivot row with current row
-			if pivot != pivot_row:
-				A.swap_rows(pivot_row, pivot)
-			
-			# Make pivot = 1
-			pivot_val = A.data[col][pivot_row]
-			if my_abs(pivot_val) > 1e-9:
-				A.scale_row(pivot_row, 1.0 / pivot_val)
-			
-			# Eliminate below
-			for r in range(pivot_row + 1, rows):
-				factor = A.data[col][r]
-				if my_abs(factor) > 1e-9:
-					A.add_multiple_of_row(r, pivot_row, -factor)
-			
-			# Eliminate above (for reduced row echelon form)
-			for r in range(pivot_row):
-				factor = A.data[col][r]
-				if my_abs(factor) > 1e-9:
-					A.add_multiple_of_row(r, pivot_row, -factor)
-
-			pivot_row += 1
-			if pivot_row == rows:
-				break
-		return A
+		R = [self._row(i).tolist() for i in range(self._rows)]
+		_gauss_jordan(R, self._cols, 1e-9)
+		return Matrix.from_rows(R, validate=False)
 
 	@staticmethod
 	def identity(n):
@@ -234,12 +862,10 @@ class Matrix:
 		Returns:
 			Matrix: An n x n identity matrix.
 		"""
-		cols = []
+		buf = array('d', bytes(8 * n * n))
 		for j in range(n):
-			col = [0.0] * n
-			col[j] = 1.0
-			cols.append(col)
-		return Matrix.from_columns(cols)
+			buf[j * n + j] = 1.0
+		return Matrix._wrap(buf, n, n)
 
 
 	def copy(self):
@@ -249,7 +875,7 @@ class Matrix:
 		Returns:
 			Matrix: A new Matrix instance that is a copy of the current matrix.
 		"""
-		return Matrix.from_columns([col[:] for col in self.data])
+		return Matrix._wrap(self._packed(), self._rows, self._cols)
 
 
 	def add_multiple_of_row(self, target, source, scalar):
@@ -263,11 +889,12 @@ class Matrix:
 		Raises:
 			IndexError: If row indices are out of range.
 		"""
-		rows, _ = self.shape()
+		rows, cols = self.shape()
 		if not (0 <= target < rows and 0 <= source < rows):
 			raise IndexError("Row index out of range")
-		for col in self.data:
-			col[target] += scalar * col[source]
+		cs, span = self._cs, (cols - 1) * self._cs + 1
+		t = self._off + target * self._rs
+		self._buf[t:t + span:cs] = array('d', map(fma, self._row(source), repeat(scalar), self._row(target)))
 
 
 	def scale_row(self, i, scalar):
@@ -280,11 +907,12 @@ class Matrix:
 		Raises:
 			IndexError: If row index is out of range.
 		"""
-		rows, _ = self.shape()
+		rows, cols = self.shape()
 		if not (0 <= i < rows):
 			raise IndexError("Row index out of range")
-		for col in self.data:
-			col[i] *= scalar
+		cs = self._cs
+		start = self._off + i * self._rs
+		self._buf[start:start + (cols - 1) * cs + 1:cs] = array('d', map(mul, self._row(i), repeat(scalar)))
 
 
 	def swap_rows(self, i, j):
@@ -302,24 +930,34 @@ class Matrix:
 			raise IndexError("Row index out of range")
 		if i == j:
 			return
-		for col in self.data:
-			col[i], col[j] = col[j], col[i]
+		row_i, row_j = self._row(i), self._row(j)
+		cs = self._cs
+		start_i = self._off + i * self._rs
+		start_j = self._off + j * self._rs
+		self._buf[start_i:start_i + (cols - 1) * cs + 1:cs] = row_j
+		self._buf[start_j:start_j + (cols - 1) * cs + 1:cs] = row_i
 
 
 	def transpose(self):
 		"""
-		Return the transpose B = A^T, stored in column-major order.
+		Return the transpose B = A^T as an O(1) view.
+
+		B shares A's buffer with rows/cols and strides swapped, so nothing is copied and
+		writes through either matrix are visible in both. Call copy() on the result for an
+		independent, packed column-major matrix.
 
 		Returns:
-			Matrix: The transposed matrix.
+			Matrix: The transposed view.
 		"""
-		if not self.data:
-			return Matrix.from_columns([])
-		rows, cols = self.shape()
-		# Column j of B is row j of A: [A_{j,r}]_r = [self.data[r][j]] for r=0..n-1
-		new_cols = [[self.data[r][j] for r in range(cols)]  # builds column j of B
-					for j in range(rows)]
-		return Matrix.from_columns(new_cols)
+		return self._view(self._off, self._cols, self._rows, self._cs, self._rs)
+
+	def _is_transpose_of(self, other):
+		"""
+		Check whether this matrix is a transposed view of other (same buffer, strides swapped).
+		"""
+		return (self._buf is other._buf and self._off == other._off
+			and self._rs == other._cs and self._cs == other._rs
+			and self._rows == other._cols and self._cols == other._rows)
 
 
 	def trace(self):
@@ -333,11 +971,10 @@ class Matrix:
 		"""
 		if not self.is_square():
 			raise ValueError("Trace is only defined for square matrices.")
-		if not self.data:
-			return 0.0
+		buf, step = self._buf, self._rs + self._cs
 		diag_sum = 0.0
-		for i in range(len(self.data)):
-			diag_sum += self.data[i][i]
+		for i in range(self._rows):
+			diag_sum += buf[self._off + i * step]
 		return diag_sum
 
 	def mul_vec(self, vector):
@@ -345,32 +982,144 @@ class Matrix:
 		Multiply the matrix (m×n) by a vector (size n).
 		Returns a new Vector (size m).
 		"""
-		from Vector import Vector
 		if not isinstance(vector, Vector):
 			raise ValueError("The operand must be a Vector.")
-		if not self.data:
+		if not self._rows or not self._cols:
 			raise ValueError("Matrix is empty.")
 
 		rows, cols = self.shape()
 		if vector.size() != cols:
 			raise ValueError(f"Incompatible dimensions: matrix has {cols} cols, vector has size {vector.size()}")
 
-		results = []
-		for i in range(rows):  # iterate rows
-			dot = 0.0
-			for j in range(cols):  # iterate columns
-				dot += self.data[j][i] * vector.data[j]
-			results.append(dot)
-		return Vector(results)
+		np = backend.active_numpy()
+		if np is not None:
+			return Vector._wrap((self._to_numpy(np) @ np.asarray(vector.data, dtype=np.float64)).tolist())
+
+		if self._rs != 1:
+			# rows are contiguous (e.g. a transposed view): one dot product per row
+			return Vector._wrap([sumprod(self._row(i), vector.data) for i in range(rows)])
+		# columns are contiguous: accumulate x_j * column j, skipping zero components
+		# of finite columns only (0 * inf is nan, as under the NumPy backend)
+		acc = None
+		for j, x in enumerate(vector.data):
+			col = self._col(j)
+			if not (isfinite(x) and isfinite(sum(col))):
+				# IEEE products; fma raises on invalid operations instead
+				scaled = map(mul, col, repeat(x))
+				acc = list(scaled) if acc is None else list(map(add, scaled, acc))
+			elif not x:
+				continue
+			elif acc is None:
+				acc = list(map(mul, col, repeat(x)))
+			else:
+				acc = list(map(fma, col, repeat(x), acc))
+		return Vector._wrap(acc if acc is not None else [0.0] * rows)
 
-	def mul_mat(self, mat):
+	def mul_vecs(self, vectors):
+		"""
+		Multiply the matrix (m×n) by every Vector of a sequence in one call.
+
+		Args:
+			vectors (iterable): Vectors of size n.
+		Returns:
+			list: The resulting Vectors (size m), in input order.
+		Raises:
+			ValueError: If an element is not a Vector of size n.
+		"""
+		cols = self._cols
+		packed = array('d')
+		for vector in vectors:
+			if not isinstance(vector, Vector):
+				raise ValueError("The operand must be a Vector.")
+			if vector.size() != cols:
+				raise ValueError(f"Incompatible dimensions: matrix has {cols} cols, vector has size {vector.size()}")
+			packed.extend(vector.data)
+		out = self.mul_buffer(packed)
+		rows = self._rows
+		return [Vector._wrap(out[k:k + rows].tolist()) for k in range(0, len(out), rows)]
+
+	def mul_buffer(self, buf, out=None):
+		"""
+		Multiply the matrix (m×n) by every vector of a packed buffer in one call.
+
+		The buffer holds N vectors of size n back to back (e.g. N x 4 vertex data).
+		Each component is gathered once with a strided slice, and every output component
+		is accumulated over the whole batch with fma, so the matrix entries are read
+		once per call instead of once per vector. Batches of at least
+		parallel.MUL_THRESHOLD multiply-adds are split across the worker pool, if one is running.
+
+		Args:
+			buf (sequence): Flat array('d'), list or memoryview of N*n numbers.
+			out (array): Optional array('d') of N*m numbers to write the results into.
+		Returns:
+			array: array('d') of N result vectors (size m) packed back to back.
+		Raises:
+			ValueError: If the matrix is empty or the buffer sizes do not match.
+		"""
+		rows, cols = self.shape()
+		if not rows or not cols:
+			raise ValueError("Matrix is empty.")
+		if len(buf) % cols:
+			raise ValueError(f"Buffer length {len(buf)} is not a multiple of the vector size {cols}")
+		count = len(buf) // cols
+		if out is None:
+			out = array('d', bytes(8 * count * rows))
+		elif len(out) != count * rows:
+			raise ValueError(f"Output buffer must hold {count * rows} values, got {len(out)}")
+		if not count:
+			return out
+
+		np = backend.active_numpy()
+		if np is not None:
+			vectors = np.asarray(buf, dtype=np.float64).reshape(count, cols)
+			np.matmul(vectors, self._to_numpy(np).T, out=np.frombuffer(out, dtype=np.float64).reshape(count, rows))
+			return out
+		if parallel.active(count * rows * cols, parallel.MUL_THRESHOLD):
+			return parallel.mul_buffer(self._packed(), rows, cols, buf, out)
+
+		components = [buf[j::cols] for j in range(cols)]
+		# A finite sum implies finite terms (an overflowing sum only costs the fast path).
+		finite = [isfinite(sum(component)) for component in components]
+		for i in range(rows):
+			acc = None
+			for a, component, finite_terms in zip(self._row(i), components, finite):
+				if not (finite_terms and isfinite(a)):
+					# IEEE products (0 * inf is nan); fma raises on them instead
+					scaled = map(mul, component, repeat(a))
+					acc = list(scaled) if acc is None else list(map(add, scaled, acc))
+				elif not a:
+					continue # zero entries (common in transforms) cost nothing
+				elif acc is None:
+					acc = list(map(mul, component, repeat(a)))
+				else:
+					acc = list(map(fma, component, repeat(a), acc))
+			out[i::rows] = array('d', acc) if acc is not None else array('d', bytes(8 * count))
+		return out
+
+	def mul_mat(self, mat, method=None):
 		"""
 		Multiply matrix A (m×n) by matrix B (n×p).
 		Returns C = A·B (m×p), stored in column-major order.
+
+		Args:
+			mat (Matrix): The right-hand operand B (a SparseMatrix gives a dense·sparse product).
+			method (str): Kernel to use: "classic", "tiled", "strassen", "parallel" or None to pick
+						automatically (NumPy when the numpy backend is active, the worker pool
+						when one is running (see parallel.set_workers) and the product reaches
+						parallel.MUL_THRESHOLD multiply-adds, a symmetric kernel when one
+						operand is a transposed view of the other (A·A^T, A^T·A),
+						Strassen-Winograd for square products of at least STRASSEN_THRESHOLD,
+						tiled once every dimension reaches TILED_THRESHOLD, classic otherwise).
+		Raises:
+			ValueError: If the operand is not a Matrix, is empty, has incompatible dimensions,
+						or if method is unknown.
 		"""
 		if not isinstance(mat, Matrix):
+			from SparseMatrix import SparseMatrix
+			if isinstance(mat, SparseMatrix):
+				return mat._rmul_dense(self)
 			raise ValueError("Argument must be a Matrix.")
-		if not self.data or not mat.data:
+		if not self._rows or not self._cols or not mat._rows or not mat._cols:
 			raise ValueError("One of the matrices is empty.")
 
 		rows_A, cols_A = self.shape()
@@ -379,16 +1128,116 @@ class Matrix:
 		if cols_A != rows_B:
 			raise ValueError(f"Incompatible dimensions: A is {rows_A}x{cols_A}, B is {rows_B}x{cols_B}")
 
-		result_cols = []
+		np = backend.active_numpy()
+		if np is not None and method is None:
+			return Matrix._from_numpy(self._to_numpy(np) @ mat._to_numpy(np))
+
+		if method is None:
+			if parallel.active(rows_A * cols_A * cols_B, parallel.MUL_THRESHOLD):
+				method = "parallel"
+			elif self._is_transpose_of(mat) or mat._is_transpose_of(self):
+				return self._mul_gram()
+			elif rows_A == cols_A == cols_B and rows_A >= Matrix.STRASSEN_THRESHOLD:
+				method = "strassen"
+			elif min(rows_A, cols_A, cols_B) >= Matrix.TILED_THRESHOLD:
+				method = "tiled"
+			else:
+				method = "classic"
+		if method == "parallel":
+			buf = parallel.mul_mat(self._packed(), mat._packed(), rows_A, cols_A, cols_B)
+			return Matrix._wrap(buf, rows_A, cols_B)
+		if method == "strassen":
+			return self._mul_strassen(mat)
+		if method == "tiled":
+			return self._mul_tiled(mat, Matrix.TILE_SIZE or Matrix._auto_tile(rows_A, cols_A, cols_B))
+		if method != "classic":
+			raise ValueError(f"Unknown multiplication method: {method}")
+
+		a_rows = [self._row(i) for i in range(rows_A)]
+		buf = array('d')
 		for j in range(cols_B):           # for each column of B / C
-			col_result = []
-			for i in range(rows_A):       # for each row of A / C
+			b_col = mat._col(j)
+			for a_row in a_rows:          # for each row of A / C
 				dot = 0.0
-				for k in range(cols_A):   # shared dimension
-					dot += self.data[k][i] * mat.data[j][k]  # A[i,k] * B[k,j]
-				col_result.append(dot)
-			result_cols.append(col_result)
-		return Matrix.from_columns(result_cols)
+				for a, b in zip(a_row, b_col):   # shared dimension
+					dot += a * b          # A[i,k] * B[k,j]
+				buf.append(dot)
+		return Matrix._wrap(buf, rows_A, cols_B)
+
+	def _mul_strassen(self, mat):
+		"""
+		Strassen-Winograd product C = A·B.
+
+		Rectangular operands are zero-padded to a common square size; the recursion
+		falls back to classic products below STRASSEN_CROSSOVER.
+		"""
+		rows_A, cols_A = self.shape()
+		cols_B = mat._cols
+		n = max(rows_A, cols_A, cols_B)
+		A = [self._row(i).tolist() + [0.0] * (n - cols_A) for i in range(rows_A)]
+		A += [[0.0] * n for _ in range(n - rows_A)]
+		B = [mat._row(k).tolist() + [0.0] * (n - cols_B) for k in range(cols_A)]
+		B += [[0.0] * n for _ in range(n - cols_A)]
+		C = _strassen(A, B, max(1, Matrix.STRASSEN_CROSSOVER))
+
+		buf = array('d')
+		for j in range(cols_B):
+			buf.extend(row[j] for row in C[:rows_A])
+		return Matrix._wrap(buf, rows_A, cols_B)
+
+	def _mul_gram(self):
+		"""
+		Product C = A·A^T where the right operand is a transposed view of A (covers A^T·A
+		when A is itself a view).
+
+		C is symmetric: each entry is the dot product of two rows of A, so only the upper
+		triangle is computed and then mirrored.
+		"""
+		n = self._rows
+		rows = [self._row(i).tolist() for i in range(n)]
+		out = array('d', bytes(8 * n * n))
+		for i, row_i in enumerate(rows):
+			for j in range(i, n):
+				out[j * n + i] = out[i * n + j] = sumprod(row_i, rows[j])
+		return Matrix._wrap(out, n, n)
+
+	@staticmethod
+	def _auto_tile(m, n, p):
+		"""
+		Pick a tile edge for the tiled kernel.
+
+		Three tiles of 64x64 doubles (A tile, B tile, C tile) are ~96 KiB, which stays
+		cache resident; smaller products use a single tile per dimension.
+		"""
+		return max(1, min(64, m, n, p))
+
+	def _mul_tiled(self, mat, tile):
+		"""
+		Cache-blocked product C = A·B.
+
+		A is read as rows and B as columns once (as lists, so the inner sumprod works on
+		already boxed floats); the shared dimension is then split into panels of `tile`
+		entries and C into tile x tile blocks, so each block only touches tile-sized
+		row/column segments. Partial dot products are accumulated into C.
+		"""
+		rows_A, cols_A = self.shape()
+		cols_B = mat._cols
+		a_rows = [self._row(i).tolist() for i in range(rows_A)]
+		b_cols = [mat._col(j).tolist() for j in range(cols_B)]
+		out = array('d', bytes(8 * rows_A * cols_B))
+
+		for k0 in range(0, cols_A, tile):
+			k1 = min(k0 + tile, cols_A)
+			a_panel = [row[k0:k1] for row in a_rows]
+			for j0 in range(0, cols_B, tile):
+				b_block = [col[k0:k1] for col in b_cols[j0:j0 + tile]]
+				for i0 in range(0, rows_A, tile):
+					a_block = a_panel[i0:i0 + tile]
+					for jj, b_seg in enumerate(b_block):
+						base = (j0 + jj) * rows_A + i0
+						for ii, a_seg in enumerate(a_block):
+							out[base + ii] += sumprod(a_seg, b_seg)
+		return Matrix._wrap(out, rows_A, cols_B)
 
 
 	def __add__(self, other):
@@ -399,13 +1248,22 @@ class Matrix:
 			other (Matrix): The matrix to add.
 		Returns:
 			Matrix: A new Matrix instance representing the sum.
+		Raises:
+			ValueError: If the matrices have different shapes.
 		"""
 		if not isinstance(other, Matrix):
 			return NotImplemented
-		result_cols = []
-		for col_self, col_other in zip(self.data, other.data):
-			result_cols.append([a + b for a, b in zip(col_self, col_other)])
-		return Matrix.from_columns(result_cols)
+		if lazy.deferring():
+			return lazy.Expr(self) + other
+		if self.shape() != other.shape():
+			raise ValueError("Matrices must have the same shape.")
+		np = backend.active_numpy()
+		if np is not None:
+			return Matrix._from_numpy(self._to_numpy(np) + other._to_numpy(np))
+		if parallel.active(self._rows * self._cols, parallel.ELEMENTWISE_THRESHOLD):
+			return Matrix._wrap(parallel.combine(add, self._packed(), other._packed()), self._rows, self._cols)
+		buf = array('d', [a + b for a, b in zip(self._packed(), other._packed())])
+		return Matrix._wrap(buf, self._rows, self._cols)
 
 	def __sub__(self, other):
 		"""
@@ -415,14 +1273,23 @@ class Matrix:
 			other (Matrix): The matrix to subtract.
 		Returns:
 			Matrix: A new Matrix instance representing the difference.
+		Raises:
+			ValueError: If the matrices have different shapes.
 		"""
 		if not isinstance(other, Matrix):
 			return NotImplemented
-		result_cols = []
-		for col_self, col_other in zip(self.data, other.data):
-			result_cols.append([a - b for a, b in zip(col_self, col_other)])
-		return Matrix.from_columns(result_cols)
-	
+		if lazy.deferring():
+			return lazy.Expr(self) - other
+		if self.shape() != other.shape():
+			raise ValueError("Matrices must have the same shape.")
+		np = backend.active_numpy()
+		if np is not None:
+			return Matrix._from_numpy(self._to_numpy(np) - other._to_numpy(np))
+		if parallel.active(self._rows * self._cols, parallel.ELEMENTWISE_THRESHOLD):
+			return Matrix._wrap(parallel.combine(sub, self._packed(), other._packed()), self._rows, self._cols)
+		buf = array('d', [a - b for a, b in zip(self._packed(), other._packed())])
+		return Matrix._wrap(buf, self._rows, self._cols)
+
 	def scl(self, scalar):
 		"""
 		Scale the matrix by a scalar.
@@ -432,11 +1299,105 @@ class Matrix:
 		Returns:
 			Matrix: A new Matrix instance representing the scaled matrix.
 		"""
-		result_cols = []
-		for col in self.data:
-			result_cols.append([scalar * x for x in col])
-		return Matrix.from_columns(result_cols)
-	
+		if lazy.deferring():
+			return lazy.Expr(self).scl(scalar)
+		np = backend.active_numpy()
+		if np is not None:
+			return Matrix._from_numpy(self._to_numpy(np) * scalar)
+		if parallel.active(self._rows * self._cols, parallel.ELEMENTWISE_THRESHOLD):
+			return Matrix._wrap(parallel.scale(scalar, self._packed()), self._rows, self._cols)
+		buf = array('d', [scalar * x for x in self._packed()])
+		return Matrix._wrap(buf, self._rows, self._cols)
+
+	def _spans(self):
+		"""
+		Yield (slice, count) pairs covering the storage in column-major order:
+		one slice when the matrix is packed, otherwise one strided slice per column.
+		"""
+		if self._rs == 1 and self._cs == self._rows:
+			yield slice(self._off, self._off + self._rows * self._cols), self._rows * self._cols
+			return
+		if not self._rows:
+			return
+		for j in range(self._cols):
+			start = self._off + j * self._cs
+			yield slice(start, start + (self._rows - 1) * self._rs + 1, self._rs), self._rows
+
+	def _combine_inplace(self, other, combine):
+		"""
+		Overwrite this matrix's own storage span by span with combine(own_values, other_values).
+		"""
+		if self.shape() != other.shape():
+			raise ValueError("Matrices must have the same shape.")
+		values = other._packed()
+		buf, pos = self._buf, 0
+		for span, count in self._spans():
+			buf[span] = array('d', combine(buf[span], values[pos:pos + count]))
+			pos += count
+		return self
+
+	def __iadd__(self, other):
+		"""
+		Add another matrix element-wise, in place (A += B).
+
+		Args:
+			other (Matrix): The matrix to add.
+		Returns:
+			Matrix: self, with its storage updated.
+		Raises:
+			ValueError: If the matrices have different shapes.
+		"""
+		if not isinstance(other, Matrix):
+			return NotImplemented
+		return self._combine_inplace(other, lambda mine, theirs: map(add, mine, theirs))
+
+	def __isub__(self, other):
+		"""
+		Subtract another matrix element-wise, in place (A -= B).
+
+		Args:
+			other (Matrix): The matrix to subtract.
+		Returns:
+			Matrix: self, with its storage updated.
+		Raises:
+			ValueError: If the matrices have different shapes.
+		"""
+		if not isinstance(other, Matrix):
+			return NotImplemented
+		return self._combine_inplace(other, lambda mine, theirs: map(sub, mine, theirs))
+
+	def __imul__(self, scalar):
+		"""
+		Scale the matrix by a scalar, in place (A *= s).
+
+		Args:
+			scalar (float): The scalar to multiply each element by.
+		Returns:
+			Matrix: self, with its storage updated.
+		"""
+		if not isinstance(scalar, (int, float)):
+			return NotImplemented
+		buf = self._buf
+		for span, _ in self._spans():
+			buf[span] = array('d', [scalar * x for x in buf[span]])
+		return self
+
+	def axpy(self, a, x):
+		"""
+		Accumulate a scaled matrix in place: self += a * x (fused multiply-add per element).
+
+		Args:
+			a (float): The scalar applied to x.
+			x (Matrix): The matrix to accumulate.
+		Returns:
+			Matrix: self, with its storage updated.
+		Raises:
+			ValueError: If x is not a Matrix of the same shape.
+		"""
+		if not isinstance(x, Matrix):
+			raise ValueError("Argument must be a Matrix.")
+		return self._combine_inplace(x, lambda mine, theirs: map(fma, theirs, repeat(a), mine))
+
 	def __eq__(self, other):
 		"""
 		Check if two matrices are equal within a small tolerance.
@@ -444,17 +1405,17 @@ class Matrix:
 		Args:
 			other (Matrix): The matrix to compare with.
 		Returns:
-			bool: True if matrices are equal, False otherwise.
+			bool: True if matrices are equal, False otherwise (NotImplemented for
+				non-Matrix operands, so e.g. SparseMatrix.__eq__ gets to compare).
 		"""
 		if not isinstance(other, Matrix):
-			return False
+			return NotImplemented
 		if self.shape() != other.shape():
 			return False
-		
-		for i in range(len(self.data)):
-			for j in range(len(self.data[i])):
-				if abs(self.data[i][j] - other.data[i][j]) > 1e-6:
-					return False
+
+		for a, b in zip(self._packed(), other._packed()):
+			if abs(a - b) > 1e-6:
+				return False
 		return True
 
 	def shape(self):
@@ -464,10 +1425,8 @@ class Matrix:
 		Returns:
 			tuple: A tuple (rows, cols) representing the shape of the matrix.
 		"""
-		if not self.data:
-			return (0, 0)
-		return (len(self.data[0]), len(self.data))  # (rows, cols)
-	
+		return (self._rows, self._cols)
+
 	def is_square(self):
 		"""
 		Check if the matrix is square (number of rows equals number of columns).
@@ -475,28 +1434,23 @@ class Matrix:
 		Returns:
 			bool: True if the matrix is square, False otherwise.
 		"""
-		if not self.data:
+		if not self._rows or not self._cols:
 			return False
-		rows, cols = self.shape()
-		return rows == cols
+		return self._rows == self._cols
 
 	def __str__(self):
-		if not self.data:
+		if not self._rows or not self._cols:
 			return "M[]"
-		rows, cols = self.shape()
 		lines = []
-		for i in range(rows):
-			row = [str(self.data[j][i]) for j in range(cols)]
-			lines.append("[" + ", ".join(row) + "]")
+		for i in range(self._rows):
+			lines.append("[" + ", ".join(map(str, self._row(i))) + "]")
 		return "\n".join(lines)
-	
+
 	def to_vector(self):
-		""" 
+		"""
 		Convert the matrix into a vector by flattening its elements.
 
 		Returns:
 			Vector: A new Vector instance containing all elements of the matrix in a single list.
 		"""
-		from Vector import Vector
-		flat = [elem for col in self.data for elem in col]
-		return Vector(flat)
+		return Vector._wrap(self._packed().tolist())
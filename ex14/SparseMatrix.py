@@ -0,0 +1,421 @@
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from math import fma
+import lazy
+from Matrix import Matrix
+from Vector import Vector
+
+class SparseMatrix:
+	"""
+	Sparse real matrix in Compressed Sparse Column (CSC) format.
+
+	Storage layout (mirrors the column-major layout of Matrix, zeros omitted):
+	- `values` (array('d')): the nonzero entries, column after column.
+	- `rowind` (array('q')): row index of each entry, ascending within a column.
+	- `colptr` (array('q')): entries of column j are values[colptr[j]:colptr[j + 1]].
+	"""
+
+	def __init__(self, rows, cols, colptr, rowind, values):
+		"""
+		Initialize the SparseMatrix from raw CSC arrays.
+
+		Args:
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			colptr (sequence): cols + 1 column start offsets (colptr[0] == 0, non-decreasing).
+			rowind (sequence): Row index of each stored entry (ascending within each column).
+			values (sequence): Stored entries.
+		Raises:
+			ValueError: If the arrays are inconsistent with each other or with the shape.
+		"""
+		if rows < 0 or cols < 0:
+			raise ValueError("Shape must be non-negative.")
+		colptr = array('q', colptr)
+		rowind = array('q', rowind)
+		values = array('d', values)
+		if len(colptr) != cols + 1 or colptr[0] != 0 or colptr[-1] != len(values):
+			raise ValueError("colptr must hold cols + 1 offsets from 0 to the number of stored entries.")
+		if len(rowind) != len(values):
+			raise ValueError("rowind and values must have the same length.")
+		for j in range(cols):
+			start, end = colptr[j], colptr[j + 1]
+			if start > end:
+				raise ValueError(f"colptr must be non-decreasing (column {j}).")
+			for p in range(start, end):
+				if not (0 <= rowind[p] < rows) or (p > start and rowind[p] <= rowind[p - 1]):
+					raise ValueError(f"Row indices of column {j} must be in range and strictly ascending.")
+		self._init_storage(rows, cols, colptr, rowind, values)
+
+	def _init_storage(self, rows, cols, colptr, rowind, values):
+		self.rows = rows
+		self.cols = cols
+		self.colptr = colptr
+		self.rowind = rowind
+		self.values = values
+
+	@classmethod
+	def _wrap(cls, rows, cols, colptr, rowind, values):
+		"""
+		Create a SparseMatrix around already valid CSC arrays without copying or checking them.
+		"""
+		m = cls.__new__(cls)       # bypass __init__
+		m._init_storage(rows, cols, colptr, rowind, values)
+		return m
+
+	@classmethod
+	def _from_column_dicts(cls, rows, columns):
+		"""
+		Build a SparseMatrix from one {row: value} dict per column, dropping zeros.
+		"""
+		colptr, rowind, values = array('q', [0]), array('q'), array('d')
+		for column in columns:
+			for i in sorted(column):
+				v = column[i]
+				if v:
+					rowind.append(i)
+					values.append(v)
+			colptr.append(len(values))
+		return cls._wrap(rows, len(columns), colptr, rowind, values)
+
+	@classmethod
+	def from_triplets(cls, rows, cols, entries):
+		"""
+		Create a SparseMatrix from (row, column, value) triplets.
+
+		Args:
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			entries (iterable): (i, j, value) triplets; duplicates are summed, zeros dropped.
+		Raises:
+			IndexError: If a triplet lies outside the shape.
+		"""
+		columns = [{} for _ in range(cols)]
+		for i, j, v in entries:
+			if not (0 <= i < rows and 0 <= j < cols):
+				raise IndexError("Matrix index out of range")
+			column = columns[j]
+			column[i] = column.get(i, 0.0) + v
+		return cls._from_column_dicts(rows, columns)
+
+	@classmethod
+	def from_dense(cls, matrix):
+		"""
+		Convert a dense Matrix to CSC, keeping only its nonzero entries.
+
+		Args:
+			matrix (Matrix): The dense matrix.
+		Returns:
+			SparseMatrix: The sparse equivalent.
+		"""
+		if not isinstance(matrix, Matrix):
+			raise ValueError("Argument must be a Matrix.")
+		rows, cols = matrix.shape()
+		colptr, rowind, values = array('q', [0]), array('q'), array('d')
+		for j in range(cols):
+			col = matrix._col(j)
+			nonzero = [i for i, v in enumerate(col) if v]
+			rowind.extend(nonzero)
+			values.extend(col[i] for i in nonzero)
+			colptr.append(len(values))
+		return cls._wrap(rows, cols, colptr, rowind, values)
+
+	def to_dense(self):
+		"""
+		Convert to a dense Matrix.
+
+		Returns:
+			Matrix: The dense equivalent.
+		"""
+		rows = self.rows
+		buf = array('d', bytes(8 * rows * self.cols))
+		colptr, rowind, values = self.colptr, self.rowind, self.values
+		for j in range(self.cols):
+			base = j * rows
+			for p in range(colptr[j], colptr[j + 1]):
+				buf[base + rowind[p]] = values[p]
+		return Matrix._wrap(buf, rows, self.cols)
+
+	def shape(self):
+		"""
+		Get the shape of the matrix as (number of rows, number of columns).
+
+		Returns:
+			tuple: A tuple (rows, cols) representing the shape of the matrix.
+		"""
+		return (self.rows, self.cols)
+
+	def nnz(self):
+		"""
+		Number of stored (nonzero) entries.
+
+		Returns:
+			int: The number of stored entries.
+		"""
+		return len(self.values)
+
+	def is_square(self):
+		"""
+		Check if the matrix is square (number of rows equals number of columns).
+
+		Returns:
+			bool: True if the matrix is square, False otherwise.
+		"""
+		return self.rows > 0 and self.rows == self.cols
+
+	def __getitem__(self, key):
+		"""
+		Read element (i, j) (binary search within column j).
+
+		Raises:
+			IndexError: If the indices are out of range.
+		"""
+		i, j = key
+		if not (0 <= i < self.rows and 0 <= j < self.cols):
+			raise IndexError("Matrix index out of range")
+		start, end = self.colptr[j], self.colptr[j + 1]
+		p = bisect_left(self.rowind, i, start, end)
+		if p < end and self.rowind[p] == i:
+			return self.values[p]
+		return 0.0
+
+	def _column(self, j):
+		"""
+		Return (row indices, values) of the stored entries of column j.
+		"""
+		start, end = self.colptr[j], self.colptr[j + 1]
+		return self.rowind[start:end], self.values[start:end]
+
+	def mul_vec(self, vector):
+		"""
+		Multiply the matrix (m×n) by a vector (size n).
+
+		Only stored entries are visited: y += x_j * (column j) for every nonzero x_j.
+		Args:
+			vector (Vector): The vector (size n).
+		Returns:
+			Vector: A new Vector (size m).
+		Raises:
+			ValueError: If the operand is not a Vector or has the wrong size.
+		"""
+		if not isinstance(vector, Vector):
+			raise ValueError("The operand must be a Vector.")
+		if vector.size() != self.cols:
+			raise ValueError(f"Incompatible dimensions: matrix has {self.cols} cols, vector has size {vector.size()}")
+		return Vector._wrap(self._mul_list(vector.data))
+
+	def _mul_list(self, x):
+		"""
+		Sparse product with a dense column given as a sequence; returns a list.
+		"""
+		y = [0.0] * self.rows
+		colptr, rowind, values = self.colptr, self.rowind, self.values
+		for j, xj in enumerate(x):
+			if xj:
+				for p in range(colptr[j], colptr[j + 1]):
+					y[rowind[p]] += values[p] * xj
+		return y
+
+	def mul_mat(self, mat):
+		"""
+		Multiply this sparse matrix A (m×n) by a matrix B (n×p).
+
+		Args:
+			mat (Matrix or SparseMatrix): The right-hand operand B.
+		Returns:
+			Matrix: A dense result if B is dense.
+			SparseMatrix: A sparse result if B is sparse.
+		Raises:
+			ValueError: If the operand type or dimensions are incompatible.
+		"""
+		if not isinstance(mat, (Matrix, SparseMatrix)):
+			raise ValueError("Argument must be a Matrix or a SparseMatrix.")
+		rows_B, cols_B = mat.shape()
+		if self.cols != rows_B:
+			raise ValueError(f"Incompatible dimensions: A is {self.rows}x{self.cols}, B is {rows_B}x{cols_B}")
+
+		if isinstance(mat, Matrix):
+			buf = array('d')
+			for j in range(cols_B):
+				buf.extend(self._mul_list(mat._col(j)))
+			return Matrix._wrap(buf, self.rows, cols_B)
+
+		# sparse · sparse: accumulate each result column in a dict keyed by row
+		colptr, rowind, values = self.colptr, self.rowind, self.values
+		columns = []
+		for j in range(cols_B):
+			acc = {}
+			b_rows, b_vals = mat._column(j)
+			for k, b in zip(b_rows, b_vals):
+				for p in range(colptr[k], colptr[k + 1]):
+					i = rowind[p]
+					acc[i] = acc.get(i, 0.0) + values[p] * b
+			columns.append(acc)
+		return SparseMatrix._from_column_dicts(self.rows, columns)
+
+	def _rmul_dense(self, mat):
+		"""
+		Dense · sparse product C = B·A, B being a dense Matrix (m×n) and A this matrix (n×p).
+
+		Column j of C combines the columns of B selected by the entries of A's column j.
+		"""
+		rows_B, cols_B = mat.shape()
+		if cols_B != self.rows:
+			raise ValueError(f"Incompatible dimensions: A is {rows_B}x{cols_B}, B is {self.rows}x{self.cols}")
+		b_cols = [mat._col(k) for k in range(cols_B)]
+		buf = array('d')
+		for j in range(self.cols):
+			acc = [0.0] * rows_B
+			for k, a in zip(*self._column(j)):
+				acc = list(map(fma, b_cols[k], repeat(a), acc))
+			buf.extend(acc)
+		return Matrix._wrap(buf, rows_B, self.cols)
+
+	def transpose(self):
+		"""
+		Return the transpose, still in CSC format (O(nnz) counting sort by row).
+
+		Returns:
+			SparseMatrix: The transposed matrix.
+		"""
+		rows, cols = self.rows, self.cols
+		counts = [0] * (rows + 1)
+		for i in self.rowind:
+			counts[i + 1] += 1
+		for i in range(rows):
+			counts[i + 1] += counts[i]
+		colptr = array('q', counts)
+
+		nnz = len(self.values)
+		rowind = array('q', bytes(8 * nnz))
+		values = array('d', bytes(8 * nnz))
+		nxt = counts[:rows]
+		for j in range(cols):
+			for p in range(self.colptr[j], self.colptr[j + 1]):
+				q = nxt[self.rowind[p]]
+				rowind[q] = j
+				values[q] = self.values[p]
+				nxt[self.rowind[p]] = q + 1
+		return SparseMatrix._wrap(cols, rows, colptr, rowind, values)
+
+	def _combine(self, other, sign):
+		"""
+		Sparse self + sign * other, merging the sorted entries column by column.
+		"""
+		if self.shape() != other.shape():
+			raise ValueError("Matrices must have the same shape.")
+		colptr, rowind, values = array('q', [0]), array('q'), array('d')
+		for j in range(self.cols):
+			a_rows, a_vals = self._column(j)
+			b_rows, b_vals = other._column(j)
+			p = q = 0
+			while p < len(a_rows) or q < len(b_rows):
+				if q == len(b_rows) or (p < len(a_rows) and a_rows[p] < b_rows[q]):
+					i, v = a_rows[p], a_vals[p]
+					p += 1
+				elif p == len(a_rows) or b_rows[q] < a_rows[p]:
+					i, v = b_rows[q], sign * b_vals[q]
+					q += 1
+				else:
+					i, v = a_rows[p], a_vals[p] + sign * b_vals[q]
+					p += 1
+					q += 1
+				if v:
+					rowind.append(i)
+					values.append(v)
+			colptr.append(len(values))
+		return SparseMatrix._wrap(self.rows, self.cols, colptr, rowind, values)
+
+	@staticmethod
+	def _dense_combine(a, b, sign):
+		"""
+		Dense a + b or a - b as a concrete Matrix (never a deferred lazy.Expr).
+		"""
+		with lazy.eager():
+			return a + b if sign > 0 else a - b
+
+	def __add__(self, other):
+		"""
+		Add element-wise.
+
+		Args:
+			other (SparseMatrix or Matrix): The matrix to add.
+		Returns:
+			SparseMatrix: If other is sparse.
+			Matrix: A dense result if other is dense.
+		"""
+		if isinstance(other, SparseMatrix):
+			return self._combine(other, 1.0)
+		if isinstance(other, Matrix):
+			return SparseMatrix._dense_combine(self.to_dense(), other, 1)
+		return NotImplemented
+
+	def __radd__(self, other):
+		if isinstance(other, Matrix):
+			return SparseMatrix._dense_combine(other, self.to_dense(), 1)
+		return NotImplemented
+
+	def __sub__(self, other):
+		"""
+		Subtract element-wise.
+
+		Args:
+			other (SparseMatrix or Matrix): The matrix to subtract.
+		Returns:
+			SparseMatrix: If other is sparse.
+			Matrix: A dense result if other is dense.
+		"""
+		if isinstance(other, SparseMatrix):
+			return self._combine(other, -1.0)
+		if isinstance(other, Matrix):
+			return SparseMatrix._dense_combine(self.to_dense(), other, -1)
+		return NotImplemented
+
+	def __rsub__(self, other):
+		if isinstance(other, Matrix):
+			return SparseMatrix._dense_combine(other, self.to_dense(), -1)
+		return NotImplemented
+
+	def scl(self, scalar):
+		"""
+		Scale the matrix by a scalar (the sparsity pattern is kept unless scalar is 0).
+
+		Args:
+			scalar (float): The scalar to multiply each element by.
+		Returns:
+			SparseMatrix: A new scaled SparseMatrix.
+		"""
+		if not scalar:
+			return SparseMatrix._wrap(self.rows, self.cols, array('q', bytes(8 * (self.cols + 1))), array('q'), array('d'))
+		values = array('d', [scalar * v for v in self.values])
+		return SparseMatrix._wrap(self.rows, self.cols, self.colptr[:], self.rowind[:], values)
+
+	def trace(self):
+		"""
+		Calculate the trace of the matrix (sum of diagonal elements).
+
+		Returns:
+			float: The trace of the matrix.
+		Raises:
+			ValueError: If the matrix is not square.
+		"""
+		if not self.is_square():
+			raise ValueError("Trace is only defined for square matrices.")
+		return sum(self[j, j] for j in range(self.cols))
+
+	def __eq__(self, other):
+		"""
+		Check if two matrices (sparse or dense) are equal within a small tolerance.
+		"""
+		if isinstance(other, Matrix):
+			other = SparseMatrix.from_dense(other)
+		if not isinstance(other, SparseMatrix) or self.shape() != other.shape():
+			return False
+		return all(abs(v) <= 1e-6 for v in (self - other).values)
+
+	def __str__(self):
+		lines = [f"SparseMatrix {self.rows}x{self.cols}, {self.nnz()} nonzeros"]
+		for j in range(self.cols):
+			for i, v in zip(*self._column(j)):
+				lines.append(f"({i}, {j}) {v}")
+		return "\n".join(lines)
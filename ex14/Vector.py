@@ -1,4 +1,9 @@
+from array import array
+from itertools import repeat
 from math import fma
+from operator import add, sub
+import backend
+import lazy
 
 def my_abs(x):
     return x if x >= 0 else -x
@@ -19,6 +24,16 @@ class Vector:
             raise ValueError("Data must be a list.")
         self.data = data[:]
 
+    @classmethod
+    def _wrap(cls, data):
+        """
+        Create a Vector that takes ownership of a freshly built list, without copying
+        or validating it (for internal results).
+        """
+        v = cls.__new__(cls)       # bypass __init__
+        v.data = data
+        return v
+
     def __add__(self, other):
         """
         Add two vectors element-wise.
@@ -30,7 +45,9 @@ class Vector:
         """
         if not isinstance(other, Vector):
             return NotImplemented
-        return Vector([a + b for a, b in zip(self.data, other.data)])
+        if lazy.deferring():
+            return lazy.Expr(self) + other
+        return Vector._wrap([a + b for a, b in zip(self.data, other.data)])
 
     def __sub__(self, other):
         """
@@ -43,7 +60,9 @@ class Vector:
         """
         if not isinstance(other, Vector):
             return NotImplemented
-        return Vector([a - b for a, b in zip(self.data, other.data)])
+        if lazy.deferring():
+            return lazy.Expr(self) - other
+        return Vector._wrap([a - b for a, b in zip(self.data, other.data)])
     
     def scl(self, scalar):
         """
@@ -54,8 +73,79 @@ class Vector:
         Returns:
             Vector: A new Vector instance representing the scaled vector.
         """
-        return Vector([scalar * x for x in self.data])
+        if lazy.deferring():
+            return lazy.Expr(self).scl(scalar)
+        return Vector._wrap([scalar * x for x in self.data])
     
+    def __iadd__(self, other):
+        """
+        Add another vector element-wise, in place (u += v).
+
+        Args:
+            other (Vector): The vector to add.
+        Returns:
+            Vector: self, with its data updated in place.
+        Raises:
+            ValueError: If vectors are of different sizes.
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        if len(self.data) != len(other.data):
+            raise ValueError("Vectors must be the same size.")
+        self.data[:] = map(add, self.data, other.data)
+        return self
+
+    def __isub__(self, other):
+        """
+        Subtract another vector element-wise, in place (u -= v).
+
+        Args:
+            other (Vector): The vector to subtract.
+        Returns:
+            Vector: self, with its data updated in place.
+        Raises:
+            ValueError: If vectors are of different sizes.
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        if len(self.data) != len(other.data):
+            raise ValueError("Vectors must be the same size.")
+        self.data[:] = map(sub, self.data, other.data)
+        return self
+
+    def __imul__(self, scalar):
+        """
+        Scale the vector by a scalar, in place (u *= s).
+
+        Args:
+            scalar (float): The scalar to multiply each element by.
+        Returns:
+            Vector: self, with its data updated in place.
+        """
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        self.data[:] = [scalar * x for x in self.data]
+        return self
+
+    def axpy(self, a, x):
+        """
+        Accumulate a scaled vector in place: self += a * x (fused multiply-add per element).
+
+        Args:
+            a (float): The scalar applied to x.
+            x (Vector): The vector to accumulate.
+        Returns:
+            Vector: self, with its data updated in place.
+        Raises:
+            ValueError: If x is not a Vector of the same size.
+        """
+        if not isinstance(x, Vector):
+            raise ValueError("The operand must be a Vector.")
+        if len(self.data) != len(x.data):
+            raise ValueError("Vectors must be the same size.")
+        self.data[:] = map(fma, x.data, repeat(a), self.data)
+        return self
+
     def __eq__(self, other):
         """
         Compare two vectors for equality, handling float/int comparisons.
@@ -88,6 +178,9 @@ class Vector:
         """
         if not isinstance(other, Vector):
             raise ValueError("The operand must be a Vector.")
+        np = backend.active_numpy()
+        if np is not None:
+            return float(np.dot(np.asarray(self.data, dtype=np.float64), np.asarray(other.data, dtype=np.float64)))
         result = 0.0
         for i in range(len(self.data)):
             result = fma(self.data[i], other.data[i], result)
@@ -102,6 +195,9 @@ class Vector:
         """
         if not self.data:
             return 0.0
+        np = backend.active_numpy()
+        if np is not None:
+            return float(np.abs(np.asarray(self.data, dtype=np.float64)).sum())
         result = 0.0
         for i in range(len(self.data)):
             result = fma(my_abs(self.data[i]), 1.0, result)
@@ -116,6 +212,9 @@ class Vector:
         """
         if not self.data:
             return 0.0
+        np = backend.active_numpy()
+        if np is not None:
+            return float(np.linalg.norm(np.asarray(self.data, dtype=np.float64)))
         result = 0.0
         for i in range(len(self.data)):
             result = fma(self.data[i], self.data[i], result)
@@ -130,6 +229,9 @@ class Vector:
         """
         if not self.data:
             return 0.0
+        np = backend.active_numpy()
+        if np is not None:
+            return float(np.abs(np.asarray(self.data, dtype=np.float64)).max())
         return max(my_abs(x) for x in self.data)
 
 
@@ -159,13 +261,134 @@ class Vector:
         Returns:
             Matrix: A new Matrix instance with the specified dimensions.
         Raises:
-            ValueError: If the vector size does not match rows * cols.
+            ValueError: If rows or cols is not positive, or the vector size does not match rows * cols.
         """
         from Matrix import Matrix
+        if rows <= 0 or cols <= 0:
+            raise ValueError("Matrix dimensions must be positive.")
         if self.size() != rows * cols:
             raise ValueError("Cannot reshape vector to the specified matrix dimensions.")
-        matrix_data = []
-        for i in range(rows):
-            row = self.data[i*cols:(i+1)*cols]
-            matrix_data.append(row)
-        return Matrix(matrix_data)
\ No newline at end of file
+        # the data is row-major; gather each column straight into the matrix buffer
+        buf = array('d')
+        for j in range(cols):
+            buf.extend(self.data[j::cols])
+        return Matrix._wrap(buf, rows, cols)
+
+class FrozenVector(Vector):
+    """
+    Immutable, hashable Vector that caches its norms and normalized form.
+
+    The data is stored as a tuple, so a FrozenVector can be used as a dict key or set
+    member. Norms, the dot product with itself and the normalized vector are computed
+    on first use and then served from a cache. Equality between FrozenVectors is exact
+    (consistent with the hash); comparing with a plain Vector keeps the tolerance.
+    """
+
+    def __init__(self, data):
+        """
+        Initialize the FrozenVector.
+
+        Args:
+            data (Vector or iterable): The elements.
+        Raises:
+            ValueError: If data is empty.
+        """
+        values = tuple(data.data if isinstance(data, Vector) else data)
+        if not values:
+            raise ValueError("Data cannot be empty.")
+        object.__setattr__(self, 'data', values)
+        object.__setattr__(self, '_cache', {})
+
+    @classmethod
+    def _wrap(cls, data):
+        return cls(data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenVector is immutable.")
+
+    def __hash__(self):
+        return self._cached('hash', lambda: hash(self.data))
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenVector):
+            return self.data == other.data
+        return super().__eq__(other)
+
+    def _cached(self, key, compute):
+        """
+        Return the cached value for key, computing and storing it on first use.
+        """
+        cache = self._cache
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    def __iadd__(self, other):
+        return NotImplemented # falls back to +, rebinding the name to a new Vector
+
+    def __isub__(self, other):
+        return NotImplemented
+
+    def __imul__(self, scalar):
+        return NotImplemented
+
+    def axpy(self, a, x):
+        raise ValueError("FrozenVector is immutable.")
+
+    def dot(self, other):
+        """
+        Compute the dot product of two vectors (cached when other is self).
+
+        Args:
+            other (Vector): The vector to compute the dot product with.
+        Returns:
+            float: The dot product result.
+        """
+        if other is self:
+            return self.norm_sq()
+        return super().dot(other)
+
+    def norm_sq(self):
+        """
+        Squared Euclidean norm (the dot product with itself), cached.
+
+        Returns:
+            float: The squared norm.
+        """
+        return self._cached('norm_sq', lambda: super(FrozenVector, self).dot(self))
+
+    def norm_1(self):
+        return self._cached('norm_1', super().norm_1)
+
+    def norm(self):
+        return self._cached('norm', super().norm)
+
+    def norm_inf(self):
+        return self._cached('norm_inf', super().norm_inf)
+
+    def normalized(self):
+        """
+        Unit vector in the same direction, cached.
+
+        Returns:
+            FrozenVector: self scaled to unit length.
+        Raises:
+            ValueError: If the vector is zero.
+        """
+        def compute():
+            n = self.norm()
+            if not n:
+                raise ValueError("Cannot normalize a zero vector.")
+            unit = FrozenVector(x / n for x in self.data)
+            unit._cache['norm'] = 1.0
+            return unit
+        return self._cached('normalized', compute)
+
+    def thaw(self):
+        """
+        Return a mutable Vector copy.
+        """
+        return Vector._wrap(list(self.data))
+
+    def to_matrix(self, rows, cols):
+        return self.thaw().to_matrix(rows, cols)
@@ -0,0 +1,420 @@
+"""
+Fixed-size Vec3, Vec4 and Mat4 types for the per-frame 3D graphics path.
+
+They hold plain float fields in __slots__ and spell every operation out by hand
+(no loops, no shape checks, no backend dispatch), which is what makes small 4x4
+math fast in Python. Mat4 keeps the column-major element order used by Matrix,
+and each type converts to and from its generic counterpart:
+
+	mvp = Mat4.from_matrix(projection(fov, ratio, near, far)) @ view
+	p = mvp.transform_point(Vec3(1.0, 2.0, -5.0))
+"""
+from array import array
+from math import sqrt
+from Matrix import Matrix
+from Vector import Vector
+
+
+class Vec3:
+	"""
+	3D vector with unrolled arithmetic.
+	"""
+	__slots__ = ('x', 'y', 'z')
+
+	def __init__(self, x, y, z):
+		self.x = x
+		self.y = y
+		self.z = z
+
+	@classmethod
+	def from_vector(cls, vector):
+		"""
+		Create a Vec3 from a generic Vector of size 3.
+
+		Raises:
+			ValueError: If the vector does not have 3 components.
+		"""
+		if vector.size() != 3:
+			raise ValueError("Vec3 requires a Vector of size 3.")
+		return cls(*vector.data)
+
+	def to_vector(self):
+		"""
+		Convert to a generic Vector.
+		"""
+		return Vector._wrap([self.x, self.y, self.z])
+
+	def __iter__(self):
+		return iter((self.x, self.y, self.z))
+
+	def __add__(self, other):
+		return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+	def __sub__(self, other):
+		return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+	def __neg__(self):
+		return Vec3(-self.x, -self.y, -self.z)
+
+	def scl(self, scalar):
+		return Vec3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+	def dot(self, other):
+		return self.x * other.x + self.y * other.y + self.z * other.z
+
+	def cross(self, other):
+		"""
+		Cross product self × other.
+		"""
+		ax, ay, az = self.x, self.y, self.z
+		bx, by, bz = other.x, other.y, other.z
+		return Vec3(ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
+
+	def norm(self):
+		return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+	def normalized(self):
+		"""
+		Unit vector in the same direction.
+
+		Raises:
+			ValueError: If the vector is zero.
+		"""
+		n = self.norm()
+		if n == 0:
+			raise ValueError("Cannot normalize a zero vector.")
+		return Vec3(self.x / n, self.y / n, self.z / n)
+
+	def __eq__(self, other):
+		if not isinstance(other, Vec3):
+			return False
+		return (abs(self.x - other.x) <= 1e-6 and abs(self.y - other.y) <= 1e-6
+			and abs(self.z - other.z) <= 1e-6)
+
+	def __str__(self):
+		return f"[{self.x}, {self.y}, {self.z}]"
+
+	__repr__ = __str__
+
+
+class Vec4:
+	"""
+	4D (homogeneous) vector with unrolled arithmetic.
+	"""
+	__slots__ = ('x', 'y', 'z', 'w')
+
+	def __init__(self, x, y, z, w):
+		self.x = x
+		self.y = y
+		self.z = z
+		self.w = w
+
+	@classmethod
+	def from_vector(cls, vector):
+		"""
+		Create a Vec4 from a generic Vector of size 4.
+
+		Raises:
+			ValueError: If the vector does not have 4 components.
+		"""
+		if vector.size() != 4:
+			raise ValueError("Vec4 requires a Vector of size 4.")
+		return cls(*vector.data)
+
+	def to_vector(self):
+		"""
+		Convert to a generic Vector.
+		"""
+		return Vector._wrap([self.x, self.y, self.z, self.w])
+
+	def __iter__(self):
+		return iter((self.x, self.y, self.z, self.w))
+
+	def __add__(self, other):
+		return Vec4(self.x + other.x, self.y + other.y, self.z + other.z, self.w + other.w)
+
+	def __sub__(self, other):
+		return Vec4(self.x - other.x, self.y - other.y, self.z - other.z, self.w - other.w)
+
+	def __neg__(self):
+		return Vec4(-self.x, -self.y, -self.z, -self.w)
+
+	def scl(self, scalar):
+		return Vec4(self.x * scalar, self.y * scalar, self.z * scalar, self.w * scalar)
+
+	def dot(self, other):
+		return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+
+	def norm(self):
+		return sqrt(self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w)
+
+	def perspective_divide(self):
+		"""
+		Project back to 3D by dividing x, y and z by w.
+
+		Raises:
+			ValueError: If w is zero.
+		"""
+		w = self.w
+		if w == 0:
+			raise ValueError("Cannot divide by a zero w component.")
+		return Vec3(self.x / w, self.y / w, self.z / w)
+
+	def __eq__(self, other):
+		if not isinstance(other, Vec4):
+			return False
+		return (abs(self.x - other.x) <= 1e-6 and abs(self.y - other.y) <= 1e-6
+			and abs(self.z - other.z) <= 1e-6 and abs(self.w - other.w) <= 1e-6)
+
+	def __str__(self):
+		return f"[{self.x}, {self.y}, {self.z}, {self.w}]"
+
+	__repr__ = __str__
+
+
+class Mat4:
+	"""
+	4x4 matrix with unrolled products, determinant and inverse.
+
+	Attributes:
+		m (tuple): The 16 elements in column-major order; element (i, j) is m[4*j + i].
+	"""
+	__slots__ = ('m',)
+
+	def __init__(self, m):
+		"""
+		Args:
+			m (iterable): 16 elements in column-major order.
+		Raises:
+			ValueError: If m does not have exactly 16 elements.
+		"""
+		m = tuple(m)
+		if len(m) != 16:
+			raise ValueError("Mat4 requires exactly 16 elements.")
+		self.m = m
+
+	@classmethod
+	def _wrap(cls, m):
+		"""
+		Create a Mat4 around a 16-tuple without checking it.
+		"""
+		mat = cls.__new__(cls)       # bypass __init__
+		mat.m = m
+		return mat
+
+	@classmethod
+	def identity(cls):
+		return cls._wrap((1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0))
+
+	@classmethod
+	def from_matrix(cls, mat):
+		"""
+		Create a Mat4 from a generic 4x4 Matrix.
+
+		Raises:
+			ValueError: If the matrix is not 4x4.
+		"""
+		if mat.shape() != (4, 4):
+			raise ValueError("Mat4 requires a 4x4 Matrix.")
+		return cls._wrap(tuple(mat._packed()))
+
+	def to_matrix(self):
+		"""
+		Convert to a generic Matrix.
+		"""
+		return Matrix._wrap(array('d', self.m), 4, 4)
+
+	def __getitem__(self, idx):
+		i, j = idx
+		return self.m[4 * j + i]
+
+	def shape(self):
+		return (4, 4)
+
+	def __add__(self, other):
+		return Mat4._wrap(tuple(a + b for a, b in zip(self.m, other.m)))
+
+	def __sub__(self, other):
+		return Mat4._wrap(tuple(a - b for a, b in zip(self.m, other.m)))
+
+	def scl(self, scalar):
+		return Mat4._wrap(tuple(a * scalar for a in self.m))
+
+	def mul_mat(self, other):
+		"""
+		Matrix product self · other.
+
+		Args:
+			other (Mat4): The right operand.
+		Returns:
+			Mat4: The product.
+		"""
+		a00, a10, a20, a30, a01, a11, a21, a31, a02, a12, a22, a32, a03, a13, a23, a33 = self.m
+		b00, b10, b20, b30, b01, b11, b21, b31, b02, b12, b22, b32, b03, b13, b23, b33 = other.m
+		return Mat4._wrap((
+			a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+			a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+			a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+			a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+			a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+			a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+			a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+			a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+			a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+			a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+			a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+			a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+			a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+			a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+			a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+			a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33,
+		))
+
+	def mul_vec(self, v):
+		"""
+		Transform a homogeneous vector: self · v.
+
+		Args:
+			v (Vec4): The vector.
+		Returns:
+			Vec4: The transformed vector.
+		"""
+		a00, a10, a20, a30, a01, a11, a21, a31, a02, a12, a22, a32, a03, a13, a23, a33 = self.m
+		x, y, z, w = v.x, v.y, v.z, v.w
+		return Vec4(
+			a00 * x + a01 * y + a02 * z + a03 * w,
+			a10 * x + a11 * y + a12 * z + a13 * w,
+			a20 * x + a21 * y + a22 * z + a23 * w,
+			a30 * x + a31 * y + a32 * z + a33 * w,
+		)
+
+	def __matmul__(self, other):
+		if isinstance(other, Mat4):
+			return self.mul_mat(other)
+		if isinstance(other, Vec4):
+			return self.mul_vec(other)
+		return NotImplemented
+
+	def transform_point(self, p):
+		"""
+		Transform a 3D point (w = 1), dividing by the resulting w when it is not 1.
+
+		Args:
+			p (Vec3): The point.
+		Returns:
+			Vec3: The transformed point.
+		Raises:
+			ValueError: If the resulting w is zero.
+		"""
+		a00, a10, a20, a30, a01, a11, a21, a31, a02, a12, a22, a32, a03, a13, a23, a33 = self.m
+		x, y, z = p.x, p.y, p.z
+		w = a30 * x + a31 * y + a32 * z + a33
+		if w == 0:
+			raise ValueError("Point maps to infinity (w = 0).")
+		rx = a00 * x + a01 * y + a02 * z + a03
+		ry = a10 * x + a11 * y + a12 * z + a13
+		rz = a20 * x + a21 * y + a22 * z + a23
+		if w == 1:
+			return Vec3(rx, ry, rz)
+		return Vec3(rx / w, ry / w, rz / w)
+
+	def transform_dir(self, d):
+		"""
+		Transform a 3D direction (w = 0): only the upper-left 3x3 block applies.
+
+		Args:
+			d (Vec3): The direction.
+		Returns:
+			Vec3: The transformed direction.
+		"""
+		m = self.m
+		x, y, z = d.x, d.y, d.z
+		return Vec3(
+			m[0] * x + m[4] * y + m[8] * z,
+			m[1] * x + m[5] * y + m[9] * z,
+			m[2] * x + m[6] * y + m[10] * z,
+		)
+
+	def transpose(self):
+		a00, a10, a20, a30, a01, a11, a21, a31, a02, a12, a22, a32, a03, a13, a23, a33 = self.m
+		return Mat4._wrap((a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33))
+
+	def trace(self):
+		m = self.m
+		return m[0] + m[5] + m[10] + m[15]
+
+	def _minors(self):
+		"""
+		The twelve 2x2 minors of the top two rows (s) and bottom two rows (c) that
+		both the determinant and the inverse are built from.
+		"""
+		a00, a10, a20, a30, a01, a11, a21, a31, a02, a12, a22, a32, a03, a13, a23, a33 = self.m
+		s = (
+			a00 * a11 - a10 * a01,
+			a00 * a12 - a10 * a02,
+			a00 * a13 - a10 * a03,
+			a01 * a12 - a11 * a02,
+			a01 * a13 - a11 * a03,
+			a02 * a13 - a12 * a03,
+		)
+		c = (
+			a20 * a31 - a30 * a21,
+			a20 * a32 - a30 * a22,
+			a20 * a33 - a30 * a23,
+			a21 * a32 - a31 * a22,
+			a21 * a33 - a31 * a23,
+			a22 * a33 - a32 * a23,
+		)
+		return s, c
+
+	def determinant(self):
+		"""
+		Determinant by Laplace expansion over the top two rows.
+
+		Returns:
+			float: The determinant.
+		"""
+		(s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = self._minors()
+		return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+	def inverse(self):
+		"""
+		Inverse from the adjugate (cofactors of the 2x2 minors) over the determinant.
+
+		Returns:
+			Mat4: The inverse.
+		Raises:
+			ValueError: If the matrix is singular.
+		"""
+		a00, a10, a20, a30, a01, a11, a21, a31, a02, a12, a22, a32, a03, a13, a23, a33 = self.m
+		(s0, s1, s2, s3, s4, s5), (c0, c1, c2, c3, c4, c5) = self._minors()
+		det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+		if abs(det) < 1e-12:
+			raise ValueError("Matrix is singular and cannot be inverted.")
+		r = 1.0 / det
+		return Mat4._wrap((
+			(a11 * c5 - a12 * c4 + a13 * c3) * r,
+			(-a10 * c5 + a12 * c2 - a13 * c1) * r,
+			(a10 * c4 - a11 * c2 + a13 * c0) * r,
+			(-a10 * c3 + a11 * c1 - a12 * c0) * r,
+			(-a01 * c5 + a02 * c4 - a03 * c3) * r,
+			(a00 * c5 - a02 * c2 + a03 * c1) * r,
+			(-a00 * c4 + a01 * c2 - a03 * c0) * r,
+			(a00 * c3 - a01 * c1 + a02 * c0) * r,
+			(a31 * s5 - a32 * s4 + a33 * s3) * r,
+			(-a30 * s5 + a32 * s2 - a33 * s1) * r,
+			(a30 * s4 - a31 * s2 + a33 * s0) * r,
+			(-a30 * s3 + a31 * s1 - a32 * s0) * r,
+			(-a21 * s5 + a22 * s4 - a23 * s3) * r,
+			(a20 * s5 - a22 * s2 + a23 * s1) * r,
+			(-a20 * s4 + a21 * s2 - a23 * s0) * r,
+			(a20 * s3 - a21 * s1 + a22 * s0) * r,
+		))
+
+	def __eq__(self, other):
+		if not isinstance(other, Mat4):
+			return False
+		return all(abs(a - b) <= 1e-6 for a, b in zip(self.m, other.m))
+
+	def __str__(self):
+		return str(self.to_matrix())
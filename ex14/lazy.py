@@ -0,0 +1,203 @@
+"""
+Deferred (lazy) element-wise arithmetic for Matrix and Vector.
+
+Inside a `with deferred():` block, `+`, `-` and `scl` on Matrix and Vector return
+Expr nodes instead of computing a temporary per operator. An expression built
+only from these operators is a linear combination sum(c_k * X_k), so evaluating it
+is a single fused pass over the operands into one output buffer:
+
+	with deferred():
+		e = a + b.scl(2) - c
+	result = e.eval()          # or e.eval(out=a) to write into an existing object
+
+Outside a deferred block, Expr(x) starts an expression explicitly. The mode is held
+in a ContextVar, so a deferred block only affects its own thread (or asyncio task).
+"""
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import repeat
+from math import fma
+from operator import mul
+
+_deferring = ContextVar('deferring', default=False)
+
+
+def deferring():
+	"""
+	Check whether Matrix/Vector arithmetic is currently deferred.
+
+	Returns:
+		bool: True inside a deferred() block (of the current thread or task).
+	"""
+	return _deferring.get()
+
+
+@contextmanager
+def deferred():
+	"""
+	Context manager making `+`, `-` and `scl` on Matrix and Vector return Expr nodes.
+	"""
+	token = _deferring.set(True)
+	try:
+		yield
+	finally:
+		_deferring.reset(token)
+
+
+@contextmanager
+def eager():
+	"""
+	Context manager computing `+`, `-` and `scl` immediately, even inside a deferred() block.
+
+	Used where a concrete result is promised regardless of the caller's mode
+	(e.g. dense results of SparseMatrix arithmetic).
+	"""
+	token = _deferring.set(False)
+	try:
+		yield
+	finally:
+		_deferring.reset(token)
+
+
+def _kind(operand):
+	"""
+	Base class (Matrix or Vector) an operand belongs to, or None for anything else.
+
+	Subclasses (e.g. FrozenVector) mix with their base type as they do eagerly.
+	"""
+	from Matrix import Matrix
+	from Vector import Vector
+	for base in (Matrix, Vector):
+		if isinstance(operand, base):
+			return base
+	return None
+
+
+class Expr:
+	"""
+	Deferred linear combination of same-shaped Matrix or Vector operands.
+
+	Attributes:
+		terms (list): [coefficient, operand] pairs; an operand appears at most once.
+	"""
+
+	def __init__(self, operand):
+		"""
+		Start an expression from a single Matrix or Vector operand (coefficient 1).
+
+		Args:
+			operand (Matrix, Vector or Expr): The operand.
+		"""
+		if isinstance(operand, Expr):
+			self.terms = [term[:] for term in operand.terms]
+		else:
+			self.terms = [[1.0, operand]]
+
+	def shape(self):
+		"""
+		Shape of the result: (rows, cols) for matrices, (size,) for vectors.
+		"""
+		operand = self.terms[0][1]
+		return operand.shape() if hasattr(operand, 'shape') else (operand.size(),)
+
+	def _accumulate(self, other, coef):
+		"""
+		Return a new Expr equal to self + coef * other.
+		"""
+		if not isinstance(other, Expr):
+			kind = _kind(other)
+			if kind is None or kind is not _kind(self.terms[0][1]):
+				return NotImplemented
+			other = Expr(other)
+		if other.shape() != self.shape():
+			raise ValueError("Operands must have the same shape.")
+		result = Expr(self)
+		for c, operand in other.terms:
+			for term in result.terms:
+				if term[1] is operand:
+					term[0] += coef * c
+					break
+			else:
+				result.terms.append([coef * c, operand])
+		return result
+
+	def __add__(self, other):
+		return self._accumulate(other, 1.0)
+
+	def __radd__(self, other):
+		return Expr(other)._accumulate(self, 1.0) if not isinstance(other, Expr) else NotImplemented
+
+	def __sub__(self, other):
+		return self._accumulate(other, -1.0)
+
+	def __rsub__(self, other):
+		return Expr(other)._accumulate(self, -1.0) if not isinstance(other, Expr) else NotImplemented
+
+	def scl(self, scalar):
+		"""
+		Scale the whole expression (only the coefficients change).
+
+		Args:
+			scalar (float): The scalar.
+		Returns:
+			Expr: A new deferred expression.
+		"""
+		result = Expr(self)
+		for term in result.terms:
+			term[0] *= scalar
+		return result
+
+	@staticmethod
+	def _flat(operand):
+		"""
+		Flat column-major view of a Matrix (zero-copy when packed) or the data list of a Vector.
+		"""
+		if hasattr(operand, '_packed'):
+			n = operand._rows * operand._cols
+			if operand._rs == 1 and operand._cs == operand._rows:
+				return memoryview(operand._buf)[operand._off:operand._off + n]
+			return operand._packed()
+		return operand.data
+
+	def eval(self, out=None):
+		"""
+		Materialize the expression in one fused pass over all operands.
+
+		Each output element is c_0 * x_0 + c_1 * x_1 + ... accumulated with fma through
+		chained lazy maps, so no intermediate buffer is built per term.
+
+		Args:
+			out (Matrix or Vector): Optional existing object of the same shape whose storage
+				receives the result (it may also be one of the operands).
+		Returns:
+			Matrix or Vector: The result (out itself when given).
+		"""
+		first = self.terms[0][1]
+		size = len(Expr._flat(first))
+		acc = None
+		for c, operand in self.terms:
+			if not c:
+				continue
+			flat = Expr._flat(operand)
+			acc = map(mul, flat, repeat(c)) if acc is None else map(fma, flat, repeat(c), acc)
+		if acc is None:
+			acc = repeat(0.0, size)
+
+		if hasattr(first, '_packed'):
+			buf = array('d', acc)
+			if out is None:
+				return _kind(first)._wrap(buf, first._rows, first._cols)
+			if out.shape() != self.shape():
+				raise ValueError("Output must have the same shape as the expression.")
+			pos = 0
+			for span, count in out._spans():
+				out._buf[span] = buf[pos:pos + count]
+				pos += count
+			return out
+		if out is None:
+			return _kind(first)._wrap(list(acc))
+		if out.size() != size:
+			raise ValueError("Output must have the same shape as the expression.")
+		out.data[:] = acc
+		return out
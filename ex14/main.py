@@ -1,6 +1,481 @@
-from projection import projection
+from array import array
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+import backend
+import parallel
+from graphics import Mat4, Vec3, Vec4
+from lazy import deferred, deferring
+from projection import Projection, projection
 from Matrix import Matrix
-from math import radians
+from pipeline import VertexPipeline
+from SparseMatrix import SparseMatrix
+from threading import Thread
+from Vector import FrozenVector, Vector
+from math import inf, isclose, isnan, log, radians
+
+class Colors:
+	RED = '\033[91m'
+	GREEN = '\033[92m'
+	BLUE = '\033[94m'
+	BOLD = '\033[1m'
+	UNDERLINE = '\033[4m'
+	HEADER = BOLD + BLUE + UNDERLINE
+	TEST = BLUE + BOLD
+	CORRECT = GREEN
+	EXPECTED = BOLD + UNDERLINE
+	END = '\033[0m'
+
+def print_comparison(label, expected, result, rel_tol=None):
+	if rel_tol is None:
+		is_correct = expected == result
+	else:
+		is_correct = isclose(result, expected, rel_tol=rel_tol)
+	status = f"{Colors.CORRECT}(Correct){Colors.END}" if is_correct else f"{Colors.RED}(Incorrect){Colors.END}"
+	color = Colors.GREEN if is_correct else Colors.RED
+	print(f"{'Expected ' + label + ':':<25} {Colors.EXPECTED}{expected}{Colors.END}")
+	print(f"{'Result:':<25} {color}{result}{Colors.END} {status}")
+	print()
+
+def print_exception(label, expected_exception, func):
+	expected_name = expected_exception.__name__
+	try:
+		func()
+	except Exception as err:
+		is_correct = isinstance(err, expected_exception)
+		result = f"{type(err).__name__}: {err}"
+	else:
+		is_correct = False
+		result = "No exception raised"
+	status = f"{Colors.CORRECT}(Correct){Colors.END}" if is_correct else f"{Colors.RED}(Incorrect){Colors.END}"
+	color = Colors.GREEN if is_correct else Colors.RED
+	print(f"{'Expected ' + label + ':':<25} {Colors.EXPECTED}{expected_name}{Colors.END}")
+	print(f"{'Result:':<25} {color}{result}{Colors.END} {status}")
+	print()
+
+def test_singular_determinant():
+	print(f"\n{Colors.HEADER}--- SINGULAR DETERMINANT TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing determinant for matrix [[1, 2, 3], [4, 5, 6], [7, 8, 9]] {Colors.END}", end="\n---\n")
+	m = Matrix([[1., 2, 3], [4, 5, 6], [7, 8, 9]])
+	print_comparison("Determinant", 0.0, m.determinant())
+	print_comparison("Slogdet", (0.0, -inf), m.slogdet())
+
+	print(f"{Colors.TEST}Testing determinant for 1e-10 * identity (well-conditioned, tiny scale) {Colors.END}", end="\n---\n")
+	print_comparison("Determinant (3x3)", 1e-30, Matrix.identity(3).scl(1e-10).determinant(), rel_tol=1e-12)
+	sign, logabsdet = Matrix.identity(50).scl(1e-10).slogdet()
+	print_comparison("Slogdet sign (50x50)", 1.0, sign)
+	print_comparison("Slogdet log (50x50)", 50 * log(1e-10), logabsdet, rel_tol=1e-12)
+
+def test_singular_lu():
+	print(f"\n{Colors.HEADER}--- SINGULAR LU TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing LU of matrix [[1, 2, 3], [4, 5, 6], [7, 8, 9]] {Colors.END}", end="\n---\n")
+	lu = Matrix([[1., 2, 3], [4, 5, 6], [7, 8, 9]]).lu()
+	print_comparison("Is singular", True, lu.is_singular())
+	print_exception("Solve", ValueError, lambda: lu.solve(Vector([1., 2, 3])))
+	print_exception("Inverse", ValueError, lambda: lu.inverse())
+	print_comparison("Determinant", 0.0, lu.determinant())
+
+	print(f"{Colors.TEST}Testing LU solve with 1e-10 * identity (well-conditioned, tiny scale) {Colors.END}", end="\n---\n")
+	lu = Matrix.identity(4).scl(1e-10).lu()
+	print_comparison("Is singular", False, lu.is_singular())
+	print_comparison("Solve", Vector([1e10, 2e10, 3e10, 4e10]), lu.solve(Vector([1., 2, 3, 4])))
+
+def test_backend_tolerance():
+	print(f"\n{Colors.HEADER}--- BACKEND TOLERANCE TEST ---{Colors.END}\n")
+
+	previous = backend.get_backend()
+	for name in backend.BACKENDS:
+		if name == "numpy" and backend.numpy is None:
+			continue
+		backend.set_backend(name)
+		print(f"{Colors.TEST}Testing matrix [[1, 2], [2, 4.0000000001]] with the {name} backend {Colors.END}", end="\n---\n")
+		m = Matrix([[1., 2], [2, 4.0000000001]])
+		print_comparison("Rank", 1, m.rank())
+		print_comparison("Is full rank", False, m.is_full_rank())
+		print_exception("Inverse", ValueError, m.inverse)
+	backend.set_backend(previous)
+
+def test_data_view():
+	print(f"\n{Colors.HEADER}--- DATA VIEW TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing m.data on matrix [[1, 2], [3, 4]] {Colors.END}", end="\n---\n")
+	m = Matrix([[1., 2], [3, 4]])
+	print_comparison("Data", [[1.0, 3.0], [2.0, 4.0]], m.data)
+	print_comparison("Element data[1][0]", 2.0, m.data[1][0])
+	m.data[1][0] = 9.0
+	print_comparison("Write through data", 9.0, m[0, 1])
+
+def sample_matrix(rows, cols, seed=0):
+	return Matrix([[float((i * 7 + j * 3 + seed) % 11 - 5) for j in range(cols)] for i in range(rows)])
+
+def test_tiled_product():
+	print(f"\n{Colors.HEADER}--- TILED PRODUCT TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing tiled vs classic product of 20x30 and 30x25 matrices (tile 8) {Colors.END}", end="\n---\n")
+	a, b = sample_matrix(20, 30), sample_matrix(30, 25, 1)
+	previous = Matrix.TILE_SIZE
+	Matrix.TILE_SIZE = 8
+	print_comparison("Tiled product", a.mul_mat(b, method="classic"), a.mul_mat(b, method="tiled"))
+	Matrix.TILE_SIZE = previous
+
+def test_strassen_product():
+	print(f"\n{Colors.HEADER}--- STRASSEN PRODUCT TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing Strassen vs classic product of 18x13 and 13x21 matrices (crossover 4) {Colors.END}", end="\n---\n")
+	a, b = sample_matrix(18, 13), sample_matrix(13, 21, 2)
+	previous = Matrix.STRASSEN_CROSSOVER
+	Matrix.STRASSEN_CROSSOVER = 4
+	print_comparison("Strassen product", a.mul_mat(b, method="classic"), a.mul_mat(b, method="strassen"))
+	Matrix.STRASSEN_CROSSOVER = previous
+
+def test_inplace_operations():
+	print(f"\n{Colors.HEADER}--- IN-PLACE OPERATIONS TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing +=, -=, *= and axpy on 4x3 matrices against +, - and scl {Colors.END}", end="\n---\n")
+	a, b = sample_matrix(4, 3), sample_matrix(4, 3, 5)
+	m = a.copy()
+	m += b
+	print_comparison("Matrix +=", a + b, m)
+	m -= b
+	print_comparison("Matrix -=", a, m)
+	m *= 3.0
+	print_comparison("Matrix *=", a.scl(3.0), m)
+	m = a.copy()
+	m.axpy(-2.0, b)
+	print_comparison("Matrix axpy", a - b.scl(2.0), m)
+
+	print(f"{Colors.TEST}Testing +=, -=, *= and axpy on vectors against +, - and scl {Colors.END}", end="\n---\n")
+	u, v = Vector([1., 2, 3]), Vector([4., -5, 6])
+	w = Vector([1., 2, 3])
+	w += v
+	print_comparison("Vector +=", u + v, w)
+	w -= v
+	print_comparison("Vector -=", u, w)
+	w *= 0.5
+	print_comparison("Vector *=", u.scl(0.5), w)
+	w = Vector([1., 2, 3])
+	w.axpy(3.0, v)
+	print_comparison("Vector axpy", u + v.scl(3.0), w)
+
+def test_mul_buffer():
+	print(f"\n{Colors.HEADER}--- BATCHED MUL_VEC TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing mul_buffer against mul_vec per vertex (4x4 transform, 5 vertices) {Colors.END}", end="\n---\n")
+	m = Matrix([[2., 0, 0, 1], [0, 3, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])
+	vertices = [Vector([float(k), float(-k), float(k * k), 1.0]) for k in range(5)]
+	packed = array('d', [x for v in vertices for x in v.data])
+	result = m.mul_buffer(packed)
+	expected = array('d', [x for v in vertices for x in m.mul_vec(v).data])
+	print_comparison("mul_buffer", expected, result)
+	print_comparison("mul_vecs", [m.mul_vec(v) for v in vertices], m.mul_vecs(vertices))
+
+	print(f"{Colors.TEST}Testing mul_buffer with an infinite component under a zero entry {Colors.END}", end="\n---\n")
+	result = m.mul_buffer(array('d', [1.0, 1.0, inf, 1.0]))
+	print_comparison("mul_buffer", "[nan, nan, inf, nan]", str(result.tolist()))
+
+def test_sparse_matrix():
+	print(f"\n{Colors.HEADER}--- SPARSE MATRIX TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing SparseMatrix against the dense matrix [[4, 0, 0], [0, 0, 2], [1, 0, 3]] {Colors.END}", end="\n---\n")
+	dense = Matrix([[4., 0, 0], [0, 0, 2], [1, 0, 3]])
+	sparse = SparseMatrix.from_dense(dense)
+	other = sample_matrix(3, 3)
+	print_comparison("Nonzeros", 4, sparse.nnz())
+	print_comparison("Sparse == dense", True, sparse == dense)
+	print_comparison("Dense == sparse", True, dense == sparse)
+	print_comparison("mul_vec", dense.mul_vec(Vector([1., 2, 3])), sparse.mul_vec(Vector([1., 2, 3])))
+	print_comparison("Sparse · dense", dense.mul_mat(other), sparse.mul_mat(other))
+	print_comparison("Dense · sparse", other.mul_mat(dense), other.mul_mat(sparse))
+	print_comparison("Transpose", dense.transpose(), sparse.transpose().to_dense())
+	print_comparison("Sparse + dense", dense + other, sparse + other)
+	print_comparison("Dense - sparse", other - dense, other - sparse)
+	with deferred():
+		result = sparse + other
+	print_comparison("Sparse + dense (deferred)", "Matrix", type(result).__name__)
+
+def test_deferred():
+	print(f"\n{Colors.HEADER}--- DEFERRED ARITHMETIC TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing a + b.scl(2) - c evaluated in one pass {Colors.END}", end="\n---\n")
+	a, b, c = sample_matrix(3, 4), sample_matrix(3, 4, 1), sample_matrix(3, 4, 2)
+	expected = a + b.scl(2) - c
+	with deferred():
+		e = a + b.scl(2) - c
+	print_comparison("Deferred type", "Expr", type(e).__name__)
+	print_comparison("eval()", expected, e.eval())
+	out = Matrix.zeros(3, 4)
+	result = e.eval(out=out)
+	print_comparison("eval(out=) writes out", True, result is out and out == expected)
+
+	print(f"{Colors.TEST}Testing FrozenVector + Vector inside deferred() {Colors.END}", end="\n---\n")
+	with deferred():
+		e = FrozenVector([1., 2]) + Vector([3., 4])
+	print_comparison("eval()", Vector([4., 6]), e.eval())
+
+	print(f"{Colors.TEST}Testing that deferred() only affects the current thread {Colors.END}", end="\n---\n")
+	seen = []
+	with deferred():
+		worker = Thread(target=lambda: seen.append(deferring()))
+		worker.start()
+		worker.join()
+		print_comparison("Deferring here", True, deferring())
+	print_comparison("Deferring in other thread", [False], seen)
+
+def load_exercise(folder, module):
+	"""
+	Import a module from a sibling exercise folder (e.g. ex06/cross_product.py).
+	"""
+	path = Path(__file__).resolve().parent.parent / folder / f"{module}.py"
+	spec = spec_from_file_location(f"{folder}_{module}", path)
+	loaded = module_from_spec(spec)
+	spec.loader.exec_module(loaded)
+	return loaded
+
+def test_graphics_types():
+	print(f"\n{Colors.HEADER}--- GRAPHICS TYPES TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing Mat4 against Matrix on two 4x4 matrices {Colors.END}", end="\n---\n")
+	a = Matrix([[2., 0, 1, 3], [1, 3, 0, -1], [0, -2, 4, 1], [1, 1, 1, 2]])
+	b = Matrix([[1., 2, 0, 0], [0, 1, 3, 0], [4, 0, 1, 2], [0, 1, 0, 1]])
+	ma, mb = Mat4.from_matrix(a), Mat4.from_matrix(b)
+	print_comparison("mul_mat", a.mul_mat(b), (ma @ mb).to_matrix())
+	print_comparison("mul_vec", a.mul_vec(Vector([1., 2, 3, 4])), (ma @ Vec4(1., 2, 3, 4)).to_vector())
+	print_comparison("Determinant", a.determinant(), ma.determinant(), rel_tol=1e-12)
+	print_comparison("Inverse", a.inverse(), ma.inverse().to_matrix())
+	print_comparison("Transpose", a.transpose(), ma.transpose().to_matrix())
+
+	print(f"{Colors.TEST}Testing Vec3.cross against ex06 cross_product {Colors.END}", end="\n---\n")
+	ex06 = load_exercise("ex06", "cross_product")
+	for u, v in (([1., 0, 0], [0, 1, 0]), ([1., 2, 3], [4, 5, 6]), ([4., 2, -3], [-2, -5, 16])):
+		expected = Vec3.from_vector(ex06.cross_product(Vector(u), Vector(v)))
+		print_comparison(f"cross({u}, {v})", expected, Vec3(*u).cross(Vec3(*v)))
+
+def test_projection_camera():
+	print(f"\n{Colors.HEADER}--- PROJECTION CAMERA TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing Projection setters against projection() {Colors.END}", end="\n---\n")
+	camera = Projection(radians(90.0), 16 / 9, 0.1, 100.0)
+	print_comparison("Initial", projection(radians(90.0), 16 / 9, 0.1, 100.0), camera.matrix)
+	camera.fov = radians(60.0)
+	print_comparison("After fov", projection(radians(60.0), 16 / 9, 0.1, 100.0), camera.matrix)
+	camera.ratio = 4 / 3
+	print_comparison("After ratio", projection(radians(60.0), 4 / 3, 0.1, 100.0), camera.matrix)
+	camera.near = 0.5
+	camera.far = 50.0
+	print_comparison("After near/far", projection(radians(60.0), 4 / 3, 0.5, 50.0), camera.matrix)
+	print_comparison("Inverse", camera.matrix.inverse(), camera.inverse())
+	print_exception("near >= far", ValueError, lambda: setattr(camera, "near", 60.0))
+
+def test_vertex_pipeline():
+	print(f"\n{Colors.HEADER}--- VERTEX PIPELINE TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing VertexPipeline (chunks of 2) against mul_vec + perspective divide per vertex {Colors.END}", end="\n---\n")
+	proj = projection(radians(90.0), 16 / 9, 0.1, 100.0)
+	view = Matrix([[1., 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 5], [0, 0, 0, 1]])
+	pipe = VertexPipeline(proj, view=view, viewport=(0, 0, 800, 600), chunk_size=2)
+	points = [(0., 0, 0), (1., 1, 1), (-2., 0.5, 3), (0.25, -1, -1), (3., 2, 10)]
+	expected = []
+	for p in points:
+		x, y, z, w = proj.mul_mat(view).mul_vec(Vector([*p, 1.0])).data
+		expected.append((400 + 400 * x / w, 300 + 300 * y / w, z / w))
+	result = list(pipe.vertices(Vec3(*p) for p in points))
+	close = len(result) == len(expected) and all(
+		isclose(a, b, rel_tol=1e-12, abs_tol=1e-12) for r, e in zip(result, expected) for a, b in zip(r, e))
+	print_comparison("Window coordinates", True, close)
+	packed = array('d', [c for p in points for c in p])
+	print_comparison("Packed stream", [c for v in result for c in v], [c for chunk in pipe.stream(packed) for c in chunk])
+
+	print(f"{Colors.TEST}Testing a vertex behind the camera (w <= 0) {Colors.END}", end="\n---\n")
+	print_comparison("Behind camera", "[nan, nan, nan]", str(pipe.process([0., 0, -10]).tolist()))
+
+def test_frozen_vector():
+	print(f"\n{Colors.HEADER}--- FROZEN VECTOR TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing FrozenVector hashing and use as dict / set keys {Colors.END}", end="\n---\n")
+	u, v = FrozenVector([3., 4., 12.]), FrozenVector(Vector([3., 4., 12.]))
+	print_comparison("Equal vectors", True, u == v and u is not v)
+	print_comparison("Hash", hash(u), hash(v))
+	print_comparison("Set size", 2, len({u, v, FrozenVector([4., 3., 12.])}))
+	print_comparison("Dict lookup", "found", {u: "found"}.get(v))
+
+	print(f"{Colors.TEST}Testing cached norms against Vector for [3, 4, 12] {Colors.END}", end="\n---\n")
+	plain = Vector([3., 4., 12.])
+	for name in ("norm", "norm_1", "norm_inf"):
+		first = getattr(u, name)()
+		print_comparison(f"{name} (first call)", getattr(plain, name)(), first)
+		print_comparison(f"{name} (cached)", first, u._cache.get(name))
+	print_comparison("Dot with itself", plain.dot(plain), u.dot(u))
+	print_comparison("Normalized", Vector([3 / 13, 4 / 13, 12 / 13]), u.normalized())
+	print_comparison("Same normalized object", True, u.normalized() is u.normalized())
+
+	print(f"{Colors.TEST}Testing FrozenVector immutability and thaw {Colors.END}", end="\n---\n")
+	print_exception("Setting data", AttributeError, lambda: setattr(u, 'data', (0., 0., 0.)))
+	print_exception("axpy", ValueError, lambda: u.axpy(2., plain))
+	w = u
+	w += plain
+	print_comparison("+= rebinds, frozen unchanged", (3., 4., 12.), u.data)
+	thawed = u.thaw()
+	thawed += plain
+	print_comparison("thaw gives a mutable Vector", Vector([6., 8., 24.]), thawed)
+	print_comparison("Frozen after thaw", (3., 4., 12.), u.data)
+
+def test_reshape():
+	print(f"\n{Colors.HEADER}--- RESHAPE TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing to_matrix with valid and non-positive dimensions {Colors.END}", end="\n---\n")
+	v = Vector([1., 2., 3., 4., 5., 6.])
+	print_comparison("to_matrix(2, 3)", Matrix([[1., 2., 3.], [4., 5., 6.]]), v.to_matrix(2, 3))
+	print_comparison("to_matrix(3, 2)", Matrix([[1., 2.], [3., 4.], [5., 6.]]), v.to_matrix(3, 2))
+	print_exception("to_matrix(-1, -2)", ValueError, lambda: Vector([1., 2.]).to_matrix(-1, -2))
+	print_exception("to_matrix(-2, -3)", ValueError, lambda: v.to_matrix(-2, -3))
+	print_exception("to_matrix(0, 5)", ValueError, lambda: v.to_matrix(0, 5))
+	print_exception("FrozenVector to_matrix(-3, -2)", ValueError, lambda: FrozenVector(v).to_matrix(-3, -2))
+
+	print(f"{Colors.TEST}Testing the shape of a matrix without columns {Colors.END}", end="\n---\n")
+	print_comparison("Shape of Matrix([[]])", (0, 0), Matrix([[]]).shape())
+	print_comparison("Shape of Matrix([[], []])", (0, 0), Matrix([[], []]).shape())
+
+def test_from_buffer_types():
+	print(f"\n{Colors.HEADER}--- FROM_BUFFER ITEM TYPES TEST ---{Colors.END}\n")
+
+	expected = Matrix([[1., 3.5], [2., -4.]])
+	print(f"{Colors.TEST}Testing from_buffer with float32, int and float64 buffers {Colors.END}", end="\n---\n")
+	print_comparison("array('f')", expected, Matrix.from_buffer(array('f', [1., 2., 3.5, -4.]), 2, 2))
+	print_comparison("array('d')", expected, Matrix.from_buffer(array('d', [1., 2., 3.5, -4.]), 2, 2))
+	print_comparison("array('i')", Matrix([[1., 2.], [3., 4.]]), Matrix.from_buffer(array('i', [1, 2, 3, 4]), 2, 2, row_major=True))
+	ints = memoryview(array('i', [1, 2, 3, 4])).cast('B').cast('i', [2, 2])
+	print_comparison("2-D int memoryview", Matrix([[1., 3.], [2., 4.]]), Matrix.from_buffer(ints, 2, 2))
+	print_comparison("Strided float32 view", Matrix([[1.], [3.5]]), Matrix.from_buffer(memoryview(array('f', [1., 2., 3.5, -4.]))[::2], 2, 1))
+
+def test_rank():
+	print(f"\n{Colors.HEADER}--- RANK TEST ---{Colors.END}\n")
+
+	cases = [
+		("[[1, 2], [2, 4]]", [[1., 2.], [2., 4.]], 1, False, False),
+		("[[1, 2, 3], [4, 5, 6], [7, 8, 9]]", [[1., 2., 3.], [4., 5., 6.], [7., 8., 9.]], 2, False, False),
+		("diag(2, 3, 4)", [[2., 0., 0.], [0., 3., 0.], [0., 0., 4.]], 3, True, True),
+		("3x4 with a repeated row", [[1., 2., 3., 4.], [2., 4., 6., 8.], [0., 1., 0., 1.]], 2, False, False),
+		("tall 3x2", [[1., 0.], [0., 1.], [1., 1.]], 2, True, False),
+		("2x2 zero", [[0., 0.], [0., 0.]], 0, False, False),
+		("[[8, 5, -2], [4, 7, 20], [7, 6, 1]]", [[8., 5., -2.], [4., 7., 20.], [7., 6., 1.]], 3, True, True),
+	]
+	for name, rows, rank, full_rank, invertible in cases:
+		print(f"{Colors.TEST}Testing rank, is_full_rank and is_invertible for {name} {Colors.END}", end="\n---\n")
+		m = Matrix(rows)
+		print_comparison("Rank", rank, m.rank())
+		print_comparison("is_full_rank", full_rank, m.is_full_rank())
+		print_comparison("is_invertible", invertible, m.is_invertible())
+
+def test_row_echelon_inverse():
+	print(f"\n{Colors.HEADER}--- ROW ECHELON AND INVERSE TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing row_echelon against known reduced forms {Colors.END}", end="\n---\n")
+	cases = [
+		([[1., 2.], [2., 4.]], [[1., 2.], [0., 0.]]),
+		([[1., 2., 3.], [4., 5., 6.], [7., 8., 9.]], [[1., 0., -1.], [0., 1., 2.], [0., 0., 0.]]),
+		([[1., 2., 3., 4.], [2., 4., 6., 8.], [0., 1., 0., 1.]], [[1., 0., 3., 2.], [0., 1., 0., 1.], [0., 0., 0., 0.]]),
+		([[8., 5., -2.], [4., 7., 20.], [7., 6., 1.]], [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]]),
+	]
+	for rows, expected in cases:
+		print_comparison(f"Echelon of {rows}", Matrix(expected), Matrix(rows).row_echelon())
+
+	print(f"{Colors.TEST}Testing inverse against known inverses and A·A⁻¹ = I {Colors.END}", end="\n---\n")
+	a = Matrix([[8., 5., -2.], [4., 7., 20.], [7., 6., 1.]])
+	expected = Matrix([
+		[0.649425287, 0.097701149, -0.655172414],
+		[-0.781609195, -0.126436782, 0.965517241],
+		[0.143678161, 0.074712644, -0.206896552],
+	])
+	print_comparison("Inverse", expected, a.inverse())
+	print_comparison("A·A⁻¹", Matrix.identity(3), a.mul_mat(a.inverse()))
+	print_comparison("Inverse of diag(2, 3, 4)", Matrix([[0.5, 0., 0.], [0., 1 / 3, 0.], [0., 0., 0.25]]),
+		Matrix([[2., 0., 0.], [0., 3., 0.], [0., 0., 4.]]).inverse())
+	print_exception("Inverse of singular", ValueError, lambda: Matrix([[1., 2.], [2., 4.]]).inverse())
+	print_exception("Inverse of 3x4", ValueError, lambda: Matrix([[1., 2., 3., 4.], [2., 4., 6., 8.], [0., 1., 0., 1.]]).inverse())
+
+def test_mul_vec_non_finite():
+	print(f"\n{Colors.HEADER}--- MUL_VEC NON-FINITE TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing mul_vec with inf entries and zero components on every backend {Colors.END}", end="\n---\n")
+	cases = [
+		("[[inf, 1]]·[0, 1]", Matrix([[inf, 1.]]), Vector([0., 1.]), "[nan]"),
+		("[[1, 2], [3, 4]]·[0, inf]", Matrix([[1., 2.], [3., 4.]]), Vector([0., inf]), "[inf, inf]"),
+		("[[1, inf], [3, 4]]ᵀ·[0, 1]", Matrix([[1., inf], [3., 4.]]).transpose(), Vector([0., 1.]), "[3.0, nan]"),
+		("[[1, 2], [0, 4]]·[0, 1]", Matrix([[1., 2.], [0., 4.]]), Vector([0., 1.]), "[2.0, 4.0]"),
+	]
+	previous = backend.get_backend()
+	for name in backend.BACKENDS:
+		if name == "numpy" and backend.numpy is None:
+			continue
+		backend.set_backend(name)
+		for label, m, v, expected in cases:
+			print_comparison(f"{label} ({name})", expected, str(m.mul_vec(v)))
+	backend.set_backend(previous)
+
+def test_view_sharing():
+	print(f"\n{Colors.HEADER}--- VIEW SHARING TEST ---{Colors.END}\n")
+
+	print(f"{Colors.TEST}Testing that writes through views reach the parent matrix {Colors.END}", end="\n---\n")
+	m = Matrix([[1., 2., 3.], [4., 5., 6.], [7., 8., 9.]])
+	m.submatrix(1, 3, 1, 3)[0, 0] = 50.
+	print_comparison("submatrix[0, 0] -> m[1, 1]", 50., m[1, 1])
+	m.row(0)[0, 2] = 30.
+	print_comparison("row(0)[0, 2] -> m[0, 2]", 30., m[0, 2])
+	m.column(0)[2, 0] = 70.
+	print_comparison("column(0)[2, 0] -> m[2, 0]", 70., m[2, 0])
+	m.diagonal()[2, 0] = 90.
+	print_comparison("diagonal()[2, 0] -> m[2, 2]", 90., m[2, 2])
+	m.transpose()[0, 1] = 40.
+	print_comparison("transpose()[0, 1] -> m[1, 0]", 40., m[1, 0])
+	view = m[0:2, 1:3]
+	view += Matrix([[1., 1.], [1., 1.]])
+	print_comparison("m[0:2, 1:3] += ones", Matrix([[1., 3., 31.], [40., 51., 7.], [70., 8., 90.]]), m)
+	m[:, 0] = 0.
+	print_comparison("Parent write -> view", Matrix([[0., 3.], [0., 51.]]), m[0:2, 0:2])
+
+	print(f"{Colors.TEST}Testing that copy() breaks the sharing {Colors.END}", end="\n---\n")
+	block = m.submatrix(0, 2, 0, 2)
+	detached = block.copy()
+	detached[0, 0] = -1.
+	print_comparison("Copy write, parent unchanged", 0., m[0, 0])
+	m[0, 0] = 5.
+	print_comparison("View sees parent write", 5., block[0, 0])
+	print_comparison("Copy keeps its own value", -1., detached[0, 0])
+	print_comparison("Copy of a strided view", Matrix([[5.], [51.], [90.]]), m.diagonal().copy())
+
+def test_parallel():
+	print(f"\n{Colors.HEADER}--- PARALLEL KERNELS TEST ---{Colors.END}\n")
+
+	a, b = sample_matrix(8, 6), sample_matrix(6, 5, seed=4)
+	c = sample_matrix(8, 6, seed=7)
+	buf = array('d', [float((k * 5) % 13 - 6) for k in range(6 * 10)])
+	buf[3] = inf # 0 * inf must still give nan in the workers
+	mat = a.copy()
+	mat[:, 3] = 0.
+
+	previous = backend.get_backend()
+	backend.set_backend("python")
+	expected = (a.mul_mat(b), mat.mul_buffer(buf), a + c, a - c, a.scl(2.5))
+	thresholds = (parallel.MUL_THRESHOLD, parallel.ELEMENTWISE_THRESHOLD)
+	parallel.MUL_THRESHOLD = parallel.ELEMENTWISE_THRESHOLD = 1 # route every size to the pool
+	parallel.set_workers(2)
+	try:
+		print(f"{Colors.TEST}Testing the 2-worker pool against the single-process kernels {Colors.END}", end="\n---\n")
+		print_comparison("Workers", 2, parallel.get_workers())
+		print_comparison("mul_mat", expected[0], a.mul_mat(b))
+		print_comparison("mul_mat(method=\"parallel\")", expected[0], a.mul_mat(b, method="parallel"))
+		result = mat.mul_buffer(buf)
+		print_comparison("mul_buffer nan results", 8, sum(map(isnan, result))) # the 8 outputs of the first vector
+		print_comparison("mul_buffer mismatches", 0, sum(x != y and not (isnan(x) and isnan(y)) for x, y in zip(expected[1], result)))
+		print_comparison("A + B", expected[2], a + c)
+		print_comparison("A - B", expected[3], a - c)
+		print_comparison("scl(2.5)", expected[4], a.scl(2.5))
+	finally:
+		parallel.set_workers(0)
+		parallel.MUL_THRESHOLD, parallel.ELEMENTWISE_THRESHOLD = thresholds
+		backend.set_backend(previous)
+	print_comparison("Workers after set_workers(0)", 0, parallel.get_workers())
 
 fov = radians(90.0)   # 90 degrees FOV
 ratio = 16/9          # widescreen aspect ratio
@@ -12,7 +487,31 @@ P = projection(fov, ratio, near, far)
 # Write to "proj" file in row-major printing order
 with open("proj", "w") as f:
 	for row in range(4):
-		line = ", ".join(str(P.data[col][row]) for col in range(4))
+		# integral entries are written as ints (0, 1), as when the matrix held Python ints
+		line = ", ".join(str(int(x)) if x.is_integer() else str(x) for x in (P.data[col][row] for col in range(4)))
 		f.write(line + "\n")
 
-print("Projection matrix written to proj")
\ No newline at end of file
+print("Projection matrix written to proj")
+
+test_singular_determinant()
+test_singular_lu()
+test_backend_tolerance()
+test_data_view()
+test_tiled_product()
+test_strassen_product()
+test_inplace_operations()
+test_mul_buffer()
+test_sparse_matrix()
+test_deferred()
+test_graphics_types()
+test_projection_camera()
+test_vertex_pipeline()
+test_frozen_vector()
+test_reshape()
+test_from_buffer_types()
+test_rank()
+test_row_echelon_inverse()
+test_mul_vec_non_finite()
+test_view_sharing()
+if __name__ == "__main__": # workers started with spawn / forkserver re-import this file
+	test_parallel()
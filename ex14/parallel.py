@@ -0,0 +1,304 @@
+"""
+Multi-process kernels for large Matrix products and element-wise operations.
+
+Pure Python kernels run on one core. With a worker pool enabled, Matrix hands
+sufficiently large products (mul_mat, mul_buffer / mul_vecs) and element-wise
+operations (+, -, scl) to this module: the packed operands are copied once into
+multiprocessing.shared_memory segments, each task only receives segment names and
+an index range, and the workers write their part of the result straight into a
+shared output segment. No operand data is pickled.
+
+	parallel.set_workers(32)     # persistent pool, reused by every call
+	c = a.mul_mat(b)             # split over column blocks of C
+	parallel.set_workers(0)      # back to single-process kernels
+
+Products are split by output column blocks, which are contiguous in the
+column-major layout, so workers never write to overlapping memory.
+"""
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from itertools import repeat
+from math import fma, isfinite, sumprod
+from multiprocessing import shared_memory
+from operator import add, mul
+
+MUL_THRESHOLD = 1 << 21			# multiply-adds from which mul_mat / mul_buffer go parallel
+ELEMENTWISE_THRESHOLD = 1 << 21	# elements from which +, - and scl go parallel
+TASKS_PER_WORKER = 4			# blocks per worker, to even out uneven task durations
+
+_pool = None
+_workers = 0
+
+
+def set_workers(count=None):
+	"""
+	Start (or resize) the persistent worker pool, or disable parallel kernels.
+
+	Args:
+		count (int): Number of worker processes; None uses every CPU, 0 or 1 disables
+			the parallel kernels and shuts the pool down.
+	Raises:
+		ValueError: If count is negative.
+	"""
+	global _pool, _workers
+	if count is None:
+		count = os.cpu_count() or 1
+	if count < 0:
+		raise ValueError("Worker count must not be negative.")
+	if count == _workers:
+		return
+	shutdown()
+	if count > 1:
+		_pool = ProcessPoolExecutor(max_workers=count)
+		_workers = count
+
+
+def get_workers():
+	"""
+	Get the size of the worker pool.
+
+	Returns:
+		int: Number of worker processes, 0 when the parallel kernels are disabled.
+	"""
+	return _workers
+
+
+def shutdown():
+	"""
+	Stop the worker pool (parallel kernels stay disabled until set_workers is called again).
+	"""
+	global _pool, _workers
+	if _pool is not None:
+		_pool.shutdown()
+	_pool = None
+	_workers = 0
+
+
+def active(work, threshold):
+	"""
+	Check whether an operation of the given size should run on the pool.
+
+	Args:
+		work (int): Multiply-adds or elements processed by the operation.
+		threshold (int): Size from which the pool pays off (MUL_THRESHOLD or ELEMENTWISE_THRESHOLD).
+	Returns:
+		bool: True if a pool is running and work reaches threshold.
+	"""
+	return _pool is not None and work >= threshold
+
+
+def _blocks(total):
+	"""
+	Split range(total) into contiguous (start, stop) blocks for the pool.
+	"""
+	step = max(1, -(-total // (max(_workers, 1) * TASKS_PER_WORKER)))
+	return [(start, min(start + step, total)) for start in range(0, total, step)]
+
+
+def _run(tasks):
+	"""
+	Submit (function, *args) tasks to the pool and wait for all of them.
+
+	Every task is waited for before the first error (if any) is raised, so no worker
+	still uses the shared segments when the caller releases them.
+	"""
+	pool = _pool
+	if pool is None:
+		raise ValueError("Parallel kernels are disabled; call set_workers() first.")
+	futures = [pool.submit(*task) for task in tasks]
+	wait(futures)
+	for future in futures:
+		future.result()
+
+
+@contextmanager
+def _shared(count, values=None):
+	"""
+	Create a shared segment of count doubles (filled from values when given), unlinked on exit.
+
+	Yields:
+		SharedMemory: The segment; workers attach to it by its name.
+	"""
+	shm = shared_memory.SharedMemory(create=True, size=max(8 * count, 8))
+	try:
+		if values is not None:
+			with shm.buf.cast('d') as doubles, doubles[:count] as target:
+				target[:] = values if isinstance(values, array) else array('d', values)
+		yield shm
+	finally:
+		shm.close()
+		shm.unlink()
+
+
+def _read(shm, count):
+	"""
+	Copy the first count doubles of a shared segment into a new array('d').
+	"""
+	out = array('d')
+	with shm.buf[:8 * count] as raw:
+		out.frombytes(raw)
+	return out
+
+
+def _open(name):
+	"""
+	Open an existing shared segment without taking ownership of it (the creating process unlinks it).
+	"""
+	if sys.version_info >= (3, 13):
+		return shared_memory.SharedMemory(name=name, track=False)
+	# no track argument before 3.13: the segment is registered again with the resource
+	# tracker the pool shares with its parent, which is harmless since it only keeps a set
+	return shared_memory.SharedMemory(name=name)
+
+
+@contextmanager
+def _attach(name):
+	"""
+	Attach to an existing shared segment (worker side) and yield it as doubles.
+	"""
+	shm = _open(name)
+	try:
+		with shm.buf.cast('d') as doubles:
+			yield doubles
+	finally:
+		shm.close()
+
+
+def _mul_columns(a_name, b_name, out_name, m, n, j0, j1):
+	"""
+	Worker: columns j0..j1 of C = A·B, with A (m×n), B (n×p) and C packed column-major.
+	"""
+	with ExitStack() as stack:
+		a, b, out = (stack.enter_context(_attach(name)) for name in (a_name, b_name, out_name))
+		a_rows = [a[i:m * n:m].tolist() for i in range(m)]
+		for j in range(j0, j1):
+			b_col = b[j * n:(j + 1) * n].tolist()
+			out[j * m:(j + 1) * m] = array('d', [sumprod(row, b_col) for row in a_rows])
+
+
+def _mul_vectors(mat_name, buf_name, out_name, rows, cols, start, stop):
+	"""
+	Worker: multiply vectors start..stop of a packed batch by a column-major rows×cols matrix.
+	"""
+	with ExitStack() as stack:
+		mat, buf, out = (stack.enter_context(_attach(name)) for name in (mat_name, buf_name, out_name))
+		count = stop - start
+		components = [buf[start * cols + j:stop * cols:cols].tolist() for j in range(cols)]
+		finite = [isfinite(sum(component)) for component in components]
+		block = array('d', bytes(8 * count * rows))
+		for i in range(rows):
+			acc = None
+			for a, component, finite_terms in zip(mat[i:rows * cols:rows].tolist(), components, finite):
+				if not (finite_terms and isfinite(a)):
+					# IEEE products (0 * inf is nan), as in Matrix.mul_buffer
+					scaled = map(mul, component, repeat(a))
+					acc = list(scaled) if acc is None else list(map(add, scaled, acc))
+				elif not a:
+					continue
+				elif acc is None:
+					acc = list(map(mul, component, repeat(a)))
+				else:
+					acc = list(map(fma, component, repeat(a), acc))
+			if acc is not None:
+				block[i::rows] = array('d', acc)
+		out[start * rows:stop * rows] = block
+
+
+def _combine(op, a_name, b_name, out_name, start, stop):
+	"""
+	Worker: out[start:stop] = op(a, b) element-wise.
+	"""
+	with _attach(a_name) as a, _attach(b_name) as b, _attach(out_name) as out:
+		out[start:stop] = array('d', map(op, a[start:stop].tolist(), b[start:stop].tolist()))
+
+
+def _scale(scalar, a_name, out_name, start, stop):
+	"""
+	Worker: out[start:stop] = scalar * a element-wise.
+	"""
+	with _attach(a_name) as a, _attach(out_name) as out:
+		out[start:stop] = array('d', map(mul, a[start:stop].tolist(), repeat(scalar)))
+
+
+def mul_mat(a, b, m, n, p):
+	"""
+	Product of two packed column-major buffers on the worker pool.
+
+	Args:
+		a (array): A (m×n) as array('d'), column-major.
+		b (array): B (n×p) as array('d'), column-major.
+		m (int): Rows of A.
+		n (int): Columns of A / rows of B.
+		p (int): Columns of B.
+	Returns:
+		array: C = A·B (m×p) as array('d'), column-major.
+	Raises:
+		ValueError: If the pool is not running.
+	"""
+	with _shared(m * n, a) as sa, _shared(n * p, b) as sb, _shared(m * p) as so:
+		_run([(_mul_columns, sa.name, sb.name, so.name, m, n, j0, j1) for j0, j1 in _blocks(p)])
+		return _read(so, m * p)
+
+
+def mul_buffer(mat, rows, cols, buf, out):
+	"""
+	Multiply a packed column-major matrix by every vector of a packed batch on the worker pool.
+
+	Args:
+		mat (array): The matrix (rows×cols) as array('d'), column-major.
+		rows (int): Rows of the matrix (size of each result vector).
+		cols (int): Columns of the matrix (size of each input vector).
+		buf (sequence): N*cols numbers, N vectors back to back.
+		out (array): array('d') of N*rows numbers receiving the results.
+	Returns:
+		array: out.
+	Raises:
+		ValueError: If the pool is not running.
+	"""
+	count = len(buf) // cols
+	with _shared(rows * cols, mat) as sm, _shared(len(buf), buf) as sb, _shared(len(out)) as so:
+		_run([(_mul_vectors, sm.name, sb.name, so.name, rows, cols, start, stop)
+			for start, stop in _blocks(count)])
+		with so.buf[:8 * len(out)] as raw:
+			memoryview(out).cast('B')[:] = raw
+	return out
+
+
+def combine(op, a, b):
+	"""
+	Element-wise op(a, b) over two packed buffers of the same length on the worker pool.
+
+	Args:
+		op (callable): A picklable binary function, e.g. operator.add.
+		a (array): array('d') left operand.
+		b (array): array('d') right operand.
+	Returns:
+		array: The results as array('d').
+	Raises:
+		ValueError: If the pool is not running.
+	"""
+	size = len(a)
+	with _shared(size, a) as sa, _shared(size, b) as sb, _shared(size) as so:
+		_run([(_combine, op, sa.name, sb.name, so.name, start, stop) for start, stop in _blocks(size)])
+		return _read(so, size)
+
+
+def scale(scalar, a):
+	"""
+	Multiply every element of a packed buffer by a scalar on the worker pool.
+
+	Args:
+		scalar (float): The scalar.
+		a (array): array('d') operand.
+	Returns:
+		array: The results as array('d').
+	Raises:
+		ValueError: If the pool is not running.
+	"""
+	size = len(a)
+	with _shared(size, a) as sa, _shared(size) as so:
+		_run([(_scale, scalar, sa.name, so.name, start, stop) for start, stop in _blocks(size)])
+		return _read(so, size)
@@ -0,0 +1,120 @@
+"""
+Streaming vertex pipeline: model/view/projection transform, perspective divide and
+viewport mapping, processed in fixed-size chunks.
+
+Vertices go through as packed array('d') chunks and the combined MVP matrix is
+applied with one Matrix.mul_buffer call per chunk, so memory stays bounded by the
+chunk size no matter how large the mesh (or generator) feeding it is:
+
+	pipe = VertexPipeline(projection(fov, ratio, near, far), view=view, viewport=(0, 0, 800, 600))
+	for chunk in pipe.stream(mesh_points):
+		...                      # chunk = x, y, depth per vertex, back to back
+"""
+from array import array
+from itertools import islice, repeat
+from math import fma, nan
+from operator import mul
+
+CHUNK_SIZE = 4096 # vertices per chunk
+
+
+class VertexPipeline:
+	"""
+	Transform 3D points to window coordinates chunk by chunk.
+
+	Attributes:
+		mvp (Matrix): The combined projection · view · model matrix (4x4).
+		viewport (tuple): (x, y, width, height) of the target window area.
+		chunk_size (int): Number of vertices processed per chunk.
+	"""
+
+	def __init__(self, projection, view=None, model=None, viewport=(0, 0, 1, 1), chunk_size=CHUNK_SIZE):
+		"""
+		Args:
+			projection (Matrix): 4x4 projection matrix (e.g. from projection()).
+			view (Matrix): Optional 4x4 view matrix.
+			model (Matrix): Optional 4x4 model matrix.
+			viewport (tuple): (x, y, width, height); window y grows upwards (OpenGL convention).
+			chunk_size (int): Number of vertices per chunk.
+		Raises:
+			ValueError: If a matrix is not 4x4 or the chunk size is not positive.
+		"""
+		mvp = projection
+		for mat in (view, model):
+			if mat is not None:
+				if mat.shape() != (4, 4):
+					raise ValueError("Transform matrices must be 4x4.")
+				mvp = mvp.mul_mat(mat)
+		if mvp.shape() != (4, 4):
+			raise ValueError("Transform matrices must be 4x4.")
+		if chunk_size <= 0:
+			raise ValueError("Chunk size must be positive.")
+		self.mvp = mvp
+		self.viewport = viewport
+		self.chunk_size = chunk_size
+
+	def process(self, xyz):
+		"""
+		Run one packed chunk of points through the whole pipeline.
+
+		Points with clip-space w <= 0 (on or behind the camera plane) have no window
+		position; their outputs are NaN.
+
+		Args:
+			xyz (sequence): Flat array('d'), list or memoryview of x, y, z per point.
+		Returns:
+			array: array('d') of window x, y and depth per point, back to back
+				(depth is the NDC z, in [0, 1] between the near and far planes).
+		Raises:
+			ValueError: If the length is not a multiple of 3.
+		"""
+		if len(xyz) % 3:
+			raise ValueError(f"Buffer length {len(xyz)} is not a multiple of 3")
+		count = len(xyz) // 3
+		# homogeneous coordinates (x, y, z, 1)
+		xyzw = array('d', bytes(32 * count))
+		for k in range(3):
+			xyzw[k::4] = array('d', xyz[k::3])
+		xyzw[3::4] = array('d', repeat(1.0, count))
+		clip = self.mvp.mul_buffer(xyzw)
+
+		inv_w = [1.0 / w if w > 0 else nan for w in clip[3::4]]
+		x0, y0, width, height = self.viewport
+		half_w, half_h = width / 2, height / 2
+		out = array('d', bytes(24 * count))
+		out[0::3] = array('d', map(fma, map(mul, clip[0::4], inv_w), repeat(half_w), repeat(x0 + half_w)))
+		out[1::3] = array('d', map(fma, map(mul, clip[1::4], inv_w), repeat(half_h), repeat(y0 + half_h)))
+		out[2::3] = array('d', map(mul, clip[2::4], inv_w))
+		return out
+
+	def stream(self, points):
+		"""
+		Lazily run points through the pipeline, one chunk at a time.
+
+		Args:
+			points (iterable): Either a flat array('d')/memoryview of x, y, z values, or any
+				iterable (e.g. a generator) of points given as Vectors, Vec3s or 3-sequences.
+		Yields:
+			array: Packed window x, y, depth for up to chunk_size points (see process).
+		"""
+		step = self.chunk_size
+		if isinstance(points, (array, memoryview)):
+			for start in range(0, len(points), 3 * step):
+				yield self.process(points[start:start + 3 * step])
+			return
+
+		points = iter(points)
+		while True:
+			chunk = array('d')
+			for p in islice(points, step):
+				chunk.extend(p.data if hasattr(p, 'data') else p)
+			if not chunk:
+				return
+			yield self.process(chunk)
+
+	def vertices(self, points):
+		"""
+		Like stream, but yield one (x, y, depth) tuple per point.
+		"""
+		for chunk in self.stream(points):
+			yield from zip(chunk[0::3], chunk[1::3], chunk[2::3])
@@ -1,10 +1,45 @@
+from array import array
+from functools import lru_cache
 from math import tan
 from Matrix import Matrix
 
+def _check_planes(near, far):
+    """
+    Validate the clipping planes.
+
+    Raises:
+        ValueError: If near or far are non-positive, or if near is not less than far.
+    """
+    if near <= 0 or far <= 0:
+        raise ValueError("Near and far must be positive.")
+    if near >= far:
+        raise ValueError("Near must be less than far.")
+
+@lru_cache(maxsize=128)
+def _projection_entries(fov, ratio, near, far):
+    """
+    Column-major entries of the projection matrix, cached per parameter set.
+
+    Returns:
+        tuple: The 16 entries, column by column.
+    """
+    _check_planes(near, far)
+    f = 1.0 / tan(fov / 2.0)
+    depth = far - near
+    return (
+        f / ratio, 0.0, 0.0,                  0.0,
+        0.0,       f,   0.0,                  0.0,
+        0.0,       0.0, far / depth,          1.0,
+        0.0,       0.0, -(far * near) / depth, 0.0,
+    )
+
 def projection(fov: float, ratio: float, near: float, far: float):
     """
     Compute a 4x4 perspective projection matrix (OpenGL-style, column-major).
 
+    The entries are cached per (fov, ratio, near, far), so repeated calls with the same
+    parameters skip the trigonometry; each call still returns a fresh Matrix.
+
     Args:
         fov (float): Field of view (in radians).
         ratio (float): Aspect ratio (width / height).
@@ -13,21 +48,116 @@ def projection(fov: float, ratio: float, near: float, far: float):
     Returns:
         Matrix: The projection matrix.
     Raises:
-		ValueError: If near or far are non-positive, or if near is not less than far.
-	"""
-    if near <= 0 or far <= 0:
-        raise ValueError("Near and far must be positive.")
-    if near >= far:
-        raise ValueError("Near must be less than far.")
+        ValueError: If near or far are non-positive, or if near is not less than far.
+    """
+    return Matrix._wrap(array('d', _projection_entries(fov, ratio, near, far)), 4, 4)
 
-    f = 1.0 / tan(fov / 2.0)
-    a = ratio
-    n, fr = near, far
-
-    cols = [
-        [f / a, 0,    0,                     0],
-        [0,     f,    0,                     0],
-        [0,     0,    fr / (fr - n),         1],
-        [0,     0,   -(fr * n) / (fr - n),   0]
-    ]
-    return Matrix.from_columns(cols)
+def inverse_projection(fov: float, ratio: float, near: float, far: float):
+    """
+    Compute the inverse of projection(fov, ratio, near, far) in closed form.
+
+    The projection only has five non-zero entries, so its inverse is written out
+    directly instead of going through Matrix.inverse().
+
+    Args:
+        fov (float): Field of view (in radians).
+        ratio (float): Aspect ratio (width / height).
+        near (float): Near clipping plane.
+        far (float): Far clipping plane.
+    Returns:
+        Matrix: The inverse projection matrix.
+    Raises:
+        ValueError: If near or far are non-positive, or if near is not less than far.
+    """
+    _check_planes(near, far)
+    t = tan(fov / 2.0)
+    # P[2][2] = far / (far - near), P[2][3] = -far * near / (far - near)
+    inv_b = (near - far) / (far * near)
+    cols = array('d', (
+        ratio * t, 0.0, 0.0, 0.0,
+        0.0,       t,   0.0, 0.0,
+        0.0,       0.0, 0.0, inv_b,
+        0.0,       0.0, 1.0, 1.0 / near,
+    ))
+    return Matrix._wrap(cols, 4, 4)
+
+
+class Projection:
+    """
+    Mutable camera projection that keeps its matrix up to date incrementally.
+
+    Changing ratio (window resize) rewrites one entry, fov (zoom) two, near or far
+    two; nothing else is recomputed or reallocated.
+
+    Attributes:
+        matrix (Matrix): The current projection matrix, updated in place.
+    """
+
+    def __init__(self, fov, ratio, near, far):
+        """
+        Args:
+            fov (float): Field of view (in radians).
+            ratio (float): Aspect ratio (width / height).
+            near (float): Near clipping plane.
+            far (float): Far clipping plane.
+        Raises:
+            ValueError: If near or far are non-positive, or if near is not less than far.
+        """
+        self.matrix = projection(fov, ratio, near, far)
+        self._fov, self._ratio, self._near, self._far = fov, ratio, near, far
+        self._f = self.matrix[1, 1]
+
+    @property
+    def fov(self):
+        return self._fov
+
+    @fov.setter
+    def fov(self, fov):
+        self._fov = fov
+        self._f = 1.0 / tan(fov / 2.0)
+        self.matrix[0, 0] = self._f / self._ratio
+        self.matrix[1, 1] = self._f
+
+    @property
+    def ratio(self):
+        return self._ratio
+
+    @ratio.setter
+    def ratio(self, ratio):
+        self._ratio = ratio
+        self.matrix[0, 0] = self._f / ratio
+
+    @property
+    def near(self):
+        return self._near
+
+    @near.setter
+    def near(self, near):
+        self._set_planes(near, self._far)
+
+    @property
+    def far(self):
+        return self._far
+
+    @far.setter
+    def far(self, far):
+        self._set_planes(self._near, far)
+
+    def _set_planes(self, near, far):
+        """
+        Update the two depth entries.
+        """
+        _check_planes(near, far)
+        self._near, self._far = near, far
+        depth = far - near
+        self.matrix[2, 2] = far / depth
+        self.matrix[2, 3] = -(far * near) / depth
+
+    def inverse(self):
+        """
+        Closed-form inverse of the current projection (see inverse_projection).
+
+        Returns:
+            Matrix: The inverse projection matrix.
+        """
+        return inverse_projection(self._fov, self._ratio, self._near, self._far)
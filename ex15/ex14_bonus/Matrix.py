@@ -1,4 +1,9 @@
-from math import fma
+from array import array
+from cmath import isfinite
+from math import fma, inf, log
+from sys import float_info
+from operator import mul, neg
+import backend
 
 def my_abs(x):
 	if isinstance(x, complex):
@@ -8,13 +13,149 @@ def my_abs(x):
 	else:
 		return -x
 
+def _gauss_jordan(R, pivot_cols, tol):
+	"""
+	Gauss-Jordan elimination in place on a row-major working buffer (list of row lists)
+	of real or complex values.
+
+	Every step is a whole-row operation on one contiguous list: swap two list references,
+	scale the pivot row, then subtract a multiple of it from each other row. Pivots are
+	chosen by modulus among the first `pivot_cols` columns; the rest of each row (e.g. an
+	augmented identity block) is carried along.
+	Args:
+		R (list): The rows; modified in place.
+		pivot_cols (int): Number of leading columns that may hold pivots.
+		tol (float): Modulus at or under which entries are treated as zero.
+	Returns:
+		int: The number of pivots found.
+	"""
+	rows = len(R)
+	pivot_row = 0
+	for col in range(pivot_cols):
+		if pivot_row == rows:
+			break
+		pivot, max_val = None, tol
+		for r in range(pivot_row, rows):
+			val = my_abs(R[r][col])
+			if val > max_val:
+				pivot, max_val = r, val
+		if pivot is None:
+			continue # no pivot in this column
+		R[pivot_row], R[pivot] = R[pivot], R[pivot_row]
+		prow = R[pivot_row]
+		scale = 1 / prow[col]
+		prow[:] = [x * scale for x in prow]
+		for r in range(rows):
+			if r == pivot_row:
+				continue
+			row = R[r]
+			factor = row[col]
+			if my_abs(factor) > tol:
+				row[:] = [a - factor * b for a, b in zip(row, prow)]
+		pivot_row += 1
+	return pivot_row
+
 # Functions changed: __init__, mul_vec, mul_mat, trace, transpose, determinant, inverse
+class _Column:
+	"""
+	Live view of one matrix column: reads and writes go to the matrix storage.
+	"""
+	__slots__ = ('_matrix', '_j')
+
+	def __init__(self, matrix, j):
+		self._matrix = matrix
+		self._j = j
+
+	def __len__(self):
+		return self._matrix._rows
+
+	def _index(self, i):
+		n = self._matrix._rows
+		if i < 0:
+			i += n
+		if not (0 <= i < n):
+			raise IndexError("Column index out of range")
+		return i
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			return [self._matrix[k, self._j] for k in range(*i.indices(len(self)))]
+		return self._matrix[self._index(i), self._j]
+
+	def __setitem__(self, i, value):
+		if isinstance(i, slice):
+			indices = range(*i.indices(len(self)))
+			values = list(value)
+			if len(values) != len(indices):
+				raise ValueError("Column slice assignment cannot change the column length.")
+			for k, v in zip(indices, values):
+				self._matrix[k, self._j] = v
+			return
+		self._matrix[self._index(i), self._j] = value
+
+	def __iter__(self):
+		return iter(self._matrix._col(self._j))
+
+	def __eq__(self, other):
+		if isinstance(other, (_Column, list, tuple)):
+			return list(self) == list(other)
+		return NotImplemented
+
+	def __repr__(self):
+		return repr(list(self))
+
+class _Columns:
+	"""
+	Live column-major view of a matrix (outer sequence = columns), returned by Matrix.data.
+	"""
+	__slots__ = ('_matrix',)
+
+	def __init__(self, matrix):
+		self._matrix = matrix
+
+	def __len__(self):
+		return self._matrix._cols
+
+	def __getitem__(self, j):
+		n = self._matrix._cols
+		if isinstance(j, slice):
+			return [_Column(self._matrix, k) for k in range(*j.indices(n))]
+		if j < 0:
+			j += n
+		if not (0 <= j < n):
+			raise IndexError("Column index out of range")
+		return _Column(self._matrix, j)
+
+	def __iter__(self):
+		return (_Column(self._matrix, j) for j in range(self._matrix._cols))
+
+	def __eq__(self, other):
+		if isinstance(other, (_Columns, list, tuple)):
+			return [list(col) for col in self] == [list(col) for col in other]
+		return NotImplemented
+
+	def __repr__(self):
+		return repr([list(col) for col in self])
+
 class Matrix:
+	"""
+	Dense real or complex matrix backed by a planar pair of array('d') buffers.
+
+	Storage layout:
+	- `_planes` is a list [re, im]: real parts and imaginary parts, one unboxed double each.
+	- `im` is None while the matrix holds no complex values (it is allocated on the first complex write).
+	- Element (i, j) is stored at `_off + i * _rs + j * _cs` in both planes.
+	- Matrices built by this class are packed column-major: `_rs = 1`, `_cs = rows`.
+	- `_conj` marks a conjugated view: the imaginary plane is read (and written) negated.
+	  transpose() returns such a view over the same planes with rows/cols and strides swapped.
+	- Other views share the planes with a different offset/shape/strides: submatrix(),
+	  row(), column(), diagonal() and slicing (m[1:3, :]) select a strided window.
+	"""
 
 	def __init__(self, data):
 		"""
 		Initialize the Matrix in column-major order.
-		
+
 		Args:
 			data (list of lists): Row-major matrix (outer list = rows, inner list = row values).
 		Raises:
@@ -32,7 +173,312 @@ class Matrix:
 				raise ValueError(f"All rows must have the same length. Row {i} has {len(row)}, expected {expected_cols}")
 
 		# Transpose rows -> columns for column-major storage
-		self.data = [[row[j] for row in data] for j in range(expected_cols)]
+		values = []
+		for row in data:
+			values.extend(row)
+		re, im = Matrix._split(values)
+		rows = len(data)
+		self._init_storage([Matrix._transpose_packed(re, rows, expected_cols),
+			Matrix._transpose_packed(im, rows, expected_cols)], rows, expected_cols)
+
+	@staticmethod
+	def _split(values):
+		"""
+		Split a flat sequence of numbers into planar (re, im) buffers.
+		im is None when no value is complex.
+		"""
+		try:
+			return array('d', values), None # all real: one C-level conversion
+		except TypeError:
+			return array('d', [x.real for x in values]), array('d', [x.imag for x in values])
+
+	@staticmethod
+	def _transpose_packed(plane, rows, cols):
+		"""
+		Turn a packed row-major plane into a new packed column-major one
+		(one strided slice copy per column). None passes through.
+		"""
+		if plane is None or rows == 1 or cols == 1:
+			return plane
+		buf = array('d', bytes(8 * rows * cols))
+		for j in range(cols):
+			buf[j * rows:(j + 1) * rows] = plane[j::cols]
+		return buf
+
+	def _init_storage(self, planes, rows, cols, off=0, rs=1, cs=None, conj=False):
+		"""
+		Attach storage planes and their shape/stride metadata to this matrix.
+
+		Args:
+			planes (list): [re, im] array('d') buffers (im may be None).
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			off (int): Index of element (0, 0) in the buffers.
+			rs (int): Distance in the buffers between two consecutive rows.
+			cs (int): Distance in the buffers between two consecutive columns (defaults to rows).
+			conj (bool): Whether the stored values are the conjugates of this matrix's elements.
+		"""
+		self._planes = planes
+		self._conj = conj
+		if not cols:
+			rows = 0 # no columns means no elements: shape (0, 0), as for Matrix([[]])
+		self._rows = rows
+		self._cols = cols
+		self._off = off
+		self._rs = rs
+		self._cs = rows if cs is None else cs
+
+	@classmethod
+	def _wrap(cls, re, im, rows, cols):
+		"""
+		Create a Matrix around packed column-major planes without copying them.
+		"""
+		m = cls.__new__(cls)       # bypass __init__
+		m._init_storage([re, im], rows, cols)
+		return m
+
+	@classmethod
+	def _from_values(cls, values, rows, cols):
+		"""
+		Create a Matrix from a flat column-major sequence of numbers.
+		"""
+		re, im = cls._split(values)
+		return cls._wrap(re, im, rows, cols)
+
+	@property
+	def data(self):
+		"""
+		Live column-major view of the matrix (outer sequence = columns).
+
+		m.data[j][i] reads and writes element (i, j) in O(1), like the nested lists
+		this attribute used to hold; nothing is copied when it is accessed.
+		"""
+		return _Columns(self)
+
+	def _promote(self):
+		"""
+		Allocate the imaginary plane so the matrix can hold complex values.
+		"""
+		if self._planes[1] is None:
+			self._planes[1] = array('d', bytes(8 * len(self._planes[0])))
+
+	def _slice(self, start, count, step):
+		"""
+		Read `count` values starting at buffer index `start`, `step` apart.
+		"""
+		if not count:
+			return []
+		re, im = self._planes
+		stop = start + (count - 1) * step + 1
+		if im is None:
+			return re[start:stop:step].tolist()
+		if self._conj:
+			return list(map(complex, re[start:stop:step], map(neg, im[start:stop:step])))
+		return list(map(complex, re[start:stop:step], im[start:stop:step]))
+
+	def _write_slice(self, start, step, values):
+		"""
+		Write values into the buffers starting at index `start`, `step` apart.
+		"""
+		if not values:
+			return
+		re, im = self._planes
+		if im is None and any(isinstance(x, complex) for x in values):
+			self._promote()
+			im = self._planes[1]
+		stop = start + (len(values) - 1) * step + 1
+		re[start:stop:step] = array('d', [x.real for x in values])
+		if im is not None:
+			sign = -1.0 if self._conj else 1.0
+			im[start:stop:step] = array('d', [sign * x.imag for x in values])
+
+	def _col(self, j):
+		"""
+		Return column j as a list of numbers.
+		"""
+		return self._slice(self._off + j * self._cs, self._rows, self._rs)
+
+	def _row(self, i):
+		"""
+		Return row i as a list of numbers.
+		"""
+		return self._slice(self._off + i * self._rs, self._cols, self._cs)
+
+	def _set_row(self, i, values):
+		"""
+		Overwrite row i with the given values (in-place).
+		"""
+		self._write_slice(self._off + i * self._rs, self._cs, values)
+
+	def _values(self):
+		"""
+		Return the elements as a flat column-major list of numbers.
+		"""
+		if self._rs == 1 and self._cs == self._rows:
+			return self._slice(self._off, self._rows * self._cols, 1)
+		values = []
+		for j in range(self._cols):
+			values.extend(self._col(j))
+		return values
+
+	def _to_numpy(self, np):
+		"""
+		Return the matrix as a (rows, cols) ndarray: a zero-copy float64 view of the
+		real plane, or a complex128 array combining both planes.
+		"""
+		def view(plane):
+			base = np.frombuffer(plane, dtype=np.float64)[self._off:]
+			step = base.itemsize
+			return np.lib.stride_tricks.as_strided(base, shape=(self._rows, self._cols),
+				strides=(self._rs * step, self._cs * step))
+		re, im = self._planes
+		if im is None:
+			return view(re)
+		return view(re) - 1j * view(im) if self._conj else view(re) + 1j * view(im)
+
+	@classmethod
+	def _from_numpy(cls, nd):
+		"""
+		Create a packed column-major Matrix from a 2-D real or complex ndarray result.
+		"""
+		rows, cols = nd.shape
+		re = array('d')
+		re.frombytes(nd.real.astype('float64').tobytes(order='F'))
+		im = None
+		if nd.dtype.kind == 'c':
+			im = array('d')
+			im.frombytes(nd.imag.astype('float64').tobytes(order='F'))
+		return cls._wrap(re, im, rows, cols)
+
+	def _view(self, off, rows, cols, rs, cs, conj=None):
+		"""
+		Create a Matrix sharing this matrix's planes with the given offset, shape and strides
+		(and conjugation flag, by default the same as this matrix's).
+		"""
+		view = Matrix.__new__(Matrix)       # bypass __init__
+		view._init_storage(self._planes, rows, cols, off, rs, cs, self._conj if conj is None else conj)
+		return view
+
+	@staticmethod
+	def _axis(key, size):
+		"""
+		Resolve an index or slice along one axis to (start, count, step).
+		"""
+		if isinstance(key, slice):
+			start, stop, step = key.indices(size)
+			if step <= 0:
+				raise ValueError("Matrix slices only support positive steps.")
+			count = len(range(start, stop, step))
+			if not count:
+				raise ValueError("Matrix views must have at least one row and one column.")
+			return start, count, step
+		if not (0 <= key < size):
+			raise IndexError("Matrix index out of range")
+		return key, 1, 1
+
+	def _slice_view(self, i, j):
+		"""
+		View selected by a (row, column) key where either part may be a slice.
+		"""
+		r0, rows, r_step = Matrix._axis(i, self._rows)
+		c0, cols, c_step = Matrix._axis(j, self._cols)
+		return self._view(self._off + r0 * self._rs + c0 * self._cs, rows, cols,
+			self._rs * r_step, self._cs * c_step)
+
+	def submatrix(self, row_start, row_stop, col_start, col_stop):
+		"""
+		View of the block of rows [row_start, row_stop) and columns [col_start, col_stop).
+
+		The view shares storage with this matrix: reads and writes go to the same
+		elements, and it can be passed to any Matrix operation.
+
+		Args:
+			row_start (int): First row of the block.
+			row_stop (int): One past the last row.
+			col_start (int): First column of the block.
+			col_stop (int): One past the last column.
+		Returns:
+			Matrix: The block as a view.
+		Raises:
+			ValueError: If the bounds are out of range or the block is empty.
+		"""
+		if not (0 <= row_start < row_stop <= self._rows and 0 <= col_start < col_stop <= self._cols):
+			raise ValueError("Submatrix bounds out of range or empty.")
+		return self._slice_view(slice(row_start, row_stop), slice(col_start, col_stop))
+
+	def row(self, i):
+		"""
+		View of row i as a 1 x cols matrix sharing storage with this one.
+		"""
+		return self._slice_view(i, slice(None))
+
+	def column(self, j):
+		"""
+		View of column j as a rows x 1 matrix sharing storage with this one.
+		"""
+		return self._slice_view(slice(None), j)
+
+	def diagonal(self):
+		"""
+		View of the main diagonal as a min(rows, cols) x 1 matrix sharing storage with this one.
+		"""
+		n = min(self._rows, self._cols)
+		if not n:
+			raise ValueError("Matrix is empty.")
+		return self._view(self._off, n, 1, self._rs + self._cs, self._cs)
+
+	def __getitem__(self, key):
+		"""
+		Read element (i, j), or get a view when either index is a slice.
+
+		Args:
+			key (tuple): (row, column) indices or slices (positive steps), e.g. m[0:2, :].
+		Returns:
+			number or Matrix: The element, or a view sharing storage (an index keeps its axis,
+				so m[i, :] is 1 x cols).
+		Raises:
+			IndexError: If an index is out of range.
+			ValueError: If a slice is empty or has a non-positive step.
+		"""
+		i, j = key
+		if isinstance(i, slice) or isinstance(j, slice):
+			return self._slice_view(i, j)
+		if not (0 <= i < self._rows and 0 <= j < self._cols):
+			raise IndexError("Matrix index out of range")
+		k = self._off + i * self._rs + j * self._cs
+		re, im = self._planes
+		if im is None:
+			return re[k]
+		return complex(re[k], -im[k] if self._conj else im[k])
+
+	def __setitem__(self, key, value):
+		"""
+		Write element (i, j) in place, or assign a block when either index is a slice.
+
+		Args:
+			key (tuple): (row, column) indices or slices.
+			value (number or Matrix): The new value; for a block, a Matrix of the block's shape
+				or a scalar to fill it with.
+		Raises:
+			IndexError: If an index is out of range.
+			ValueError: If the assigned Matrix does not match the block's shape.
+		"""
+		i, j = key
+		if isinstance(i, slice) or isinstance(j, slice):
+			target = self._slice_view(i, j)
+			rows = target._rows
+			if isinstance(value, Matrix):
+				if value.shape() != target.shape():
+					raise ValueError("Assigned matrix must have the same shape as the block.")
+				values = value._values() # copied first, so overlapping blocks are safe
+			else:
+				values = [value] * (rows * target._cols)
+			for c in range(target._cols):
+				target._write_slice(target._off + c * target._cs, target._rs, values[c * rows:(c + 1) * rows])
+			return
+		if not (0 <= i < self._rows and 0 <= j < self._cols):
+			raise IndexError("Matrix index out of range")
+		self._write_slice(self._off + i * self._rs + j * self._cs, 1, [value])
 
 	def mul_vec(self, vector):
 		"""
@@ -42,20 +488,28 @@ class Matrix:
 		from Vector import Vector
 		if not isinstance(vector, Vector):
 			raise ValueError("The operand must be a Vector.")
-		if not self.data:
+		if not self._rows or not self._cols:
 			raise ValueError("Matrix is empty.")
 
 		rows, cols = self.shape()
 		if vector.size() != cols:
 			raise ValueError(f"Incompatible dimensions: matrix has {cols} cols, vector has size {vector.size()}")
 
-		results = []
-		for i in range(rows):  # iterate rows
-			dot = 0
-			for j in range(cols):  # iterate columns
-				dot += self.data[j][i] * vector.data[j]
-			results.append(dot)
-		return Vector(results)
+		np = backend.active_numpy()
+		if np is not None:
+			return Vector._wrap((self._to_numpy(np) @ np.asarray(vector.data)).tolist())
+
+		if self._rs != 1:
+			# rows are contiguous (e.g. a transposed view): one dot product per row
+			return Vector._wrap([sum(map(mul, self._row(i), vector.data)) for i in range(rows)])
+		# columns are contiguous: accumulate x_j * column j, skipping zero components
+		# of finite columns only (0 * inf is nan, as under the NumPy backend)
+		acc = [0] * rows
+		for j, x in enumerate(vector.data):
+			col = self._col(j)
+			if x or not all(map(isfinite, col)):
+				acc = [a + x * c for a, c in zip(acc, col)]
+		return Vector._wrap(acc)
 
 	def mul_mat(self, mat):
 		"""
@@ -64,7 +518,7 @@ class Matrix:
 		"""
 		if not isinstance(mat, Matrix):
 			raise ValueError("Argument must be a Matrix.")
-		if not self.data or not mat.data:
+		if not self._rows or not self._cols or not mat._rows or not mat._cols:
 			raise ValueError("One of the matrices is empty.")
 
 		rows_A, cols_A = self.shape()
@@ -73,203 +527,409 @@ class Matrix:
 		if cols_A != rows_B:
 			raise ValueError(f"Incompatible dimensions: A is {rows_A}x{cols_A}, B is {rows_B}x{cols_B}")
 
-		result_cols = []
+		np = backend.active_numpy()
+		if np is not None:
+			return Matrix._from_numpy(self._to_numpy(np) @ mat._to_numpy(np))
+		if self._is_transpose_of(mat) or mat._is_transpose_of(self):
+			return self._mul_gram()
+
+		a_rows = [self._row(i) for i in range(rows_A)]
+		values = []
 		for j in range(cols_B):           # for each column of B / C
-			col_result = []
-			for i in range(rows_A):       # for each row of A / C
+			b_col = mat._col(j)
+			for a_row in a_rows:          # for each row of A / C
 				dot = 0
-				for k in range(cols_A):   # shared dimension
-					dot += self.data[k][i] * mat.data[j][k]  # A[i,k] * B[k,j]
-				col_result.append(dot)
-			result_cols.append(col_result)
-		return Matrix.from_columns(result_cols)
+				for a, b in zip(a_row, b_col):   # shared dimension
+					dot += a * b          # A[i,k] * B[k,j]
+				values.append(dot)
+		return Matrix._from_values(values, rows_A, cols_B)
+
+	def _mul_gram(self):
+		"""
+		Product C = A·A^H where the right operand is a conjugate-transposed view of A
+		(covers A^H·A when A is itself a view).
+
+		C is Hermitian: C[i, j] is row i of A dotted with the conjugate of row j, so only
+		the upper triangle is computed and the lower one is its conjugate mirror.
+		"""
+		n = self._rows
+		rows = [self._row(i) for i in range(n)]
+		conj_rows = [[x.conjugate() for x in row] for row in rows]
+		values = [0] * (n * n)
+		for i, row_i in enumerate(rows):
+			for j in range(i, n):
+				c = sum(map(mul, row_i, conj_rows[j]))
+				values[j * n + i] = c
+				values[i * n + j] = c.conjugate()
+		return Matrix._from_values(values, n, n)
 
 	def trace(self):
 		if not self.is_square():
 			raise ValueError("Trace is only defined for square matrices.")
-		if not self.data:
-			return 0
 		diag_sum = 0
-		for i in range(len(self.data)):
-			diag_sum += self.data[i][i]
+		for i in range(self._rows):
+			diag_sum += self[i, i]
 		return diag_sum
 
 	def transpose(self):
 		"""
-		Return the conjugate transpose (Hermitian transpose) B = A^H,
-		stored in column-major order.
+		Return the conjugate transpose (Hermitian transpose) B = A^H as an O(1) view.
+
+		B shares A's planes with rows/cols and strides swapped and the conjugation flag
+		toggled, so nothing is copied and writes through either matrix are visible in both.
+		Call copy() on the result for an independent, packed column-major matrix.
+		"""
+		return self._view(self._off, self._cols, self._rows, self._cs, self._rs, not self._conj)
+
+	def _is_transpose_of(self, other):
+		"""
+		Check whether this matrix is a conjugate-transposed view of other.
 		"""
-		if not self.data:
-			return Matrix.from_columns([])
+		return (self._planes is other._planes and self._off == other._off
+			and self._rs == other._cs and self._cs == other._rs
+			and self._rows == other._cols and self._cols == other._rows
+			and self._conj != other._conj)
 
-		rows, cols = self.shape()
-		new_cols = []
-		for i in range(rows):  # new column index
-			new_col = []
-			for j in range(cols):  # go through old columns
-				new_col.append(self.data[j][i].conjugate())
-			new_cols.append(new_col)
+	def _lu_factor(self):
+		"""
+		LU-factorize a square matrix with partial pivoting: P·A = L·U.
 
-		return Matrix.from_columns(new_cols)
+		Works on a row-major scratch copy (list of row lists) of real or complex values.
+		L (unit lower) and U (upper) share that storage. Pivots are chosen by modulus;
+		a column whose candidates are all within rounding error of zero (at most
+		n * epsilon * the largest modulus in the matrix, so the test follows the matrix
+		scale) is zeroed and skipped, leaving an exact zero on U's diagonal.
+		Returns:
+			tuple: (LU rows, perm, parity) where perm[i] is the original index of row i
+				and parity is +1.0 or -1.0 for an even or odd number of row swaps.
+		"""
+		n = self._rows
+		LU = [self._row(i) for i in range(n)]
+		tol = n * float_info.epsilon * max((my_abs(x) for row in LU for x in row), default=0.0)
+		perm = list(range(n))
+		parity = 1.0
+
+		for k in range(n):
+			# pick the largest-modulus pivot in column k
+			pivot = k
+			max_val = my_abs(LU[k][k])
+			for r in range(k + 1, n):
+				val = my_abs(LU[r][k])
+				if val > max_val:
+					max_val = val
+					pivot = r
+			if max_val <= tol:
+				for r in range(k, n):
+					LU[r][k] = 0.0 # rounding residue only: singular
+				continue
+			if pivot != k:
+				LU[k], LU[pivot] = LU[pivot], LU[k]
+				perm[k], perm[pivot] = perm[pivot], perm[k]
+				parity = -parity
+
+			pivot_val = LU[k][k]
+			tail = LU[k][k + 1:]
+			for r in range(k + 1, n):
+				row = LU[r]
+				factor = row[k] / pivot_val
+				row[k] = factor
+				if factor:
+					row[k + 1:] = [a - factor * b for a, b in zip(row[k + 1:], tail)]
+		return LU, perm, parity
 
 	def determinant(self):
+		"""
+		Calculate the determinant of the matrix (real or complex).
+
+		Uses ad - bc up to 2x2, otherwise an O(n^3) LU factorization with partial pivoting:
+		the product of U's diagonal, negated once per row swap.
+		"""
 		if not self.is_square():
 			raise ValueError("Determinant is only defined for square matrices.")
-		
+
 		n, _ = self.shape()
-		if n == 0:
-			raise ValueError("Determinant is not defined for empty matrices.")
-		if n > 4:
-			raise NotImplementedError("Determinant calculation is only implemented for matrices up to 4x4.")
-		
 		if n == 1:
-			return self.data[0][0]
+			return self[0, 0]
 		elif n == 2:
-			a, b = self.data[0][0], self.data[1][0]
-			c, d = self.data[0][1], self.data[1][1]
+			a, b = self[0, 0], self[0, 1]
+			c, d = self[1, 0], self[1, 1]
 			return a * d - b * c
-		
-		det = 0  # <-- was 0.0
-		for col in range(n):
-			elem = self.data[col][0]
-			if abs(elem) < 1e-9:
-				continue
 
-			minor_cols = []
-			for j in range(n):
-				if j == col:
-					continue
-				minor_col = self.data[j][1:]
-				minor_cols.append(minor_col)
-			minor = Matrix.from_columns(minor_cols)
+		np = backend.active_numpy()
+		if np is not None:
+			return np.linalg.det(self._to_numpy(np)).item()
 
-			cofactor = ((-1) ** col) * elem * minor.determinant()
-			det += cofactor
+		LU, _, det = self._lu_factor()
+		for k in range(n):
+			d = LU[k][k]
+			if d == 0:
+				return 0.0 # skipped column: singular
+			det *= d
 		return det
 
+	def slogdet(self):
+		"""
+		Calculate the sign and the natural log of the modulus of the determinant.
+
+		det = sign * exp(logabsdet), without overflow for large matrices. For complex
+		matrices sign is the unit-modulus phase det / |det|.
+		Returns:
+			tuple: (sign, logabsdet); (0.0, -inf) for a singular matrix.
+		"""
+		if not self.is_square():
+			raise ValueError("Determinant is only defined for square matrices.")
+
+		np = backend.active_numpy()
+		if np is not None:
+			sign, logabsdet = np.linalg.slogdet(self._to_numpy(np))
+			return sign.item(), float(logabsdet)
+
+		LU, _, sign = self._lu_factor()
+		logabsdet = 0.0
+		for k in range(self._rows):
+			d = LU[k][k]
+			if d == 0:
+				return 0.0, -inf
+			modulus = my_abs(d)
+			sign *= d / modulus
+			logabsdet += log(modulus)
+		return sign, logabsdet
+
 	def inverse(self):
 		if not self.is_square():
 			raise ValueError("Inverse is only defined for square matrices.")
 		n, _ = self.shape()
 
-		A = self.copy()
-		I = Matrix.identity(n)
-
-		for col in range(n):
-			# find pivot in current column
-			pivot = None
-			max_val = 0
-			for r in range(col, n):
-				if abs(A.data[col][r]) > max_val + 1e-9:
-					max_val = abs(A.data[col][r])
-					pivot = r
-			if pivot is None or abs(max_val) < 1e-9:
-				raise ValueError("Matrix is singular and cannot be inverted.")
-			
-			# Swap pivot row with current row
-			if pivot != col:
-				A.swap_rows(col, pivot)
-				I.swap_rows(col, pivot)
-
-			# Scale pivot row to make pivot = 1
-			pivot_val = A.data[col][col]
-			if abs(pivot_val) < 1e-9:
+		np = backend.active_numpy()
+		if np is not None:
+			a = self._to_numpy(np)
+			if backend.rank(a, 1e-9) < n:
 				raise ValueError("Matrix is singular and cannot be inverted.")
-			scale = 1 / pivot_val
-			A.scale_row(col, scale)
-			I.scale_row(col, scale)
-
-			# Eliminate all other rows
-			for r in range(n):
-				if r == col:
-					continue
-				factor = A.data[col][r]
-				if abs(factor) > 1e-9:
-					A.add_multiple_of_row(r, col, -factor)
-					I.add_multiple_of_row(r, col, -factor)
-		return I
+			return Matrix._from_numpy(np.linalg.inv(a))
+
+		# [A | I] as one row list per row
+		R = [self._row(i) + [0.0] * n for i in range(n)]
+		for i in range(n):
+			R[i][n + i] = 1.0
+		if _gauss_jordan(R, n, 1e-9) < n:
+			raise ValueError("Matrix is singular and cannot be inverted.")
+		return Matrix.from_rows([row[n:] for row in R], validate=False)
 
 	@classmethod
 	def from_columns(cls, columns):
 		"""
 		Create a Matrix directly from column-major data.
-		
+
 		Args:
 			columns (list of lists): Column-major representation
 									(outer list = columns, inner list = values in that column).
+		Raises:
+			ValueError: If columns are of inconsistent lengths.
 		"""
-		m = cls.__new__(cls)       # bypass __init__
-		m.data = [list(col) for col in columns]
-		return m
+		rows = len(columns[0]) if columns else 0
+		values = []
+		for j, col in enumerate(columns):
+			if len(col) != rows:
+				raise ValueError(f"All columns must have the same length. Column {j} has {len(col)}, expected {rows}")
+			values.extend(col)
+		return cls._from_values(values, rows, len(columns))
+
+	@classmethod
+	def _from_planes(cls, re, im, rows, cols, row_major):
+		"""
+		Create a Matrix owning flat planes of rows * cols elements in the given order.
+		"""
+		if rows <= 0 or cols <= 0:
+			raise ValueError("Matrix dimensions must be positive.")
+		if len(re) != rows * cols:
+			raise ValueError(f"Expected {rows * cols} elements for a {rows}x{cols} matrix, got {len(re)}")
+		if row_major:
+			re = cls._transpose_packed(re, rows, cols)
+			im = cls._transpose_packed(im, rows, cols)
+		return cls._wrap(re, im, rows, cols)
+
+	@classmethod
+	def from_buffer(cls, buf, rows, cols, row_major=False):
+		"""
+		Create a Matrix from a flat buffer of numbers with a single bulk copy.
+
+		Args:
+			buf (sequence): array('d'), memoryview or other buffer of doubles (buffers of other
+				item types such as array('f') or array('i') are converted), or any flat
+				sequence of (possibly complex) numbers.
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			row_major (bool): Whether buf is row-major (default: column-major, like the storage).
+		Returns:
+			Matrix: A new matrix; it does not share memory with buf.
+		Raises:
+			ValueError: If the dimensions are not positive or do not match the buffer length.
+		"""
+		try:
+			view = memoryview(buf)
+		except TypeError:
+			view = None
+		if view is not None and view.format == 'd':
+			re, im = array('d'), None
+			# strided views cannot be cast; tobytes() gathers them in logical order
+			re.frombytes(view.cast('B') if view.c_contiguous else view.tobytes())
+		elif view is not None:
+			# other item types (float32, ints, ...): flatten multi-dimensional views first
+			if view.ndim != 1:
+				view = memoryview(view.tobytes()).cast(view.format)
+			re, im = cls._split(view.tolist())
+		else:
+			re, im = cls._split(buf if isinstance(buf, list) else list(buf))
+		return cls._from_planes(re, im, rows, cols, row_major)
+
+	@classmethod
+	def from_iter(cls, iterable, rows, cols, row_major=False):
+		"""
+		Create a Matrix by consuming an iterable (e.g. a generator) of numbers.
+
+		Args:
+			iterable (iterable): The rows * cols elements.
+			rows (int): Number of rows.
+			cols (int): Number of columns.
+			row_major (bool): Whether the elements come row by row (default: column by column).
+		Returns:
+			Matrix: A new matrix.
+		Raises:
+			ValueError: If the dimensions are not positive or the element count does not match.
+		"""
+		re, im = cls._split(list(iterable))
+		return cls._from_planes(re, im, rows, cols, row_major)
+
+	@classmethod
+	def from_rows(cls, rows, validate=True):
+		"""
+		Create a Matrix from row-major data (any iterable of rows).
+
+		Args:
+			rows (iterable): Rows, each a sequence of numbers.
+			validate (bool): Check row lengths and element types like __init__. With False only
+				the total element count is checked; the caller vouches for the data.
+		Returns:
+			Matrix: A new matrix.
+		Raises:
+			ValueError: If there are no rows or (when validating) row lengths or element types are invalid.
+		"""
+		values = []
+		count = 0
+		cols = None
+		for row in rows:
+			if cols is None:
+				cols = len(row)
+			elif validate and len(row) != cols:
+				raise ValueError(f"All rows must have the same length. Row {count} has {len(row)}, expected {cols}")
+			values.extend(row)
+			count += 1
+		if not count:
+			raise ValueError("Data must contain at least one row.")
+		if validate and not all(isinstance(x, (int, float, complex)) for x in values):
+			raise ValueError("All elements in data must be int, float, or complex.")
+		re, im = cls._split(values)
+		return cls._from_planes(re, im, count, cols, True)
+
+	@classmethod
+	def zeros(cls, rows, cols):
+		"""
+		Create a rows x cols matrix of zeros.
+		"""
+		return cls._from_planes(array('d', bytes(8 * rows * cols)), None, rows, cols, False)
+
+	@classmethod
+	def full(cls, rows, cols, value):
+		"""
+		Create a rows x cols matrix with every element set to value (which may be complex).
+		"""
+		n = rows * cols
+		im = array('d', [value.imag]) * n if isinstance(value, complex) else None
+		return cls._from_planes(array('d', [value.real]) * n, im, rows, cols, False)
 
 	def rank(self):
 		"""
-		Calculate the rank of the matrix using its row echelon form.
+		Calculate the rank of the matrix: the number of pivots above 1e-9 in modulus found by
+		forward elimination (see _count_pivots), or by backend.rank under the NumPy backend.
 
 		Returns:
 			int: The rank of the matrix.
 		"""
-		A = self.row_echelon()
-		rows, cols = A.shape()
-		rank = 0
-		for i in range(rows):
-			# if any nonzero entry in row i
-			if any(abs(A.data[j][i]) > 1e-9 for j in range(cols)):
-				rank += 1
-		return rank
+		np = backend.active_numpy()
+		if np is not None:
+			if not self._rows or not self._cols:
+				return 0
+			return backend.rank(self._to_numpy(np), 1e-9)
+		return self._count_pivots()
 
-	def swap_rows(self, i, j):
+	def _count_pivots(self, target=None):
 		"""
-		Swap row i and row j in the matrix (in-place).
+		Count pivots with forward elimination only (no back elimination, no normalized rows).
+
+		Works on a row-major scratch copy of real or complex values with partial pivoting
+		by modulus; entries at or below 1e-9 in modulus count as zero.
+		Args:
+			target (int): Optional pivot count of interest; elimination stops as soon as it is
+				reached or can no longer be reached with the remaining columns.
+		Returns:
+			int: The number of pivots found (the rank when target is None).
 		"""
-		rows, cols = self.shape()
-		if not (0 <= i < rows and 0 <= j < rows):
-			raise IndexError("Row index out of range")
-		if i == j:
-			return
-		for col in self.data:
-			col[i], col[j] = col[j], col[i]
+		rows, cols = self._rows, self._cols
+		R = [self._row(i) for i in range(rows)]
+		pivots = 0
+		for col in range(cols):
+			if pivots == rows or pivots == target:
+				break
+			if target is not None and pivots + cols - col < target:
+				break # not enough columns left
+			pivot, max_val = None, 1e-9
+			for r in range(pivots, rows):
+				val = my_abs(R[r][col])
+				if val > max_val:
+					pivot, max_val = r, val
+			if pivot is None:
+				continue # no pivot in this column
+			R[pivots], R[pivot] = R[pivot], R[pivots]
+			pivot_row = R[pivots]
+			tail = pivot_row[col + 1:]
+			for r in range(pivots + 1, rows):
+				row = R[r]
+				if row[col]:
+					factor = row[col] / pivot_row[col]
+					row[col + 1:] = [a - factor * b for a, b in zip(row[col + 1:], tail)]
+			pivots += 1
+		return pivots
 
-	def row_echelon(self):
-		A = self.copy()
-		rows, cols = A.shape()
-		pivot_row = 0
+	def is_full_rank(self):
+		"""
+		Check whether the rank equals min(rows, cols), stopping at the first column that
+		makes it unreachable.
 
-		for col in range(cols):
-			# Find pivot in current column (largest modulus)
-			pivot = None
-			max_val = 0
-			for r in range(pivot_row, rows):
-				val = my_abs(A.data[col][r])
-				if val > max_val + 1e-12:  # strictly compare modulus
-					max_val = val
-					pivot = r
+		Returns:
+			bool: True if the matrix has full rank.
+		"""
+		target = min(self._rows, self._cols)
+		if backend.active_numpy() is not None:
+			return self.rank() == target
+		return self._count_pivots(target) == target
 
-			if pivot is None:
-				continue
+	def is_invertible(self):
+		"""
+		Check whether the matrix is square and non-singular, without computing the inverse.
 
-			# Swap pivot row with current row
-			if pivot != pivot_row:
-				A.swap_rows(pivot_row, pivot)
-
-			# Normalize pivot row so pivot = 1
-			pivot_val = A.data[col][pivot_row]
-			if my_abs(pivot_val) > 1e-12:
-				A.scale_row(pivot_row, 1.0 / pivot_val)
-
-			# Eliminate other rows
-			for r in range(rows):
-				if r == pivot_row:
-					continue
-				factor = A.data[col][r]
-				if my_abs(factor) > 1e-12:
-					A.add_multiple_of_row(r, pivot_row, -factor)
-
-			pivot_row += 1
-			if pivot_row >= rows:
-				break
+		Returns:
+			bool: True if the matrix is invertible.
+		"""
+		return self.is_square() and self.is_full_rank()
+
+	def row_echelon(self):
+		np = backend.active_numpy()
+		if np is not None and self._rows and self._cols:
+			return Matrix._from_numpy(backend.rref(np.array(self._to_numpy(np)), 1e-12))
 
-		return A
+		R = [self._row(i) for i in range(self._rows)]
+		_gauss_jordan(R, self._cols, 1e-12)
+		return Matrix.from_rows(R, validate=False)
 
 	@staticmethod
 	def identity(n):
@@ -281,12 +941,10 @@ class Matrix:
 		Returns:
 			Matrix: An n x n identity matrix.
 		"""
-		cols = []
+		re = array('d', bytes(8 * n * n))
 		for j in range(n):
-			col = [0.0] * n
-			col[j] = 1.0
-			cols.append(col)
-		return Matrix.from_columns(cols)
+			re[j * n + j] = 1.0
+		return Matrix._wrap(re, None, n, n)
 
 
 	def copy(self):
@@ -296,7 +954,15 @@ class Matrix:
 		Returns:
 			Matrix: A new Matrix instance that is a copy of the current matrix.
 		"""
-		return Matrix.from_columns([col[:] for col in self.data])
+		n = self._rows * self._cols
+		re, im = self._planes
+		if self._rs == 1 and self._cs == self._rows:
+			re_copy = re[self._off:self._off + n]
+			im_copy = None if im is None else im[self._off:self._off + n]
+			if im_copy is not None and self._conj:
+				im_copy = array('d', map(neg, im_copy))
+			return Matrix._wrap(re_copy, im_copy, self._rows, self._cols)
+		return Matrix._from_values(self._values(), self._rows, self._cols)
 
 
 	def add_multiple_of_row(self, target, source, scalar):
@@ -313,8 +979,8 @@ class Matrix:
 		rows, _ = self.shape()
 		if not (0 <= target < rows and 0 <= source < rows):
 			raise IndexError("Row index out of range")
-		for col in self.data:
-			col[target] += scalar * col[source]
+		src = self._row(source)
+		self._set_row(target, [t + scalar * s for t, s in zip(self._row(target), src)])
 
 
 	def scale_row(self, i, scalar):
@@ -330,8 +996,7 @@ class Matrix:
 		rows, _ = self.shape()
 		if not (0 <= i < rows):
 			raise IndexError("Row index out of range")
-		for col in self.data:
-			col[i] *= scalar
+		self._set_row(i, [x * scalar for x in self._row(i)])
 
 
 	def swap_rows(self, i, j):
@@ -349,8 +1014,16 @@ class Matrix:
 			raise IndexError("Row index out of range")
 		if i == j:
 			return
-		for col in self.data:
-			col[i], col[j] = col[j], col[i]
+		cs = self._cs
+		start_i = self._off + i * self._rs
+		start_j = self._off + j * self._rs
+		span = (cols - 1) * cs + 1
+		for plane in self._planes:
+			if plane is None:
+				continue
+			row_i = plane[start_i:start_i + span:cs]
+			plane[start_i:start_i + span:cs] = plane[start_j:start_j + span:cs]
+			plane[start_j:start_j + span:cs] = row_i
 
 	def __add__(self, other):
 		"""
@@ -360,13 +1033,15 @@ class Matrix:
 			other (Matrix): The matrix to add.
 		Returns:
 			Matrix: A new Matrix instance representing the sum.
+		Raises:
+			ValueError: If the matrices have different shapes.
 		"""
 		if not isinstance(other, Matrix):
 			return NotImplemented
-		result_cols = []
-		for col_self, col_other in zip(self.data, other.data):
-			result_cols.append([a + b for a, b in zip(col_self, col_other)])
-		return Matrix.from_columns(result_cols)
+		if self.shape() != other.shape():
+			raise ValueError("Matrices must have the same shape.")
+		values = [a + b for a, b in zip(self._values(), other._values())]
+		return Matrix._from_values(values, self._rows, self._cols)
 
 	def __sub__(self, other):
 		"""
@@ -376,14 +1051,16 @@ class Matrix:
 			other (Matrix): The matrix to subtract.
 		Returns:
 			Matrix: A new Matrix instance representing the difference.
+		Raises:
+			ValueError: If the matrices have different shapes.
 		"""
 		if not isinstance(other, Matrix):
 			return NotImplemented
-		result_cols = []
-		for col_self, col_other in zip(self.data, other.data):
-			result_cols.append([a - b for a, b in zip(col_self, col_other)])
-		return Matrix.from_columns(result_cols)
-	
+		if self.shape() != other.shape():
+			raise ValueError("Matrices must have the same shape.")
+		values = [a - b for a, b in zip(self._values(), other._values())]
+		return Matrix._from_values(values, self._rows, self._cols)
+
 	def scl(self, scalar):
 		"""
 		Scale the matrix by a scalar.
@@ -393,16 +1070,14 @@ class Matrix:
 		Returns:
 			Matrix: A new Matrix instance representing the scaled matrix.
 		"""
-		result_cols = []
-		for col in self.data:
-			result_cols.append([scalar * x for x in col])
-		return Matrix.from_columns(result_cols)
-	
+		values = [scalar * x for x in self._values()]
+		return Matrix._from_values(values, self._rows, self._cols)
+
 	def __eq__(self, other):
 		"""
 		Check if two matrices are equal within a small tolerance.
 		Handles real and complex entries (treats 1.0 and (1+0j) as equal).
-		
+
 		Args:
 			other (Matrix): The matrix to compare with.
 		Returns:
@@ -412,17 +1087,11 @@ class Matrix:
 			return False
 		if self.shape() != other.shape():
 			return False
-		
+
 		tol = 1e-6
-		for i in range(len(self.data)):
-			for j in range(len(self.data[i])):
-				a = self.data[i][j]
-				b = other.data[i][j]
-				try:
-					if abs(a - b) > tol:
-						return False
-				except Exception:
-					return False
+		for a, b in zip(self._values(), other._values()):
+			if abs(a - b) > tol:
+				return False
 		return True
 
 	def shape(self):
@@ -432,10 +1101,8 @@ class Matrix:
 		Returns:
 			tuple: A tuple (rows, cols) representing the shape of the matrix.
 		"""
-		if not self.data:
-			return (0, 0)
-		return (len(self.data[0]), len(self.data))  # (rows, cols)
-	
+		return (self._rows, self._cols)
+
 	def is_square(self):
 		"""
 		Check if the matrix is square (number of rows equals number of columns).
@@ -443,28 +1110,24 @@ class Matrix:
 		Returns:
 			bool: True if the matrix is square, False otherwise.
 		"""
-		if not self.data:
+		if not self._rows or not self._cols:
 			return False
-		rows, cols = self.shape()
-		return rows == cols
+		return self._rows == self._cols
 
 	def __str__(self):
-		if not self.data:
+		if not self._rows or not self._cols:
 			return "M[]"
-		rows, cols = self.shape()
 		lines = []
-		for i in range(rows):
-			row = [str(self.data[j][i]) for j in range(cols)]
-			lines.append("[" + ", ".join(row) + "]")
+		for i in range(self._rows):
+			lines.append("[" + ", ".join(map(str, self._row(i))) + "]")
 		return "\n".join(lines)
-	
+
 	def to_vector(self):
-		""" 
+		"""
 		Convert the matrix into a vector by flattening its elements.
 
 		Returns:
 			Vector: A new Vector instance containing all elements of the matrix in a single list.
 		"""
 		from Vector import Vector
-		flat = [elem for col in self.data for elem in col]
-		return Vector(flat)
+		return Vector._wrap(self._values())
@@ -1,4 +1,5 @@
 from math import fma
+import backend
 
 def my_abs(x):
 	if isinstance(x, complex):
@@ -27,12 +28,26 @@ class Vector:
 			raise ValueError("All elements in data must be int, float, or complex.")
 		self.data = data[:]
 
+	@classmethod
+	def _wrap(cls, data):
+		"""
+		Create a Vector that takes ownership of a freshly built list, without copying
+		or type-checking its elements (for internal results).
+		"""
+		v = cls.__new__(cls)       # bypass __init__
+		v.data = data
+		return v
+
 	def dot(self, other):
 		if not isinstance(other, Vector):
 			raise ValueError("The operand must be a Vector.")
 		if len(self.data) != len(other.data):
 			raise ValueError("Vectors must be the same size.")
 
+		np = backend.active_numpy()
+		if np is not None:
+			return np.vdot(np.asarray(self.data), np.asarray(other.data)).item()
+
 		result = 0
 		for a, b in zip(self.data, other.data):
 			result += a.conjugate() * b
@@ -49,7 +64,7 @@ class Vector:
 		"""
 		if not isinstance(other, Vector):
 			return NotImplemented
-		return Vector([a + b for a, b in zip(self.data, other.data)])
+		return Vector._wrap([a + b for a, b in zip(self.data, other.data)])
 
 	def __sub__(self, other):
 		"""
@@ -62,7 +77,7 @@ class Vector:
 		"""
 		if not isinstance(other, Vector):
 			return NotImplemented
-		return Vector([a - b for a, b in zip(self.data, other.data)])
+		return Vector._wrap([a - b for a, b in zip(self.data, other.data)])
 	
 	def scl(self, scalar):
 		"""
@@ -73,7 +88,7 @@ class Vector:
 		Returns:
 			Vector: A new Vector instance representing the scaled vector.
 		"""
-		return Vector([scalar * x for x in self.data])
+		return Vector._wrap([scalar * x for x in self.data])
 	
 	def __eq__(self, other):
 		"""
@@ -107,6 +122,9 @@ class Vector:
 		"""
 		if not self.data:
 			return 0.0
+		np = backend.active_numpy()
+		if np is not None:
+			return float(np.abs(np.asarray(self.data)).sum())
 		result = 0.0
 		for i in range(len(self.data)):
 			result = fma(my_abs(self.data[i]), 1.0, result)
@@ -121,6 +139,9 @@ class Vector:
 		"""
 		if not self.data:
 			return 0.0
+		np = backend.active_numpy()
+		if np is not None:
+			return float(np.linalg.norm(np.asarray(self.data)))
 		result = 0.0
 		for i in range(len(self.data)):
 			result = fma(self.data[i], self.data[i], result)
@@ -135,6 +156,9 @@ class Vector:
 		"""
 		if not self.data:
 			return 0.0
+		np = backend.active_numpy()
+		if np is not None:
+			return float(np.abs(np.asarray(self.data)).max())
 		return max(my_abs(x) for x in self.data)
 
 
@@ -164,13 +188,15 @@ class Vector:
 		Returns:
 			Matrix: A new Matrix instance with the specified dimensions.
 		Raises:
-			ValueError: If the vector size does not match rows * cols.
+			ValueError: If rows or cols is not positive, or the vector size does not match rows * cols.
 		"""
 		from Matrix import Matrix
+		if rows <= 0 or cols <= 0:
+			raise ValueError("Matrix dimensions must be positive.")
 		if self.size() != rows * cols:
 			raise ValueError("Cannot reshape vector to the specified matrix dimensions.")
-		matrix_data = []
-		for i in range(rows):
-			row = self.data[i*cols:(i+1)*cols]
-			matrix_data.append(row)
-		return Matrix(matrix_data)
\ No newline at end of file
+		# the data is row-major; gather it column by column
+		values = []
+		for j in range(cols):
+			values.extend(self.data[j::cols])
+		return Matrix._from_values(values, rows, cols)
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Kernel backend selection for Matrix and Vector.
+
+When NumPy is installed, Matrix and Vector (real or complex) delegate their heavy
+kernels (products, inverse, rank, row echelon form, determinants, norms, dot) to it;
+the public API and the planar array('d') storage stay the same, NumPy reads those
+planes in place through the buffer protocol. Without NumPy everything runs on the
+pure Python kernels.
+"""
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+BACKENDS = ("python", "numpy")
+
+_backend = "numpy" if numpy is not None else "python"
+
+
+def set_backend(name):
+	"""
+	Select the kernel backend used by Matrix and Vector.
+
+	Args:
+		name (str): "python" or "numpy".
+	Raises:
+		ValueError: If the name is unknown or NumPy is requested but not installed.
+	"""
+	global _backend
+	if name not in BACKENDS:
+		raise ValueError(f"Unknown backend: {name}. Expected one of {BACKENDS}")
+	if name == "numpy" and numpy is None:
+		raise ValueError("The numpy backend requires NumPy to be installed.")
+	_backend = name
+
+
+def get_backend():
+	"""
+	Get the name of the active kernel backend.
+
+	Returns:
+		str: "python" or "numpy".
+	"""
+	return _backend
+
+
+def active_numpy():
+	"""
+	Return the numpy module if the NumPy backend is active, None otherwise.
+	"""
+	return numpy if _backend == "numpy" else None
+
+
+def rref(a, tol):
+	"""
+	Reduced row echelon form of a 2-D ndarray (same algorithm as Matrix.row_echelon).
+
+	Each pivot step is a handful of whole-array operations: pick the largest-modulus
+	pivot, swap, normalize the pivot row, then eliminate the pivot column from every
+	other row with one outer product.
+
+	Args:
+		a (ndarray): The matrix; it is modified in place.
+		tol (float): Magnitude under which entries are treated as zero.
+	Returns:
+		ndarray: a, in reduced row echelon form.
+	"""
+	_gauss_jordan(a, tol)
+	return a
+
+
+def rank(a, tol):
+	"""
+	Rank of a 2-D ndarray as the number of Gauss-Jordan pivots above tol in modulus,
+	the same criterion as the pure Python kernels (unlike the SVD-based matrix_rank).
+
+	Args:
+		a (ndarray): The matrix; it is not modified.
+		tol (float): Magnitude under which entries are treated as zero.
+	Returns:
+		int: The number of pivots.
+	"""
+	return _gauss_jordan(a.copy(), tol)
+
+
+def _gauss_jordan(a, tol):
+	"""
+	Reduce a to RREF in place; returns the number of pivots.
+	"""
+	rows, cols = a.shape
+	pivot_row = 0
+	for col in range(cols):
+		if pivot_row == rows:
+			break
+		candidates = abs(a[pivot_row:, col])
+		pivot = int(candidates.argmax())
+		if candidates[pivot] <= tol:
+			continue # no pivot in this column
+		pivot += pivot_row
+		if pivot != pivot_row:
+			a[[pivot_row, pivot]] = a[[pivot, pivot_row]]
+		a[pivot_row] /= a[pivot_row, col]
+		factors = a[:, col].copy()
+		factors[pivot_row] = 0
+		a -= numpy.outer(factors, a[pivot_row])
+		pivot_row += 1
+	return pivot_row
@@ -12,7 +12,8 @@ P = projection(fov, ratio, near, far)
 # Write to "proj" file in row-major printing order
 with open("proj", "w") as f:
 	for row in range(4):
-		line = ", ".join(str(P.data[col][row]) for col in range(4))
+		# integral entries are written as ints (0, 1), as when the matrix held Python ints
+		line = ", ".join(str(int(x)) if x.is_integer() else str(x) for x in (P.data[col][row] for col in range(4)))
 		f.write(line + "\n")
 
 print("Projection matrix written to proj")
\ No newline at end of file